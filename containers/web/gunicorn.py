@@ -38,3 +38,19 @@ max_requests_jitter = os.getenv("GUNICORN_WORKER_MAX_REQUESTS_JITTER", default=5
 # Workers silent for more than this many seconds are killed and restarted.
 # https://docs.gunicorn.org/en/stable/settings.html#timeout
 timeout = os.getenv("GUNICORN_WORKER_TIMEOUT", default=30)
+
+
+#########
+# Hooks #
+#########
+
+
+def on_starting(server):
+    """
+    Starts the metrics from zero, the files left by the workers of a
+    previous run would be summed up with the new ones.
+    https://docs.gunicorn.org/en/stable/settings.html#on-starting
+    """
+    from commons.metrics import registry
+
+    registry.clear()
@@ -1,9 +1,10 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.template.loader import render_to_string
 from django.utils.safestring import mark_safe
 
 from apps.api.shortcuts import generate_user_token
 from apps.domain import models
+from commons.admin.decorators import admin_action
 from commons.admin.mixins import SmartAdminMixin
 from commons.admin.permissions.mixins import PermissionsAdminMixin
 from django.utils.translation import gettext_lazy as _
@@ -20,14 +21,14 @@ class DiscountAdmin(PermissionsAdminMixin, SmartAdminMixin, admin.ModelAdmin):
             None,
             {"fields": ["code", "description", "brand"]},
         ),
-        (_("Data"), {"fields": ["quantity", "balance_field"]}),
+        (_("Data"), {"fields": ["quantity", "balance_field", "hot"]}),
     )
 
     readonly_fields = ["balance_field"]
     autocomplete_fields = ["brand"]
 
     def get_queryset(self, request):
-        return super().get_queryset(request).with_used()
+        return super().get_queryset(request).with_balance()
 
     # Custom Field
 
@@ -36,8 +37,36 @@ class DiscountAdmin(PermissionsAdminMixin, SmartAdminMixin, admin.ModelAdmin):
         """
         Returns annotated ``balance`` field.
         """
-        balance = obj.quantity - obj.used
-        return balance
+        return obj.balance
+
+    # Actions
+
+    def set_flags(self, request, queryset, **flags):
+        """
+        Update the flags of the selected discounts at once.
+        """
+        updated = queryset.set_flags(**flags)
+        self.message_user(
+            request,
+            _("%(count)s discounts were updated.") % {"count": updated},
+            level=messages.SUCCESS,
+        )
+
+    @admin_action(short_description=_("Enable selected discounts"))
+    def enable_action(self, request, queryset):
+        self.set_flags(request, queryset, enable=True)
+
+    @admin_action(short_description=_("Disable selected discounts"))
+    def disable_action(self, request, queryset):
+        self.set_flags(request, queryset, enable=False)
+
+    @admin_action(short_description=_("Hide selected discounts"))
+    def hide_action(self, request, queryset):
+        self.set_flags(request, queryset, hide=True)
+
+    @admin_action(short_description=_("Show selected discounts"))
+    def show_action(self, request, queryset):
+        self.set_flags(request, queryset, hide=False)
 
     # Permissions
 
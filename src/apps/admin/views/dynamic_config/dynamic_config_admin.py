@@ -15,9 +15,8 @@ class DynamicConfigAdminView(FormView):
 
     def get_form_class(self):
         parameters = getattr(settings, "DYNAMIC_CONFIG", None) or []
-        parameters = map(
-            lambda x: dict(x, value=dynamic_config.get(x["key"])), parameters
-        )
+        values = dynamic_config.snapshot()
+        parameters = map(lambda x: dict(x, value=values[x["key"]]), parameters)
         form_class, self.fieldsets = build_dynamic_config_form_class(parameters)
         return form_class
 
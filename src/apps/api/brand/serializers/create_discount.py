@@ -1,5 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
 from apps.domain import models
+from commons.api.serializers import BulkCreateListSerializer
 
 
 class CreateDiscountSerializer(serializers.ModelSerializer):
@@ -7,3 +9,14 @@ class CreateDiscountSerializer(serializers.ModelSerializer):
         model = models.Discount
         fields = ["id", "code", "description", "quantity", "hide", "enable"]
         read_only_fields = ["id", "brand"]
+
+
+class BulkCreateDiscountSerializer(CreateDiscountSerializer):
+    class Meta(CreateDiscountSerializer.Meta):
+        list_serializer_class = BulkCreateListSerializer
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        kwargs.setdefault("allow_empty", False)
+        kwargs.setdefault("max_length", settings.DISCOUNT_BULK_CREATE_MAX_SIZE)
+        return super().many_init(*args, **kwargs)
@@ -8,9 +8,7 @@ class DiscountSerializer(PartialModelSerializer):
     balance = serializers.SerializerMethodField()
 
     def get_balance(self, obj):  # noqa
-        balance_qs = models.UserDiscount.objects.filter(discount_id=obj.id).count()
-        balance = obj.quantity - balance_qs
-        return balance
+        return obj.quantity - obj.used
 
     class Meta:
         model = models.Discount
@@ -1,5 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
 from apps.domain import models
+from commons.api.serializers import Serializer
 
 
 class BrandChangeDiscountSerializer(serializers.ModelSerializer):
@@ -7,3 +9,23 @@ class BrandChangeDiscountSerializer(serializers.ModelSerializer):
         model = models.Discount
         fields = ["id", "code", "description", "quantity", "hide", "enable"]
         read_only_fields = ["id", "brand"]
+
+
+class BulkUpdateDiscountSerializer(Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=settings.DISCOUNT_BULK_UPDATE_MAX_SIZE,
+    )
+    enable = serializers.BooleanField(required=False)
+    hide = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        validated_data = super().validate(attrs)
+
+        if not {"enable", "hide"} & set(validated_data):
+            raise serializers.ValidationError(
+                "Either 'enable' or 'hide' must be given."
+            )
+
+        return validated_data
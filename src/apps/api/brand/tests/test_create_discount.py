@@ -1,11 +1,14 @@
 import uuid
 
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
 from apps.api.tests import AuthenticatedBrandAPITestCase
 from apps.domain import models
+from apps.domain.enums import CacheNamespace
 from commons import json_schema
+from commons.api.cache import response_cache
 
 
 class DiscountSchema(json_schema.JsonSchema):
@@ -54,3 +57,87 @@ class BrandDiscountCreateApiTestCase(AuthenticatedBrandAPITestCase):
 
         response = self.client.get(reverse("api:brand-discount-create"))
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+
+class BrandDiscountBulkCreateApiTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.brand = self.mixer.blend(models.Brand)
+        self.authenticated(self.brand)
+
+    def discount_data(self, **kwargs):
+        return {
+            "code": self.faker.pystr(max_chars=20),
+            "description": self.faker.pystr(max_chars=20),
+            "quantity": 100,
+            "hide": False,
+            "enable": True,
+            **kwargs,
+        }
+
+    def bulk_create(self, data):
+        return self.client.post(
+            reverse("api:brand-discount-bulk"), data=data, format="json"
+        )
+
+    def test_should_bulk_create(self):
+        data = [self.discount_data() for _ in range(5)]
+
+        with self.assertNumQueries(3):
+            # savepoint, insert and release.
+            response = self.bulk_create(data)
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        items = response.json()
+
+        for item in items:
+            self.assertSchema(DiscountSchema, item)
+
+        self.assertEqual([x["code"] for x in data], [x["code"] for x in items])
+        self.assertEqual(
+            {uuid.UUID(x["id"]) for x in items},
+            set(
+                models.Discount.objects.filter(brand=self.brand).values_list(
+                    "pk", flat=True
+                )
+            ),
+        )
+
+    def test_should_not_create_any_if_invalid(self):
+        data = [
+            self.discount_data(),
+            self.discount_data(quantity=-1),
+            self.discount_data(),
+            self.discount_data(code=None),
+        ]
+
+        response = self.bulk_create(data)
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        errors = response.json()["errors"]
+
+        self.assertEqual([1, 3], [x["index"] for x in errors])
+        self.assertEqual(["quantity"], [x["field"] for x in errors[0]["errors"]])
+        self.assertEqual(["code"], [x["field"] for x in errors[1]["errors"]])
+        self.assertFalse(models.Discount.objects.exists())
+
+    def test_should_not_create_if_not_a_list(self):
+        for data in [self.discount_data(), []]:
+            response = self.bulk_create(data)
+            self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    @override_settings(DISCOUNT_BULK_CREATE_MAX_SIZE=2)
+    def test_should_not_create_more_than_max_size(self):
+        response = self.bulk_create([self.discount_data() for _ in range(3)])
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_should_invalidate_catalog(self):
+        namespace = CacheNamespace.DISCOUNT_CATALOG.value
+        version = response_cache.get_version(namespace)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bulk_create([self.discount_data()])
+
+        self.assertNotEqual(version, response_cache.get_version(namespace))
@@ -1,5 +1,7 @@
 import uuid
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -17,6 +19,17 @@ class DiscountSchema(json_schema.JsonSchema):
     enable = json_schema.BooleanProperty()
 
 
+class UserSchema(json_schema.JsonSchema):
+    first_name = json_schema.StringProperty()
+    email = json_schema.StringProperty()
+
+
+class DiscountHistorySchema(json_schema.JsonSchema):
+    id = json_schema.UUIDProperty()
+    discount = json_schema.ObjectProperty(schema=DiscountSchema)
+    user = json_schema.ObjectProperty(schema=UserSchema)
+
+
 class BrandDiscountHistoryApiTestCase(AuthenticatedBrandAPITestCase):
     def test_should_retrieve(self):
         brand = self.mixer.blend(models.Brand)
@@ -33,6 +46,65 @@ class BrandDiscountHistoryApiTestCase(AuthenticatedBrandAPITestCase):
 
         self.assertPaginatedSchema(DiscountSchema, data)
 
+    def test_should_not_query_by_history_row(self):
+        brand = self.mixer.blend(models.Brand)
+        self.authenticated(brand)
+
+        discount = self.mixer.blend(models.Discount, brand=brand)
+        self.mixer.cycle(20).blend(models.UserDiscount, discount=discount)
+
+        url = reverse("api:brand-discount-history", args=[discount.pk])
+
+        for page_size in [1, 5, 20]:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"page_size": page_size})
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqual(page_size, len(response.json()["results"]))
+
+            # authentication, page count and page rows.
+            self.assertLessEqual(len(queries), 3)
+
+    def test_should_paginate_by_cursor(self):
+        brand = self.mixer.blend(models.Brand)
+        self.authenticated(brand)
+
+        discount = self.mixer.blend(models.Discount, brand=brand)
+        history = self.mixer.cycle(5).blend(models.UserDiscount, discount=discount)
+
+        url = reverse("api:brand-discount-history", args=[discount.pk])
+        response = self.client.get(url, {"pagination": "cursor", "page_size": 2})
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        data = response.json()
+        self.assertCursorPaginatedSchema(DiscountHistorySchema, data)
+        self.assertIsNone(data["previous"])
+
+        pages = [data]
+
+        while pages[-1]["next"]:
+            pages.append(self.client.get(pages[-1]["next"]).json())
+
+        expected = [str(x.pk) for x in sorted(history, key=lambda x: x.created_at)]
+        self.assertEqual(
+            expected, [item["id"] for page in pages for item in page["results"]]
+        )
+
+        previous = self.client.get(pages[-1]["previous"]).json()
+        self.assertEqual(pages[-2]["results"], previous["results"])
+
+    def test_should_not_paginate_by_tampered_cursor(self):
+        brand = self.mixer.blend(models.Brand)
+        self.authenticated(brand)
+
+        discount = self.mixer.blend(models.Discount, brand=brand)
+
+        response = self.client.get(
+            reverse("api:brand-discount-history", args=[discount.pk]),
+            {"cursor": "eyJwIjpbXSwiciI6ZmFsc2V9:invalid"},
+        )
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
     def test_should_not_list_for_user(self):
         user = self.mixer.blend(models.User)
 
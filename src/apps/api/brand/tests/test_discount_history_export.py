@@ -0,0 +1,176 @@
+import csv
+import io
+import json
+import uuid
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from apps.api.tests import AuthenticatedBrandAPITestCase
+from apps.domain import models
+
+
+class BrandDiscountHistoryExportApiTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.brand = self.mixer.blend(models.Brand)
+        self.authenticated(self.brand)
+
+        self.discount = self.mixer.blend(models.Discount, brand=self.brand)
+        self.claims = [
+            self.mixer.blend(models.UserDiscount, discount=self.discount)
+            for _ in range(5)
+        ]
+
+    def export(self, discount=None, **params):
+        return self.client.get(
+            reverse(
+                "api:brand-discount-history-export",
+                args=[(discount or self.discount).pk],
+            ),
+            params,
+        )
+
+    def read(self, response):
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_should_stream_ndjson(self):
+        response = self.export()
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/x-ndjson", response["Content-Type"])
+        self.assertTrue(response.streaming)
+
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+
+        self.assertEqual(
+            [str(claim.pk) for claim in self.claims], [x["id"] for x in rows]
+        )
+        self.assertEqual(
+            {
+                "id": str(self.claims[0].pk),
+                "claimed_at": rows[0]["claimed_at"],
+                "code": self.discount.code,
+                "user_id": str(self.claims[0].user.pk),
+                "first_name": self.claims[0].user.first_name,
+                "email": self.claims[0].user.email,
+            },
+            rows[0],
+        )
+
+    def test_should_stream_csv(self):
+        response = self.export(output="csv")
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("text/csv", response["Content-Type"])
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+
+        self.assertEqual(
+            [str(claim.pk) for claim in self.claims], [x["id"] for x in rows]
+        )
+        self.assertEqual({self.discount.code}, {x["code"] for x in rows})
+
+    def test_should_stream_empty_history(self):
+        discount = self.mixer.blend(models.Discount, brand=self.brand)
+
+        self.assertEqual("", self.read(self.export(discount)))
+        self.assertEqual(
+            "id,claimed_at,code,user_id,first_name,email\r\n",
+            self.read(self.export(discount, output="csv")),
+        )
+
+    def test_should_not_export_unknown_format(self):
+        response = self.export(output="xml")
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_should_not_export_other_brand_discount(self):
+        discount = self.mixer.blend(models.Discount)
+
+        response = self.export(discount)
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_should_sanitize_filename(self):
+        discount = self.mixer.blend(
+            models.Discount, brand=self.brand, code='../"black friday"'
+        )
+
+        response = self.export(discount)
+        self.assertEqual(
+            'attachment; filename="black_friday-history.ndjson"',
+            response["Content-Disposition"],
+        )
+
+    @override_settings(HISTORY_EXPORT_ASYNC_THRESHOLD=3)
+    def test_should_export_large_history_to_storage(self):
+        models.Discount.objects.filter(pk=self.discount.pk).reconcile_used()
+
+        response = self.export(output="csv")
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+
+        data = response.json()
+        path = (
+            f"exports/discount_history/{self.discount.pk}/{uuid.UUID(data['id']).hex}"
+        )
+        self.addCleanup(default_storage.delete, f"{path}/.ready")
+        self.addCleanup(
+            default_storage.delete, f"{path}/{self.discount.code}-history.csv"
+        )
+
+        # served by the api with the brand authentication, not the storage.
+        response = self.client.get(data["url"])
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("text/csv", response["Content-Type"])
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+
+        self.assertEqual(
+            [str(claim.pk) for claim in self.claims], [x["id"] for x in rows]
+        )
+
+        self.authenticated(self.mixer.blend(models.Brand))
+
+        response = self.client.get(data["url"])
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_should_not_download_pending_export(self):
+        export_id = uuid.uuid4()
+        response = self.client.get(
+            reverse(
+                "api:brand-discount-history-export-download",
+                args=[self.discount.pk, export_id],
+            )
+        )
+
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+        self.assertEqual({"id": str(export_id), "status": "pending"}, response.json())
+
+    def test_should_not_download_incomplete_export(self):
+        export_id = uuid.uuid4()
+        path = f"exports/discount_history/{self.discount.pk}/{export_id.hex}"
+        url = reverse(
+            "api:brand-discount-history-export-download",
+            args=[self.discount.pk, export_id],
+        )
+
+        # being written by the worker.
+        name = default_storage.save(f"{path}/history.csv", ContentFile(b"id\n"))
+        self.addCleanup(default_storage.delete, name)
+
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+
+        ready = default_storage.save(f"{path}/.ready", ContentFile(name.encode()))
+        self.addCleanup(default_storage.delete, ready)
+
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+
+        default_storage.delete(ready)
+        default_storage.save(ready, ContentFile(f"{name}\n".encode()))
+
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("id\n", self.read(response))
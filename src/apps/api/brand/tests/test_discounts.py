@@ -45,3 +45,21 @@ class BrandDiscountListApiTestCase(AuthenticatedBrandAPITestCase):
 
         response = self.client.get(reverse("api:brand-discount-list"))
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    def test_should_sort_by_balance(self):
+        brand = self.mixer.blend(models.Brand)
+        self.authenticated(brand)
+
+        discounts = self.mixer.cycle(3).blend(models.Discount, brand=brand, quantity=5)
+
+        for index, discount in enumerate(discounts):
+            self.mixer.cycle(index + 1).blend(models.UserDiscount, discount=discount)
+
+        response = self.client.get(
+            reverse("api:brand-discount-list"), {"sort": "balance"}
+        )
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        data = response.json()
+
+        self.assertEqual([2, 3, 4], [item["balance"] for item in data["results"]])
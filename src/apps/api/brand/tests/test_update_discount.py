@@ -1,11 +1,17 @@
 import uuid
+from unittest import mock
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 from apps.api.tests import AuthenticatedBrandAPITestCase
+from apps.crosscutting.claim_pool import claim_pool
 from apps.domain import models
+from apps.domain.enums import CacheNamespace
 from commons import json_schema
+from commons.api.cache import response_cache
 
 
 class DiscountSchema(json_schema.JsonSchema):
@@ -73,3 +79,74 @@ class BrandDiscountUpdateApiTestCase(AuthenticatedBrandAPITestCase):
         )
 
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+
+class BrandDiscountBulkUpdateApiTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.brand = self.mixer.blend(models.Brand)
+        self.authenticated(self.brand)
+
+    def bulk_update(self, data):
+        return self.client.patch(
+            reverse("api:brand-discount-bulk"), data=data, format="json"
+        )
+
+    def test_should_bulk_update(self):
+        discounts = self.mixer.cycle(3).blend(
+            models.Discount, brand=self.brand, enable=True, hide=False
+        )
+        other_discount = self.mixer.blend(models.Discount, enable=True)
+        updated_at = {x.pk: x.updated_at for x in discounts}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.bulk_update(
+                {
+                    "ids": [str(x.pk) for x in [*discounts[:2], other_discount]],
+                    "enable": False,
+                }
+            )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual({"updated": 2}, response.json())
+        self.assertEqual(1, len([x for x in queries if x["sql"].startswith("UPDATE")]))
+
+        for discount in discounts[:2]:
+            discount.refresh_from_db()
+            self.assertFalse(discount.enable)
+            self.assertFalse(discount.hide)
+            self.assertGreater(discount.updated_at, updated_at[discount.pk])
+
+        discounts[2].refresh_from_db()
+        self.assertTrue(discounts[2].enable)
+
+        other_discount.refresh_from_db()
+        self.assertTrue(other_discount.enable)
+
+    def test_should_not_update_without_flags(self):
+        discount = self.mixer.blend(models.Discount, brand=self.brand)
+
+        for data in [{"ids": [str(discount.pk)]}, {"ids": [], "hide": True}]:
+            response = self.bulk_update(data)
+            self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_should_invalidate_catalog_once(self):
+        discounts = self.mixer.cycle(3).blend(models.Discount, brand=self.brand)
+
+        with mock.patch.object(response_cache, "bump") as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.bulk_update({"ids": [str(x.pk) for x in discounts], "hide": True})
+
+        bump.assert_called_once_with(CacheNamespace.DISCOUNT_CATALOG.value)
+
+    def test_should_unload_disabled_hot_discount(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            discount = self.mixer.blend(
+                models.Discount, brand=self.brand, hot=True, quantity=10
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bulk_update({"ids": [str(discount.pk)], "enable": False})
+
+        self.assertIsNone(claim_pool.claim(discount.pk, uuid.uuid4()))
@@ -1,7 +1,11 @@
 from django.urls import include, path
 
+from apps.api.brand.viewsets.bulk_discounts import BrandDiscountBulkViewSet
 from apps.api.brand.viewsets.create_discount import CreateDiscountViewSet
 from apps.api.brand.viewsets.discount_history import BrandDiscountHistoryViewSet
+from apps.api.brand.viewsets.discount_history_export import (
+    BrandDiscountHistoryExportViewSet,
+)
 from apps.api.brand.viewsets.discounts import BrandDiscountViewSet
 from apps.api.brand.viewsets.profile import BrandProfileViewSet
 from apps.api.brand.viewsets.update_discount import BrandDiscountUpdateViewSet
@@ -27,10 +31,27 @@ urlpatterns = [
         BrandDiscountHistoryViewSet.as_view(actions={"get": "list"}),
         name="brand-discount-history",
     ),
+    path(
+        "discount/<uuid:pk>/history/export",
+        BrandDiscountHistoryExportViewSet.as_view(actions={"get": "export"}),
+        name="brand-discount-history-export",
+    ),
+    path(
+        "discount/<uuid:pk>/history/export/<uuid:export_id>",
+        BrandDiscountHistoryExportViewSet.as_view(actions={"get": "download"}),
+        name="brand-discount-history-export-download",
+    ),
     path(
         "discount/",
         CreateDiscountViewSet.as_view(actions={"post": "create"}),
         name="brand-discount-create",
     ),
+    path(
+        "discount/bulk",
+        BrandDiscountBulkViewSet.as_view(
+            actions={"post": "create", "patch": "partial_update"}
+        ),
+        name="brand-discount-bulk",
+    ),
     path("", include(router.urls)),
 ]
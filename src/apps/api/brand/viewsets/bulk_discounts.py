@@ -0,0 +1,66 @@
+from rest_framework import exceptions, status
+from rest_framework.response import Response
+
+from apps.api import permissions
+from apps.api.brand.serializers.create_discount import BulkCreateDiscountSerializer
+from apps.api.brand.serializers.update_discount import BulkUpdateDiscountSerializer
+from apps.domain import models
+from commons.api import viewsets
+
+
+class BrandDiscountBulkViewSet(viewsets.GenericViewSet):
+    queryset = models.Discount.objects.all()
+    permission_classes = [permissions.IsBrand]
+
+    def get_queryset(self):
+        return super().get_queryset().filter(brand_id=self.request.user.pk)
+
+    def create(self, request, *args, **kwargs):
+        """
+        Create a list of discounts at once. Nothing is created if any
+        of them is invalid, the errors are returned by item position.
+        """
+        serializer = BulkCreateDiscountSerializer(
+            data=request.data, many=True, context=self.get_serializer_context()
+        )
+
+        if not serializer.is_valid():
+            if not isinstance(serializer.errors, list):
+                # e.g. not a list, empty or too long.
+                raise exceptions.ValidationError(serializer.errors)
+
+            errors = [
+                {
+                    "index": index,
+                    "errors": [
+                        {"field": field, "errors": field_errors}
+                        for field, field_errors in item_errors.items()
+                    ],
+                }
+                for index, item_errors in enumerate(serializer.errors)
+                if item_errors
+            ]
+            return Response(
+                {"detail": exceptions.ValidationError.default_detail, "errors": errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer.save(brand_id=self.request.user.pk)
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def partial_update(self, request, *args, **kwargs):
+        """
+        Set the ``enable`` and ``hide`` flags of the given discounts
+        with a single update. Discounts of other brands are ignored.
+        """
+        serializer = BulkUpdateDiscountSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+
+        flags = dict(serializer.validated_data)
+        ids = flags.pop("ids")
+
+        updated = self.get_queryset().filter(pk__in=ids).set_flags(**flags)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
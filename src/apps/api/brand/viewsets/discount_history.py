@@ -3,14 +3,19 @@ from apps.api import permissions
 from apps.api.brand.serializers.discount_history import DiscountsHistorySerializer
 from apps.domain import models
 from commons.api import viewsets
+from commons.api.mixins import PartialViewSetMixin
 from commons.djutils.api.mixins import FilterQuerysetMixin
+from commons.djutils.api.pagination import CursorPagination
 from commons.models.filters import Filter
 
 
-class BrandDiscountHistoryViewSet(FilterQuerysetMixin, viewsets.ListModelViewSet):
+class BrandDiscountHistoryViewSet(
+    FilterQuerysetMixin, PartialViewSetMixin, viewsets.ListModelViewSet
+):
     queryset = models.UserDiscount.objects.all()
     serializer_class = DiscountsHistorySerializer
     permission_classes = [permissions.IsBrand]
+    cursor_pagination_class = CursorPagination
 
     filters = [Filter("ids", lookup="pk", cast=uuid.UUID, many=True)]
 
@@ -0,0 +1,153 @@
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.text import get_valid_filename
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.api import permissions
+from apps.domain import models
+from apps.domain.models.user_discount.managers import HISTORY_COLUMNS
+from apps.worker import tasks
+from commons.api import viewsets
+from commons.api.export import (
+    EXPORT_FORMATS,
+    EXPORT_READY_FILENAME,
+    content_disposition,
+)
+from commons.utils.collections import DataDict
+
+
+class BrandDiscountHistoryExportViewSet(viewsets.GenericViewSet):
+    """
+    Exports the whole claim history of a discount as NDJSON or CSV,
+    given by ``?output=``. The rows are streamed from a server-side
+    cursor, histories larger than ``HISTORY_EXPORT_ASYNC_THRESHOLD``
+    (or ``?async=true``) are exported by a worker to the storage and
+    downloaded from the ``download`` action once ready.
+    """
+
+    queryset = models.Discount.objects.all()
+    permission_classes = [permissions.IsBrand]
+
+    output_query_param = "output"
+    async_query_param = "async"
+
+    upload_path = "exports/discount_history"
+
+    def get_queryset(self):
+        return super().get_queryset().filter(brand_id=self.request.user.pk)
+
+    def get_export_format(self):
+        export_format = self.request.query_params.get(self.output_query_param, "ndjson")
+
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {self.output_query_param: [f"Must be one of {list(EXPORT_FORMATS)}."]}
+            )
+
+        return export_format
+
+    def is_async(self, discount):
+        requested = DataDict(self.request.query_params).get(
+            self.async_query_param, default=False, cast=bool
+        )
+        return requested or discount.used > settings.HISTORY_EXPORT_ASYNC_THRESHOLD
+
+    def export(self, request, *args, **kwargs):
+        export_format = self.get_export_format()
+        content_type, extension, encode = EXPORT_FORMATS[export_format]
+
+        discount = get_object_or_404(
+            self.get_queryset().only("pk", "code", "used"), pk=self.kwargs.get("pk")
+        )
+        # the code is free text, e.g. quotes, slashes and leading dots are dropped.
+        filename = get_valid_filename(f"{discount.code}-history.{extension}")
+        filename = filename.lstrip(".")
+
+        if self.is_async(discount):
+            export_id = uuid.uuid4()
+            path = f"{self.get_export_path(discount, export_id)}/{filename}"
+            tasks.export_discount_history.delay(str(discount.pk), export_format, path)
+
+            # the file is downloaded from the link once the worker is done.
+            url = reverse(
+                "api:brand-discount-history-export-download",
+                args=[discount.pk, export_id],
+            )
+            return Response(
+                {"id": str(export_id), "url": request.build_absolute_uri(url)},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        rows = (
+            models.UserDiscount.objects.filter(discount_id=discount.pk)
+            .history()
+            .iterator(chunk_size=settings.HISTORY_EXPORT_CHUNK_SIZE)
+        )
+
+        response = StreamingHttpResponse(
+            encode(rows, HISTORY_COLUMNS), content_type=content_type
+        )
+        response["Content-Disposition"] = content_disposition(filename)
+        return response
+
+    def download(self, request, *args, **kwargs):
+        """
+        Download an export made by the worker, through the brand
+        authentication, as the history holds the names and emails
+        of the users.
+        """
+        discount = get_object_or_404(
+            self.get_queryset().only("pk"), pk=self.kwargs.get("pk")
+        )
+        export_id = self.kwargs.get("export_id")
+        path = self.get_export_path(discount, export_id)
+        name = self.get_export_name(path)
+
+        if name is None:
+            return Response(
+                {"id": str(export_id), "status": "pending"},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        filename = name.rpartition("/")[2]
+        content_types = {extension: x for x, extension, _ in EXPORT_FORMATS.values()}
+
+        response = FileResponse(
+            default_storage.open(name),
+            content_type=content_types.get(filename.rpartition(".")[2]),
+        )
+        response["Content-Disposition"] = content_disposition(filename)
+        return response
+
+    def get_export_name(self, path):
+        """
+        Returns the storage name of a complete export of the directory,
+        or ``None`` while the worker is still writing it.
+        """
+        ready = f"{path}/{EXPORT_READY_FILENAME}"
+
+        if not default_storage.exists(ready):
+            return None
+
+        with default_storage.open(ready) as file:
+            name = file.read().decode("utf-8")
+
+        # the marker itself may be read while it is written, it ends with
+        # a line break once complete.
+        if not (name.startswith(f"{path}/") and name.endswith("\n")):
+            return None
+
+        return name[:-1]
+
+    def get_export_path(self, discount, export_id):
+        """
+        Returns the storage directory of an export made by the worker.
+        """
+        return f"{self.upload_path}/{discount.pk}/{export_id.hex}"
@@ -11,12 +11,16 @@ class BrandProfileViewSet(
 ):
     queryset = models.Brand.objects.all()
     serializer_class = BrandProfileSerializer
+    conditional_get = True
     permission_classes = [permissions.IsBrand]
 
     def get_queryset(self):
         queryset = super().get_queryset()
         return queryset
 
+    def get_conditional_queryset(self):
+        return self.get_queryset().filter(pk=self.request.user.pk)
+
     def get_object(self):
         """
         Returns the current logged student to be serialized.
@@ -1,9 +1,17 @@
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.test import APIRequestFactory
 
+from apps.api.brands.viewsets.brands import BrandsListViewSet
 from apps.api.tests import AuthenticatedUserAPITestCase
 from apps.domain import models
 from commons import json_schema
+from commons.api.serializers import compile_serializer
+from commons.models import filters
 
 
 class BrandSchema(json_schema.JsonSchema):
@@ -32,3 +40,108 @@ class BrandsListApiTestCase(AuthenticatedUserAPITestCase):
 
         response = self.client.get(reverse("api:brands-list"))
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    def test_should_filter_by_ids_with_a_single_lookup(self):
+        brands = self.mixer.cycle(5).blend(models.Brand)
+        ids = [str(x.pk) for x in brands[:3]]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("api:brands-list"), {"ids": ",".join(ids)}
+            )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(
+            sorted(ids), sorted(x["id"] for x in response.json()["results"])
+        )
+
+        for query in queries:
+            self.assertNotIn("DISTINCT", query["sql"])
+            self.assertNotIn(" OR ", query["sql"])
+
+    def test_should_distinct_filters_over_to_many_relations(self):
+        brand = self.mixer.blend(models.Brand)
+        self.mixer.blend(models.Discount, brand=brand, code="A")
+        self.mixer.blend(models.Discount, brand=brand, code="B")
+
+        request = APIRequestFactory().get(
+            "/", {"codes": "A,B", "websites": f"{brand.website},https://other.com"}
+        )
+        codes = filters.Filter("codes", lookup="brand_discount__code", many=True)
+        websites = filters.Filter("websites", lookup="website", many=True)
+
+        queryset = codes.filter(request, models.Brand.objects.all())
+        self.assertTrue(queryset.query.distinct)
+        self.assertEqual([brand], list(queryset))
+
+        queryset = websites.filter(request, models.Brand.objects.all())
+        self.assertFalse(queryset.query.distinct)
+        self.assertEqual([brand], list(queryset))
+
+    def test_should_render_compiled_list_as_serializer(self):
+        self.mixer.cycle(15).blend(models.Brand)
+
+        url = reverse("api:brands-list")
+        params = [{}, {"fields": "name"}, {"page_size": -1}]
+
+        self.assertIsNotNone(compile_serializer(BrandsListViewSet.serializer_class))
+
+        for data in params:
+            compiled = self.client.get(url, data)
+
+            with mock.patch.object(BrandsListViewSet, "compile_list_serializer", False):
+                response = self.client.get(url, data)
+
+            self.assertEqual(status.HTTP_200_OK, compiled.status_code)
+            self.assertEqual(response.content, compiled.content)
+
+
+class BrandsSearchApiTestCase(AuthenticatedUserAPITestCase):
+    def search(self, query):
+        response = self.client.get(reverse("api:brands-list"), {"query": query})
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        return [x["name"] for x in response.json()["results"]]
+
+    def test_should_search_by_word_prefixes(self):
+        self.mixer.blend(models.Brand, name="Blue Shoes")
+        self.mixer.blend(models.Brand, name="Red Shoes")
+        self.mixer.blend(models.Brand, name="Blue Hats")
+
+        self.assertEqual(["Blue Shoes"], self.search("blue sho"))
+        self.assertEqual(["Blue Hats", "Blue Shoes"], sorted(self.search("BLU")))
+        self.assertEqual([], self.search("green"))
+
+    @skipUnless(connection.vendor == "postgresql", "Ranked by full-text search.")
+    def test_should_rank_results(self):
+        self.mixer.blend(
+            models.Brand, name="Shoes and more shoes", website="https://b.com"
+        )
+        self.mixer.blend(models.Brand, name="Hats and shoes", website="https://a.com")
+
+        self.assertEqual(
+            ["Shoes and more shoes", "Hats and shoes"], self.search("shoes")
+        )
+
+    def test_should_search_renamed_brand(self):
+        brand = self.mixer.blend(models.Brand, name="Old Name")
+
+        brand.name = "New Name"
+        brand.save()
+
+        self.assertEqual(["New Name"], self.search("new"))
+        self.assertEqual([], self.search("old"))
+
+    def test_should_ignore_punctuation_only_search(self):
+        self.mixer.blend(models.Brand, name="Blue Shoes")
+
+        self.assertEqual([], self.search("&!"))
+
+    def test_should_fall_back_to_contains_on_other_databases(self):
+        self.mixer.blend(models.Brand, name="Blue Shoes")
+
+        with mock.patch.object(connection, "vendor", "sqlite"):
+            # matches in the middle of words, as ``icontains`` does.
+            self.assertEqual(["Blue Shoes"], self.search("hoe"))
+
+        if connection.vendor == "postgresql":
+            self.assertEqual([], self.search("hoe"))
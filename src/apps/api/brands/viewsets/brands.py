@@ -4,7 +4,7 @@ from apps.api.brands.serializers.brands import BrandsSerializer
 from apps.domain import models
 from commons.api import viewsets
 from commons.djutils.api.mixins import FilterQuerysetMixin
-from commons.djutils.models.filters import Search
+from commons.djutils.models.filters import FullTextSearch, Search
 from commons.models import filters
 
 
@@ -12,11 +12,15 @@ class BrandsListViewSet(FilterQuerysetMixin, viewsets.ListModelViewSet):
     queryset = models.Brand.objects.all()
     serializer_class = BrandsSerializer
     permission_classes = [permissions.IsUser]
+    compile_list_serializer = True
 
     filters = [
         filters.Filter("ids", lookup="pk", cast=uuid.UUID, many=True),
         filters.Filter("website", lookup="website", cast=str, many=True),
-        Search(lookups=["name__icontains"]),
+        Search(
+            lookups=["name__icontains"],
+            backend=FullTextSearch("search_vector", rank=True),
+        ),
     ]
 
     def get_queryset(self):
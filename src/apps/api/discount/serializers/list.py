@@ -1,5 +1,3 @@
-from rest_framework import serializers
-
 from apps.domain import models
 from commons.api.serializers import PartialModelSerializer
 
@@ -10,7 +8,7 @@ class BrandSerializer(PartialModelSerializer):
         fields = ["id", "website", "name", "email"]
 
 
-class DiscountSerializer(serializers.ModelSerializer):
+class DiscountSerializer(PartialModelSerializer):
     brand = BrandSerializer(many=False)
 
     class Meta:
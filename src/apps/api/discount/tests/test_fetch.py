@@ -1,10 +1,17 @@
 import uuid
+from unittest import mock
 
+from django.core import mail
 from django.urls import reverse
 from rest_framework import status
 
 from apps.api.tests import AuthenticatedBrandAPITestCase
+from apps.crosscutting.claim_pool import claim_pool
+from apps.crosscutting.claim_pool.backends.redis import RedisClaimPoolBackend
+from apps.crosscutting.notification_queue import notification_queue
 from apps.domain import models
+from apps.domain.enums import OutboxTopic
+from apps.worker import tasks
 from commons import json_schema
 
 
@@ -66,3 +73,337 @@ class UserDiscountFetchApiTestCase(AuthenticatedBrandAPITestCase):
 
         response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
         self.assertEqual(status.HTTP_406_NOT_ACCEPTABLE, response.status_code)
+
+    def test_should_not_fetch_if_discount_does_not_exist(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        response = self.client.get(reverse("api:discount-fetch", args=[uuid.uuid4()]))
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_should_claim_only_available_quantity(self):
+        discount = self.mixer.blend(models.Discount, quantity=2)
+
+        for user in self.mixer.cycle(3).blend(models.User):
+            self.authenticated(user)
+            self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+
+        self.assertEqual(
+            2, models.UserDiscount.objects.filter(discount=discount).count()
+        )
+
+    def test_should_not_oversell_after_saving_stale_discount(self):
+        discount = self.mixer.blend(models.Discount, quantity=2)
+        stale = models.Discount.objects.get(pk=discount.pk)
+        first, second, third = self.mixer.cycle(3).blend(models.User)
+
+        self.authenticated(first)
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        stale.description = "Changed"
+        stale.save()
+
+        discount.refresh_from_db()
+        self.assertEqual(1, discount.used)
+        self.assertEqual("Changed", discount.description)
+
+        self.authenticated(second)
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        self.authenticated(third)
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_406_NOT_ACCEPTABLE, response.status_code)
+
+        self.assertEqual(
+            2, models.UserDiscount.objects.filter(discount=discount).count()
+        )
+
+
+class HotDiscountFetchApiTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        # discard claims left by other tests.
+        claim_pool.dequeue(size=1000)
+
+    def blend_hot_discount(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.mixer.blend(models.Discount, hot=True, **kwargs)
+
+    def test_should_claim_from_pool(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        discount = self.blend_hot_discount(quantity=1)
+
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertSchema(DiscountsSchema, response.json())
+
+        self.assertFalse(models.UserDiscount.objects.filter(user=user).exists())
+
+        tasks.persist_claim_pool()
+
+        discount.refresh_from_db()
+        self.assertEqual(1, discount.used)
+        self.assertTrue(models.UserDiscount.objects.filter(user=user).exists())
+
+    def test_should_not_claim_from_pool_if_sold_out_or_taken(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        discount = self.blend_hot_discount(quantity=1)
+
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        self.authenticated(self.mixer.blend(models.User))
+
+        response = self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.assertEqual(status.HTTP_406_NOT_ACCEPTABLE, response.status_code)
+
+    def test_should_reconcile_lost_claims(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        discount = self.blend_hot_discount(quantity=2)
+
+        self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+
+        # simulate a worker crash after dequeuing the claim.
+        claim_pool.dequeue(size=1000)
+
+        self.assertEqual(1, tasks.reconcile_claim_pool())
+        tasks.persist_claim_pool()
+
+        self.assertTrue(models.UserDiscount.objects.filter(user=user).exists())
+
+    def test_should_not_use_pool_for_not_hot_discount(self):
+        self.authenticated(self.mixer.blend(models.User))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            discount = self.mixer.blend(models.Discount, quantity=1)
+
+        with mock.patch.object(claim_pool, "claim") as claim, mock.patch.object(
+            claim_pool, "unload"
+        ) as unload:
+            response = self.client.get(
+                reverse("api:discount-fetch", args=[discount.pk])
+            )
+
+            with self.captureOnCommitCallbacks(execute=True):
+                discount.description = "Not hot"
+                discount.save()
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        claim.assert_not_called()
+        unload.assert_not_called()
+
+    def test_should_not_claim_from_database_if_pool_is_unavailable(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        # a claim accepted by the pool, not persisted yet.
+        discount = self.blend_hot_discount(quantity=1)
+        claim_pool.claim(discount.pk, self.mixer.blend(models.User).pk)
+        pool = RedisClaimPoolBackend(url="redis://localhost:1/0")
+
+        with mock.patch(
+            "apps.api.discount.viewsets.fetch.claim_pool", pool
+        ), self.assertLogs("apps.crosscutting.claim_pool", "WARNING"):
+            response = self.client.get(
+                reverse("api:discount-fetch", args=[discount.pk])
+            )
+
+        self.assertEqual(status.HTTP_503_SERVICE_UNAVAILABLE, response.status_code)
+        self.assertFalse(models.UserDiscount.objects.filter(user=user).exists())
+
+    def test_should_change_discount_if_pool_is_unavailable(self):
+        discount = self.blend_hot_discount(quantity=1)
+        pool = RedisClaimPoolBackend(url="redis://localhost:1/0")
+
+        with mock.patch(
+            "apps.crosscutting.claim_pool.claim_pool", pool
+        ), self.assertLogs("apps.crosscutting.claim_pool", "WARNING") as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                discount.quantity = 2
+                discount.save()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                models.Discount.objects.filter(pk=discount.pk).set_flags(enable=False)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                discount.delete()
+
+        self.assertEqual(3, len(logs.records))
+        self.assertFalse(models.Discount.objects.filter(pk=discount.pk).exists())
+
+
+class NotificationDigestTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        # discard events left by other tests.
+        notification_queue.pop(size=1000)
+
+    def fetch(self, discount):
+        self.authenticated(self.mixer.blend(models.User))
+        return self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+
+    def test_should_send_one_digest_per_brand(self):
+        brand, other_brand = self.mixer.cycle(2).blend(models.Brand)
+        discount = self.mixer.blend(models.Discount, brand=brand, quantity=10)
+        other_discount = self.mixer.blend(models.Discount, brand=brand, quantity=10)
+
+        for _ in range(3):
+            self.fetch(discount)
+
+        self.fetch(other_discount)
+        self.fetch(self.mixer.blend(models.Discount, brand=other_brand))
+
+        self.assertEqual(5, tasks.relay_outbox())
+        self.assertEqual(2, tasks.send_notification_digests())
+        self.assertEqual(
+            sorted([[brand.email], [other_brand.email]]),
+            sorted(message.to for message in mail.outbox),
+        )
+
+        # the queue was drained.
+        self.assertEqual(0, tasks.send_notification_digests())
+
+    def test_should_send_one_digest_per_brand_across_batches(self):
+        brand, other_brand = self.mixer.cycle(2).blend(models.Brand)
+        discount = self.mixer.blend(models.Discount, brand=brand, quantity=10)
+
+        for _ in range(5):
+            self.fetch(discount)
+
+        self.fetch(self.mixer.blend(models.Discount, brand=other_brand))
+        tasks.relay_outbox()
+
+        # batches of 2, 2 and 1 events, but at most 4 events per run.
+        self.assertEqual(1, tasks.send_notification_digests(batch_size=2, max_events=4))
+        self.assertEqual(2, tasks.send_notification_digests(batch_size=2, max_events=4))
+        self.assertEqual(3, len(mail.outbox))
+
+        for _ in range(5):
+            self.fetch(discount)
+
+        tasks.relay_outbox()
+        self.assertEqual(1, tasks.send_notification_digests(batch_size=2))
+
+        self.assertEqual(4, len(mail.outbox))
+
+    def test_should_requeue_events_if_sending_fails(self):
+        discount = self.mixer.blend(models.Discount, quantity=10)
+
+        for _ in range(3):
+            self.fetch(discount)
+
+        tasks.relay_outbox()
+
+        with self.settings(NOTIFICATION_DIGEST_MAX_USERS=1), mock.patch(
+            "apps.domain.models.brand.emails.send_mail", side_effect=OSError
+        ):
+            with self.assertRaises(OSError):
+                tasks.send_notification_digests()
+
+            with mock.patch(
+                "apps.domain.models.brand.emails.send_claims_digest_email"
+            ) as send:
+                self.assertEqual(1, tasks.send_notification_digests())
+
+        (_, [digest]), _ = send.call_args
+        self.assertEqual(3, digest["total"])
+        self.assertEqual(1, len(digest["users"]))
+        self.assertEqual(2, digest["others"])
+
+
+class OutboxTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        # discard claims and events left by other tests.
+        claim_pool.dequeue(size=1000)
+        notification_queue.pop(size=1000)
+
+    def fetch(self, discount, user=None):
+        self.authenticated(user or self.mixer.blend(models.User))
+        return self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+
+    def test_should_write_event_with_claim(self):
+        user = self.mixer.blend(models.User)
+        discount = self.mixer.blend(models.Discount, quantity=1)
+
+        self.fetch(discount, user=user)
+
+        event = models.OutboxEvent.objects.get()
+        self.assertEqual(OutboxTopic.DISCOUNT_CLAIMED.value, event.topic)
+        self.assertEqual(
+            {
+                "brand": str(discount.brand_id),
+                "discount": discount.code,
+                "user": str(user.pk),
+            },
+            event.payload,
+        )
+
+    def test_should_not_write_event_if_not_claimed(self):
+        user = self.mixer.blend(models.User)
+        discount = self.mixer.blend(models.Discount, quantity=1)
+
+        self.fetch(discount, user=user)
+        self.fetch(discount, user=user)
+        self.fetch(discount)
+        self.fetch(self.mixer.blend(models.Discount, enable=False))
+
+        self.assertEqual(1, models.OutboxEvent.objects.count())
+
+    def test_should_not_publish_on_request(self):
+        discount = self.mixer.blend(models.Discount)
+
+        self.fetch(discount)
+
+        self.assertEqual([], notification_queue.pop(size=1000))
+
+    def test_should_write_event_when_pool_is_persisted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            discount = self.mixer.blend(models.Discount, hot=True, quantity=2)
+
+        user = self.mixer.blend(models.User)
+        self.fetch(discount, user=user)
+
+        self.assertFalse(models.OutboxEvent.objects.exists())
+
+        tasks.persist_claim_pool()
+
+        # re-queued claims that were already persisted are not notified again.
+        claim_pool.enqueue([(str(discount.pk), str(user.pk))])
+        tasks.persist_claim_pool()
+
+        self.assertEqual(1, models.OutboxEvent.objects.count())
+
+    def test_should_relay_events_in_batches(self):
+        discount = self.mixer.blend(models.Discount, quantity=10)
+
+        for _ in range(3):
+            self.fetch(discount)
+
+        self.assertEqual(3, tasks.relay_outbox(batch_size=2))
+        self.assertFalse(models.OutboxEvent.objects.exists())
+        self.assertEqual(3, len(notification_queue.pop(size=1000)))
+
+    def test_should_keep_events_if_publishing_fails(self):
+        self.fetch(self.mixer.blend(models.Discount))
+
+        with mock.patch.object(notification_queue, "push", side_effect=OSError):
+            with self.assertRaises(OSError):
+                tasks.relay_outbox()
+
+        self.assertEqual(1, models.OutboxEvent.objects.count())
+        self.assertEqual(1, tasks.relay_outbox())
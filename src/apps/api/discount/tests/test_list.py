@@ -1,9 +1,18 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
+from apps.api.discount.viewsets.list import DiscountListViewSet
 from apps.api.tests import AuthenticatedBrandAPITestCase
 from apps.domain import models
+from apps.domain.enums import CacheNamespace
 from commons import json_schema
+from commons.api.cache import response_cache
+from commons.api.mixins import resolve_fields
+from commons.api.serializers import _readable_field_plan, compile_serializer
 
 
 class BrandSchema(json_schema.JsonSchema):
@@ -33,6 +42,202 @@ class UserDiscountListApiTestCase(AuthenticatedBrandAPITestCase):
 
         self.assertPaginatedSchema(DiscountsSchema, data)
 
+    def test_should_not_query_brand_by_discount(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        self.mixer.cycle(2).blend(models.Discount)
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(reverse("api:discount-list"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mixer.cycle(8).blend(models.Discount)
+
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(reverse("api:discount-list"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(10, len(response.json()["results"]))
+        self.assertEqual(len(few), len(many))
+
+    def test_should_list_partial_fields(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        self.mixer.cycle(2).blend(models.Discount)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("api:discount-list"), {"fields": "id,brand.name"}
+            )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        for discount in response.json()["results"]:
+            self.assertEqual({"id", "brand"}, set(discount))
+            self.assertEqual({"name"}, set(discount["brand"]))
+
+        # only the requested columns are loaded.
+        sql = queries.captured_queries[-1]["sql"]
+        self.assertIn('"brand"."name"', sql)
+        self.assertNotIn('"discount"."description"', sql)
+        self.assertNotIn('"brand"."email"', sql)
+
+    def test_should_list_from_cache(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        self.mixer.cycle(2).blend(models.Discount)
+
+        url = reverse("api:discount-list")
+        first = self.client.get(url, {"page_size": 10, "page": 1})
+
+        with CaptureQueriesContext(connection) as queries:
+            # same params in another order hit the same key.
+            second = self.client.get(url, {"page": 1, "page_size": 10})
+
+        self.assertEqual(first.json(), second.json())
+        self.assertFalse(
+            [x for x in queries.captured_queries if "description" in x["sql"]]
+        )
+
+        stats = response_cache.stats(CacheNamespace.DISCOUNT_CATALOG.value)
+        self.assertEqual({"hits": 1, "misses": 1}, stats)
+
+    def test_should_invalidate_cache_on_change(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        discount = self.mixer.blend(models.Discount)
+
+        url = reverse("api:discount-list")
+        self.assertEqual(1, len(self.client.get(url).json()["results"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mixer.blend(models.Discount)
+
+        self.assertEqual(2, len(self.client.get(url).json()["results"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            discount.brand.name = "Changed"
+            discount.brand.save()
+
+        names = [x["brand"]["name"] for x in self.client.get(url).json()["results"]]
+        self.assertIn("Changed", names)
+
+    def test_should_not_list_if_not_modified(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        discount = self.mixer.blend(models.Discount)
+
+        url = reverse("api:discount-list")
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIn("Last-Modified", response)
+
+        etag = response["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code)
+        self.assertEqual(b"", response.content)
+
+        # a changed brand changes the listed discounts.
+        with self.captureOnCommitCallbacks(execute=True):
+            discount.brand.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertNotEqual(etag, response["ETag"])
+
+    def test_should_not_query_validators_of_cached_list(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        self.mixer.blend(models.Discount)
+
+        url = reverse("api:discount-list")
+        etag = self.client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqual(etag, response["ETag"])
+            self.assertIn("Last-Modified", response)
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code)
+
+        self.assertFalse(
+            [x for x in queries.captured_queries if '"discount"' in x["sql"]]
+        )
+
+    def test_should_search_by_brand_name(self):
+        self.authenticated(self.mixer.blend(models.User))
+
+        brand = self.mixer.blend(models.Brand, name="Blue Shoes")
+        discount = self.mixer.blend(models.Discount, brand=brand)
+        self.mixer.blend(models.Discount, brand__name="Red Hats")
+
+        for query in ["shoe", "hoe"]:
+            response = self.client.get(reverse("api:discount-list"), {"query": query})
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqual(
+                [str(discount.pk)], [x["id"] for x in response.json()["results"]]
+            )
+
+    def test_should_memoize_partial_fields(self):
+        self.authenticated(self.mixer.blend(models.User))
+        self.mixer.cycle(5).blend(models.Discount)
+
+        url = reverse("api:discount-list")
+        params = {"fields": "description, brand.name,id"}
+
+        with mock.patch.multiple(
+            DiscountListViewSet, cache_namespace=None, compile_list_serializer=False
+        ):
+            expected = self.client.get(url, params).json()
+
+            plans = _readable_field_plan.cache_info()
+            response = self.client.get(url, params)
+
+        self.assertEqual(expected, response.json())
+        self.assertEqual(["id", "brand", "description"], list(expected["results"][0]))
+        self.assertEqual(["name"], list(expected["results"][0]["brand"]))
+
+        # the serializers are planned and rendered from the first request plans.
+        self.assertEqual(plans.misses, _readable_field_plan.cache_info().misses)
+        self.assertLess(plans.hits, _readable_field_plan.cache_info().hits)
+        self.assertIs(
+            resolve_fields(params["fields"]), resolve_fields(params["fields"])
+        )
+
+    def test_should_render_compiled_list_as_serializer(self):
+        self.authenticated(self.mixer.blend(models.User))
+        self.mixer.cycle(15).blend(models.Discount)
+
+        url = reverse("api:discount-list")
+        params = [
+            {},
+            {"fields": "id,brand.name"},
+            {"pagination": "cursor", "page_size": 5},
+            {"query": "a", "page_size": 5},
+        ]
+
+        self.assertIsNotNone(compile_serializer(DiscountListViewSet.serializer_class))
+
+        with mock.patch.object(DiscountListViewSet, "cache_namespace", None):
+            for data in params:
+                compiled = self.client.get(url, data)
+
+                with mock.patch.object(
+                    DiscountListViewSet, "compile_list_serializer", False
+                ):
+                    response = self.client.get(url, data)
+
+                self.assertEqual(status.HTTP_200_OK, compiled.status_code)
+                self.assertEqual(response.content, compiled.content)
+
     def test_should_not_list_if_not_authenticated(self):
         # clear authorization header
         self.unauthenticated()
@@ -0,0 +1,105 @@
+import datetime
+import decimal
+import io
+import math
+import uuid
+from collections import OrderedDict
+from unittest import mock
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+
+from apps.api.discount.serializers.list import DiscountSerializer
+from apps.domain import models
+from commons.api.parsers import JSONParser
+from commons.api.renderers import JSONRenderer
+from commons.tests.base import TestCase
+
+
+class JSONRendererTestCase(TestCase):
+    def assertRendered(self, data, **kwargs):
+        expected = renderers.JSONRenderer().render(data, **kwargs)
+
+        self.assertEqual(expected, JSONRenderer().render(data, **kwargs))
+
+        with mock.patch("commons.api.renderers.orjson", None):
+            self.assertEqual(expected, JSONRenderer().render(data, **kwargs))
+
+    def test_should_render_as_rest_framework(self):
+        discount = self.mixer.blend(models.Discount)
+        now = timezone.now()
+
+        self.assertRendered(
+            OrderedDict(
+                id=discount.pk,
+                created_at=discount.created_at,
+                updated_at=discount.updated_at,
+                local=now.astimezone(datetime.timezone(datetime.timedelta(hours=3))),
+                naive=now.replace(tzinfo=None, microsecond=0),
+                date=now.date(),
+                time=now.time(),
+                delta=datetime.timedelta(seconds=90),
+                price=decimal.Decimal("10.50"),
+                label=_("Discount"),
+                text="café \u2028 \u2029 \U0001f600",
+                numbers=[1, 2.5, None, True],
+                keys={1: "one"},
+                big=2**70,
+                discount=DiscountSerializer(discount).data,
+                queryset=models.Discount.objects.values_list("code", flat=True),
+            )
+        )
+
+    def test_should_render_floats_as_rest_framework(self):
+        self.assertRendered(
+            {
+                "big": [1e16, -1.2345678901234568e17, 2.5e300],
+                "small": [1e-5, -5.911534350013039e-05, 1e-7, 0.0001, 0.0],
+                "text": "1e16,0.00001",
+            }
+        )
+        self.assertRendered(1e16)
+
+    def test_should_not_render_non_finite_floats(self):
+        for value in [
+            math.nan,
+            math.inf,
+            -math.inf,
+            decimal.Decimal("NaN"),
+            decimal.Decimal("Infinity"),
+        ]:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                JSONRenderer().render({"price": [None, (value,)]})
+
+    def test_should_render_indented(self):
+        data = {"id": uuid.uuid4(), "codes": ["a", "b"]}
+
+        self.assertRendered(data, accepted_media_type="application/json; indent=4")
+        self.assertRendered(data, renderer_context={"indent": 2})
+
+    def test_should_render_empty(self):
+        self.assertEqual(b"", JSONRenderer().render(None))
+
+
+class JSONParserTestCase(TestCase):
+    def parse(self, content, encoding="utf-8"):
+        return JSONParser().parse(
+            io.BytesIO(content), parser_context={"encoding": encoding}
+        )
+
+    def test_should_parse(self):
+        content = '{"code": "café", "quantity": 10, "ids": [1.5, null]}'
+        expected = {"code": "café", "quantity": 10, "ids": [1.5, None]}
+
+        self.assertEqual(expected, self.parse(content.encode()))
+        self.assertEqual(expected, self.parse(content.encode("latin-1"), "latin-1"))
+
+        with mock.patch("commons.api.parsers.orjson", None):
+            self.assertEqual(expected, self.parse(content.encode()))
+
+    def test_should_not_parse_invalid(self):
+        for content in [b'{"code": ', b'{"price": NaN}', b"\xff"]:
+            with self.assertRaises(ParseError):
+                self.parse(content)
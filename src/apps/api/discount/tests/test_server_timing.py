@@ -0,0 +1,78 @@
+import json
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.api.discount.viewsets.list import DiscountListViewSet
+from apps.api.tests import AuthenticatedBrandAPITestCase
+from apps.domain import models
+from apps.domain.enums import CacheNamespace
+from commons.api.cache import response_cache
+
+
+@override_settings(SERVER_TIMING_SAMPLE_RATE=1)
+class ServerTimingTestCase(AuthenticatedBrandAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.authenticated(self.mixer.blend(models.User))
+        self.mixer.cycle(5).blend(models.Discount)
+        self.url = reverse("api:discount-list")
+
+    def get(self, url, **kwargs):
+        with self.assertLogs("commons.server_timing", "INFO") as logs:
+            response = self.client.get(url, **kwargs)
+
+        return response, [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_should_send_timings(self):
+        with mock.patch.object(DiscountListViewSet, "cache_namespace", None):
+            with CaptureQueriesContext(connection) as queries:
+                response, [log] = self.get(self.url)
+
+        metrics = {
+            metric.split(";")[0]: metric
+            for metric in response["Server-Timing"].split(", ")
+        }
+
+        self.assertEqual({"db", "serialize", "render", "total"}, set(metrics))
+        self.assertIn(f'desc="{len(queries)}"', metrics["db"])
+
+        self.assertEqual("api:discount-list", log["view"])
+        self.assertEqual(200, log["status"])
+        self.assertEqual(len(queries), log["db"])
+        self.assertLessEqual(log["db_ms"], log["total_ms"])
+
+    def test_should_count_cache_hits(self):
+        response_cache.bump(CacheNamespace.DISCOUNT_CATALOG.value)
+
+        _, [log] = self.get(self.url)
+        self.assertEqual(1, log["cache_misses"])
+
+        response, [log] = self.get(self.url)
+        self.assertEqual(1, log["cache_hits"])
+        self.assertIn('cache_hits;desc="1"', response["Server-Timing"])
+        self.assertNotIn("serialize", response["Server-Timing"])
+
+    def test_should_warn_over_query_budget(self):
+        with mock.patch.object(DiscountListViewSet, "query_budget", 1):
+            _, logs = self.get(self.url)
+
+        self.assertEqual(2, len(logs))
+        self.assertEqual(1, logs[1]["query_budget"])
+        self.assertGreater(logs[1]["db"], 1)
+
+        with mock.patch.object(DiscountListViewSet, "query_budget", 100):
+            _, logs = self.get(self.url)
+
+        self.assertEqual(1, len(logs))
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_should_not_send_unsampled_timings(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("Server-Timing", response)
@@ -1,11 +1,21 @@
+from django.http import Http404
+
 from apps.api.discount.serializers.fetch import DiscountSerializer
 from rest_framework import viewsets, status
 
 from apps.api import permissions
+from apps.crosscutting.claim_pool import claim_pool
 from apps.domain import models
+from apps.domain.enums import ClaimStatus
 from commons.api.mixins import RetrieveModelMixin
+from commons.metrics import registry
 from rest_framework.response import Response
-from apps.worker import tasks
+
+CLAIMS = registry.counter(
+    "discount_claims_total",
+    "Discount claims by outcome and by whether the claim pool or the database served them.",
+    ["outcome", "source"],
+)
 
 
 class DiscountFetchViewSet(RetrieveModelMixin, viewsets.GenericViewSet):
@@ -13,43 +23,68 @@ class DiscountFetchViewSet(RetrieveModelMixin, viewsets.GenericViewSet):
     permission_classes = [permissions.IsUser]
     serializer_class = DiscountSerializer
 
-    def fetch(self, request, *args, **kwargs):
+    claim_errors = {
+        ClaimStatus.DUPLICATED: (
+            "User already get that discount",
+            status.HTTP_400_BAD_REQUEST,
+        ),
+        ClaimStatus.DISABLED: (
+            "This discount is disable, sorry.",
+            status.HTTP_406_NOT_ACCEPTABLE,
+        ),
+        ClaimStatus.SOLD_OUT: (
+            "This discount is not available anymore, sorry.",
+            status.HTTP_406_NOT_ACCEPTABLE,
+        ),
+        ClaimStatus.UNAVAILABLE: (
+            "This discount can not be claimed right now, try again later.",
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        ),
+    }
 
-        if models.UserDiscount.objects.filter(
-            user_id=request.user.pk, discount_id=self.kwargs.get("pk")
-        ).exists():
-            return Response(
-                {"error": "User already get that discount"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+    def claim(self, discount_id, user_id):
+        """
+        Claim the discount from the database, or from the claim pool when
+        it is a hot discount. Hot discounts fall back to the database while
+        they are not loaded into the pool. While the pool is unavailable,
+        they can not be claimed: the ``used`` counter misses the claims
+        accepted by the pool and not yet persisted, so the database could
+        oversell them.
+        """
+        queryset = self.get_queryset()
+        claim_status, discount = queryset.claim(
+            discount_id=discount_id, user_id=user_id, hot=False
+        )
 
-        discount = models.Discount.objects.get(pk=self.kwargs.get("pk"))
-        if not discount.enable:
-            return Response(
-                {"error": "This discount is disable, sorry."},
-                status=status.HTTP_406_NOT_ACCEPTABLE,
-            )
+        if claim_status is not None:
+            CLAIMS.inc(outcome=claim_status.value, source="database")
+            return claim_status, discount
+
+        claim_status = claim_pool.claim(discount_id, user_id)
 
-        user_discount = models.UserDiscount.objects.filter(discount=discount).count()
-        if discount.quantity - user_discount == 0:
-            return Response(
-                {"error": "This discount is not available anymore, sorry."},
-                status=status.HTTP_406_NOT_ACCEPTABLE,
+        if claim_status is None:
+            claim_status, discount = queryset.claim(
+                discount_id=discount_id, user_id=user_id
             )
+            CLAIMS.inc(outcome=claim_status.value, source="database")
+            return claim_status, discount
 
-        tasks.send_notification.apply_async(
-            kwargs={
-                "user": models.User.objects.get(id=request.user.pk).full_name,
-                "discount": discount.code,
-                "brand": discount.brand.name,
-            }
-        )
+        CLAIMS.inc(outcome=claim_status.value, source="pool")
 
-        models.UserDiscount.objects.create(
-            discount_id=self.kwargs.get("pk"), user_id=request.user.pk
-        )
+        if claim_status is not ClaimStatus.CLAIMED:
+            return claim_status, None
+
+        return claim_status, discount
+
+    def fetch(self, request, *args, **kwargs):
+        claim_status, discount = self.claim(self.kwargs.get("pk"), request.user.pk)
+
+        if claim_status is ClaimStatus.NOT_FOUND:
+            raise Http404()
 
-        instance = models.Discount.objects.get(id=self.kwargs.get("pk"))
+        if claim_status in self.claim_errors:
+            error, status_code = self.claim_errors[claim_status]
+            return Response({"error": error}, status=status_code)
 
-        serializer = self.get_serializer(instance=instance)
+        serializer = self.get_serializer(instance=discount)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -1,23 +1,37 @@
 import uuid
 
 from commons.djutils.api.mixins import FilterQuerysetMixin
+from commons.djutils.api.pagination import CursorPagination
 
 from apps.api.discount.serializers.list import DiscountSerializer
 from apps.domain import models
+from apps.domain.enums import CacheNamespace
 from commons.api import viewsets
+from commons.api.mixins import CacheResponseMixin, PartialViewSetMixin
 from commons.api.permissions import IsAuthenticated
 from commons.djutils.models.filters import Search
 from commons.models import filters
 
 
-class DiscountListViewSet(FilterQuerysetMixin, viewsets.ListModelViewSet):
+class DiscountListViewSet(
+    CacheResponseMixin,
+    FilterQuerysetMixin,
+    PartialViewSetMixin,
+    viewsets.ListModelViewSet,
+):
     queryset = models.Discount.objects.all()
     serializer_class = DiscountSerializer
     permission_classes = [IsAuthenticated]
+    cursor_pagination_class = CursorPagination
+    compile_list_serializer = True
+    cache_namespace = CacheNamespace.DISCOUNT_CATALOG.value
+    conditional_get = True
+    last_modified_fields = ["updated_at", "brand__updated_at"]
 
     filters = [
         filters.Filter("ids", lookup="pk", cast=uuid.UUID, many=True),
         filters.Filter("website", lookup="brand__website", cast=str, many=True),
+        # substring matches, served by the trigram index of the brand name.
         Search(lookups=["brand__name__icontains"]),
     ]
 
@@ -0,0 +1,19 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from commons.tests.base import APITestCase
+
+
+class HealthCheckApiTestCase(APITestCase):
+    def test_should_check_health(self):
+        response = self.client.get(reverse("api:healthcheck"))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_should_skip_stateful_middlewares(self):
+        response = self.client.get(reverse("api:healthcheck"))
+        self.assertNotIn("X-Frame-Options", response)
+
+        with override_settings(LEAN_MIDDLEWARE_ROUTES=[]):
+            response = self.client.get(reverse("api:healthcheck"))
+            self.assertIn("X-Frame-Options", response)
@@ -0,0 +1,235 @@
+import json
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from celery import signals
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+import celery_app
+from apps.api.tests import AuthenticatedUserAPITestCase
+from apps.crosscutting.dynamic_config.backends.db import DBDynamicConfigBackend
+from apps.domain import models
+from commons.metrics import MetricsRegistry
+from commons.tests.base import APITestCase
+
+
+def sample(content, name, **labels):
+    """
+    Returns the value of the sample with the given labels, or ``0``.
+    """
+    for line in content.splitlines():
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+
+        if not match or match[1] != name:
+            continue
+
+        line_labels = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match[2] or ""))
+
+        if line_labels == labels:
+            return float(match[3])
+
+    return 0
+
+
+@override_settings(METRICS_ACCESS_KEY="secret")
+class MetricsApiTestCase(AuthenticatedUserAPITestCase):
+    def metrics(self, **kwargs):
+        kwargs.setdefault("HTTP_AUTHORIZATION", "Bearer secret")
+        response = self.client.get(reverse("api:metrics"), **kwargs)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        return response.content.decode()
+
+    def test_should_expose_request_latency(self):
+        labels = {"route": "api:healthcheck", "method": "GET", "status": "200"}
+        before = sample(self.metrics(), "http_request_duration_seconds_count", **labels)
+
+        self.client.get(reverse("api:healthcheck"))
+        content = self.metrics()
+
+        self.assertIn("# TYPE http_request_duration_seconds histogram", content)
+        self.assertEqual(
+            before + 1,
+            sample(content, "http_request_duration_seconds_count", **labels),
+        )
+        self.assertEqual(
+            before + 1,
+            sample(
+                content, "http_request_duration_seconds_bucket", **labels, le="+Inf"
+            ),
+        )
+
+    def test_should_count_claim_outcomes(self):
+        discount = self.mixer.blend(models.Discount, quantity=1, enable=True)
+        labels = {"source": "database"}
+        before = self.metrics()
+
+        self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        self.client.get(reverse("api:discount-fetch", args=[discount.pk]))
+        content = self.metrics()
+
+        for outcome in ["claimed", "duplicated"]:
+            self.assertEqual(
+                sample(before, "discount_claims_total", outcome=outcome, **labels) + 1,
+                sample(content, "discount_claims_total", outcome=outcome, **labels),
+            )
+
+    def test_should_count_dynamic_config_cache(self):
+        backend = DBDynamicConfigBackend(
+            config={"limit": {"key": "limit", "default": 1}}, check_interval=60
+        )
+        before = self.metrics()
+
+        backend["limit"]
+        backend["limit"]
+        content = self.metrics()
+
+        for result in ["hit", "miss"]:
+            self.assertEqual(
+                sample(before, "dynamic_config_cache_lookups_total", result=result) + 1,
+                sample(content, "dynamic_config_cache_lookups_total", result=result),
+            )
+
+    def test_should_measure_task_enqueue(self):
+        labels = {"task": "apps.worker.tasks.relay_outbox"}
+        name = "celery_task_enqueue_duration_seconds_count"
+        before = sample(self.metrics(), name, **labels)
+
+        signals.before_task_publish.send(sender=labels["task"], headers={"id": "1"})
+        signals.after_task_publish.send(sender=labels["task"], headers={"id": "1"})
+
+        self.assertEqual(before + 1, sample(self.metrics(), name, **labels))
+
+    def test_should_not_keep_failed_task_publishes(self):
+        labels = {"task": "apps.worker.tasks.relay_outbox"}
+        name = "celery_task_enqueue_duration_seconds_count"
+        before = sample(self.metrics(), name, **labels)
+
+        # the publish of task 1 failed, no after_task_publish is sent.
+        signals.before_task_publish.send(sender=labels["task"], headers={"id": "1"})
+        signals.before_task_publish.send(sender=labels["task"], headers={"id": "2"})
+        signals.after_task_publish.send(sender=labels["task"], headers={"id": "2"})
+        signals.after_task_publish.send(sender=labels["task"], headers={"id": "1"})
+
+        self.assertEqual(before + 1, sample(self.metrics(), name, **labels))
+        self.assertEqual((None, None), celery_app._publishing.task)
+
+    def test_should_require_access_key(self):
+        for authorization in ["", "Bearer other"]:
+            response = self.client.get(
+                reverse("api:metrics"), HTTP_AUTHORIZATION=authorization
+            )
+            self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+        self.metrics()
+
+    @override_settings(METRICS_ACCESS_KEY=None)
+    def test_should_only_be_open_in_development_without_access_key(self):
+        response = self.client.get(reverse("api:metrics"))
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+        with override_settings(DEBUG=True):
+            self.metrics(HTTP_AUTHORIZATION="")
+
+
+class MetricsRegistryTestCase(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def registry(self):
+        registry = MetricsRegistry(directory=self.directory, flush_interval=60)
+        registry.counter("jobs_total", "Jobs.", ["kind"])
+        registry.histogram("job_seconds", "Job latency.", buckets=[0.1, 1])
+        return registry
+
+    def test_should_aggregate_processes(self):
+        web, worker = self.registry(), self.registry()
+
+        web.metrics["jobs_total"].inc(kind="a")
+        web.metrics["job_seconds"].observe(0.05)
+        worker.metrics["jobs_total"].inc(2, kind="a")
+        worker.metrics["jobs_total"].inc(kind="b")
+        worker.metrics["job_seconds"].observe(0.5)
+        worker.flush()
+
+        content = web.expose()
+
+        self.assertEqual(3, sample(content, "jobs_total", kind="a"))
+        self.assertEqual(1, sample(content, "jobs_total", kind="b"))
+        self.assertEqual(1, sample(content, "job_seconds_bucket", le="0.1"))
+        self.assertEqual(2, sample(content, "job_seconds_bucket", le="1.0"))
+        self.assertEqual(2, sample(content, "job_seconds_count"))
+        self.assertEqual(0.55, sample(content, "job_seconds_sum"))
+
+        # metrics registered only by other processes are exposed as well.
+        web.flush()
+        other = MetricsRegistry(directory=self.directory)
+        self.assertEqual(3, sample(other.expose(), "jobs_total", kind="a"))
+
+    def test_should_not_count_parent_process_values(self):
+        registry = self.registry()
+        registry.metrics["jobs_total"].inc(kind="a")
+
+        with mock.patch("os.getpid", return_value=-1):
+            registry.metrics["jobs_total"].inc(kind="a")
+            self.assertEqual(1, sample(registry.expose(), "jobs_total", kind="a"))
+
+    def exited_process_file(self, **values):
+        """
+        Writes the file of a process that exited, with the given
+        ``jobs_total`` values by kind.
+        """
+        process = subprocess.Popen([sys.executable, "-c", ""])
+        process.wait()
+        registry = self.registry()
+
+        for kind, value in values.items():
+            registry.metrics["jobs_total"].inc(value, kind=kind)
+
+        path = Path(self.directory) / f"{process.pid}-exited.json"
+        path.write_text(json.dumps(registry.snapshot()))
+        return path
+
+    def test_should_compact_exited_processes(self):
+        registry = self.registry()
+        registry.metrics["jobs_total"].inc(kind="a")
+        registry.flush()
+        first = self.exited_process_file(a=2)
+        second = self.exited_process_file(a=3, b=1)
+
+        registry.compact()
+
+        self.assertFalse(first.exists())
+        self.assertFalse(second.exists())
+        self.assertTrue(registry._path.exists())
+
+        for _ in range(2):
+            content = MetricsRegistry(directory=self.directory).expose()
+            self.assertEqual(6, sample(content, "jobs_total", kind="a"))
+            self.assertEqual(1, sample(content, "jobs_total", kind="b"))
+
+            # merged once only.
+            registry.compact()
+
+    def test_should_clear_exited_processes(self):
+        registry = self.registry()
+        registry.metrics["jobs_total"].inc(kind="a")
+        registry.flush()
+        self.exited_process_file(a=2)
+        registry.compact()
+        exited = self.exited_process_file(a=3)
+
+        registry.clear()
+
+        self.assertFalse(exited.exists())
+        content = MetricsRegistry(directory=self.directory).expose()
+        self.assertEqual(1, sample(content, "jobs_total", kind="a"))
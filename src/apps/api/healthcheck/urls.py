@@ -1,11 +1,17 @@
 from django.urls import path
 
 from apps.api.healthcheck.viewsets.healthcheck import HealthCheckViewSet
+from apps.api.healthcheck.viewsets.metrics import MetricsViewSet
 
 urlpatterns = [
     path(
         "health/",
         HealthCheckViewSet.as_view(actions={"get": "health"}),
         name="healthcheck",
-    )
+    ),
+    path(
+        "metrics",
+        MetricsViewSet.as_view(actions={"get": "metrics"}),
+        name="metrics",
+    ),
 ]
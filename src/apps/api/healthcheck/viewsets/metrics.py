@@ -0,0 +1,22 @@
+from django.http import HttpResponse
+from rest_framework import viewsets, status
+
+from commons.api.permissions import HasMetricsAccess
+from commons.metrics import registry
+
+
+class MetricsViewSet(viewsets.ViewSet):
+    permission_classes = [HasMetricsAccess]
+    authentication_classes = []
+
+    def metrics(self, request, *args, **kwargs):  # noqa
+        """
+        Returns the metrics of all the service processes, in the
+        prometheus text exposition format.
+        """
+
+        return HttpResponse(
+            registry.expose(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+            status=status.HTTP_200_OK,
+        )
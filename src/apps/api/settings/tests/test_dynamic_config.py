@@ -0,0 +1,59 @@
+from apps.crosscutting.dynamic_config.backends.db import DBDynamicConfigBackend
+from apps.domain import models
+from commons.tests.base import TestCase
+
+CONFIG = {
+    "limit": {"key": "limit", "cast": int, "default": 1},
+    "title": {"key": "title", "default": "Discounts"},
+}
+
+
+class DBDynamicConfigBackendTestCase(TestCase):
+    def backend(self, **kwargs):
+        return DBDynamicConfigBackend(config=CONFIG, **kwargs)
+
+    def test_should_get_from_cache(self):
+        backend = self.backend(check_interval=60)
+        models.DynamicConfigParameter.objects.create(key="limit", value="10")
+
+        with self.assertNumQueries(2):
+            # version and value.
+            self.assertEqual(10, backend["limit"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(10, backend["limit"])
+
+    def test_should_get_many_at_once(self):
+        backend = self.backend()
+        models.DynamicConfigParameter.objects.create(key="limit", value="10")
+
+        with self.assertNumQueries(2):
+            self.assertEqual({"limit": 10, "title": "Discounts"}, backend.snapshot())
+
+    def test_should_expire_cached_value(self):
+        backend = self.backend(ttl=-1, check_interval=60)
+        backend["limit"]
+
+        with self.assertNumQueries(1):
+            backend["limit"]
+
+    def test_should_not_cache_with_zero_ttl(self):
+        backend = self.backend(ttl=0, check_interval=60)
+        backend["limit"]
+
+        with self.assertNumQueries(1):
+            backend["limit"]
+
+    def test_should_see_changes_of_other_processes(self):
+        backend, other = self.backend(check_interval=0), self.backend()
+        self.assertEqual(1, backend["limit"])
+
+        other.set("limit", "5")
+        self.assertEqual(5, backend["limit"])
+
+        models.DynamicConfigParameter.objects.filter(key="limit").delete()
+        self.assertEqual(1, backend["limit"])
+
+    def test_should_not_get_unknown_key(self):
+        with self.assertRaises(KeyError):
+            self.backend()["unknown"]
@@ -17,7 +17,8 @@ class SettingsViewSet(viewsets.GenericViewSet):
     def list(self, request, *args, **kwargs):
         data = list(
             map(
-                lambda x: {"key": x[0], "value": x[1]}, dynamic_config.get_all().items()
+                lambda x: {"key": x[0], "value": x[1]},
+                dynamic_config.snapshot().items(),
             )
         )
         serializer = self.get_serializer(data, many=True)
@@ -8,6 +8,8 @@ class AuthenticatedAPITestCase(APITestCase):
     user = None
 
     def setUp(self) -> None:
+        super().setUp()
+
         if self.auth_user_model:
             # create a default panel_user for tests.
             self.user = self.mixer.blend(self.auth_user_model)
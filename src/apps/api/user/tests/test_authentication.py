@@ -0,0 +1,80 @@
+import time
+from unittest import mock
+
+from rest_framework.test import APIRequestFactory
+
+from apps.api.shortcuts import generate_user_token
+from apps.domain import models
+from commons import jwt
+from commons.api.jwt_auth import JwtAuthenticationClient
+from commons.tests.base import TestCase
+
+
+class JwtAuthenticationClientTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.auth_client = JwtAuthenticationClient()
+        self.auth_client.claims_cache.clear()
+        self.factory = APIRequestFactory()
+
+    def authenticate(self, token):
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.auth_client.authenticate(request)
+
+    def test_should_authenticate_from_cache(self):
+        user = self.mixer.blend(models.User)
+        token = generate_user_token(user, exp=60)
+
+        self.assertEqual(user.pk, self.authenticate(token)[0].pk)
+
+        with mock.patch.object(jwt.Jwt, "verify") as verify:
+            self.assertEqual(user.pk, self.authenticate(token)[0].pk)
+            verify.assert_not_called()
+
+        stats = self.auth_client.claims_cache.stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(0.5, stats["hit_ratio"])
+        self.assertEqual(1, stats["size"])
+
+    def test_should_not_authenticate_expired_token(self):
+        user = self.mixer.blend(models.User)
+        token = generate_user_token(user, exp=60)
+
+        self.assertIsNotNone(self.authenticate(token))
+
+        with mock.patch("time.time", return_value=time.time() + 120):
+            # the token is verified (and refused) again.
+            with mock.patch.object(jwt.Jwt, "verify", return_value=None) as verify:
+                self.assertIsNone(self.authenticate(token))
+                verify.assert_called_once()
+
+        self.assertEqual(0, self.auth_client.claims_cache.stats()["size"])
+
+    def test_should_not_cache_invalid_token(self):
+        user = self.mixer.blend(models.User)
+        token = generate_user_token(user, exp=60)
+
+        self.assertIsNone(self.authenticate(f"{token}x"))
+        self.assertEqual(0, self.auth_client.claims_cache.stats()["size"])
+
+    def test_should_evict_token(self):
+        user = self.mixer.blend(models.User)
+        token = generate_user_token(user, exp=60)
+
+        self.authenticate(token)
+        self.assertTrue(JwtAuthenticationClient.evict(token))
+        self.assertEqual(0, self.auth_client.claims_cache.stats()["size"])
+
+    def test_should_evict_least_recently_used(self):
+        cache = jwt.ClaimsCache(maxsize=2)
+
+        cache.set("a", {"id": "a"})
+        cache.set("b", {"id": "b"})
+        cache.get("a")
+        cache.set("c", {"id": "c"})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
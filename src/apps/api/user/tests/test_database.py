@@ -0,0 +1,66 @@
+from apps.domain import models
+from commons.djutils.db import Database
+from commons.tests.base import TestCase
+
+
+class DatabaseTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.db = Database()
+        self.discount = self.mixer.blend(models.Discount, quantity=10)
+        self.users = self.mixer.cycle(5).blend(models.User)
+
+        for user in self.users:
+            self.mixer.blend(models.UserDiscount, discount=self.discount, user=user)
+
+    def test_should_bind_params(self):
+        code = "x' OR '1'='1"
+
+        result = self.db.select(
+            "SELECT id, code FROM discount WHERE code = %(code)s", {"code": code}
+        )
+        self.assertEqual(0, len(result))
+
+        self.assertEqual(
+            5,
+            self.db.select_one(
+                "SELECT COUNT(*) FROM user_discount WHERE discount_id = %s",
+                [self.discount.pk],
+            ),
+        )
+
+    def test_should_map_rows(self):
+        result = self.db.select(
+            "SELECT id, code FROM discount WHERE id = %(id)s", {"id": self.discount.pk}
+        )
+
+        self.assertEqual(
+            [{"id": self.discount.pk, "code": self.discount.code}], result.as_dict()
+        )
+
+        (row,) = result.as_namedtuple()
+        self.assertEqual(self.discount.pk, row.id)
+        self.assertEqual(self.discount.code, row.code)
+
+    def test_should_iterate_in_chunks(self):
+        query = (
+            "SELECT user_id, COUNT(*) AS total FROM user_discount "
+            "WHERE discount_id = %(discount)s GROUP BY user_id ORDER BY user_id"
+        )
+        params = {"discount": self.discount.pk}
+
+        rows = list(self.db.iterate(query, params, chunk_size=2, named=True))
+
+        self.assertEqual(
+            sorted(user.pk for user in self.users), [x.user_id for x in rows]
+        )
+        self.assertEqual({1}, {x.total for x in rows})
+        self.assertEqual(
+            [tuple(x) for x in rows], list(self.db.iterate(query, params, chunk_size=2))
+        )
+
+    def test_should_return_none_without_rows(self):
+        self.assertIsNone(
+            self.db.select_one("SELECT id FROM discount WHERE code = %s", ["missing"])
+        )
@@ -1,9 +1,15 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 from apps.api.tests import AuthenticatedBrandAPITestCase
+from apps.api.user.viewsets.discounts import UserDiscountViewSet
 from apps.domain import models
 from commons import json_schema
+from commons.api.serializers import compile_serializer
 
 
 class BrandSchema(json_schema.JsonSchema):
@@ -38,6 +44,24 @@ class UserDiscountListApiTestCase(AuthenticatedBrandAPITestCase):
 
         self.assertPaginatedSchema(DiscountsSchema, data)
 
+    def test_should_not_query_discount_by_claim(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        self.mixer.cycle(2).blend(models.UserDiscount, user=user)
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(reverse("api:user-discount-list"))
+
+        self.mixer.cycle(8).blend(models.UserDiscount, user=user)
+
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(reverse("api:user-discount-list"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(10, len(response.json()["results"]))
+        self.assertEqual(len(few), len(many))
+
     def test_should_not_list_for_brand(self):
         brand = self.mixer.blend(models.Brand)
 
@@ -53,3 +77,30 @@ class UserDiscountListApiTestCase(AuthenticatedBrandAPITestCase):
 
         response = self.client.get(reverse("api:user-discount-list"))
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    def test_should_render_compiled_list_as_serializer(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        for _ in range(15):
+            self.mixer.blend(models.UserDiscount, user=user)
+
+        url = reverse("api:user-discount-list")
+        params = [
+            {},
+            {"fields": "id,discount.code,discount.brand.name"},
+            {"pagination": "cursor", "page_size": 5},
+        ]
+
+        self.assertIsNotNone(compile_serializer(UserDiscountViewSet.serializer_class))
+
+        for data in params:
+            compiled = self.client.get(url, data)
+
+            with mock.patch.object(
+                UserDiscountViewSet, "compile_list_serializer", False
+            ):
+                response = self.client.get(url, data)
+
+            self.assertEqual(status.HTTP_200_OK, compiled.status_code)
+            self.assertEqual(response.content, compiled.content)
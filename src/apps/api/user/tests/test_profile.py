@@ -21,6 +21,34 @@ class UserProfileApiTestCase(AuthenticatedUserAPITestCase):
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertSchema(ProfileSchema, response.json())
 
+    def test_should_not_retrieve_if_not_modified(self):
+        user = self.mixer.blend(models.User)
+        self.authenticated(user)
+
+        response = self.client.get(reverse("api:user-profile"))
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            # only the validators, the profile is not loaded.
+            response = self.client.get(
+                reverse("api:user-profile"), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code)
+
+        response = self.client.get(
+            reverse("api:user-profile"),
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code)
+
+        user.first_name = self.faker.name()
+        user.save()
+
+        response = self.client.get(reverse("api:user-profile"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(user.first_name, response.json()["first_name"])
+
     def test_should_update(self):
         user = self.mixer.blend(models.User)
         self.authenticated(user)
@@ -3,14 +3,20 @@ from apps.api import permissions
 from apps.api.user.serializers.discounts import DiscountsSerializer
 from apps.domain import models
 from commons.api import viewsets
+from commons.api.mixins import PartialViewSetMixin
 from commons.djutils.api.mixins import FilterQuerysetMixin
+from commons.djutils.api.pagination import CursorPagination
 from commons.models.filters import Filter
 
 
-class UserDiscountViewSet(FilterQuerysetMixin, viewsets.ListModelViewSet):
+class UserDiscountViewSet(
+    FilterQuerysetMixin, PartialViewSetMixin, viewsets.ListModelViewSet
+):
     queryset = models.UserDiscount.objects.all()
     serializer_class = DiscountsSerializer
     permission_classes = [permissions.IsUser]
+    cursor_pagination_class = CursorPagination
+    compile_list_serializer = True
 
     filters = [Filter("ids", lookup="pk", cast=uuid.UUID, many=True)]
 
@@ -11,8 +11,12 @@ class UserProfileViewSet(
 ):
     queryset = models.User.objects.all()
     serializer_class = UserProfileSerializer
+    conditional_get = True
     permission_classes = [permissions.IsUser]
 
+    def get_conditional_queryset(self):
+        return self.get_queryset().filter(pk=self.request.user.pk)
+
     def get_object(self):
         """
         Returns the current logged student to be serialized.
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def get_claim_pool_backend(backend=None):
+    """
+    Load a claim pool backend and return an instance of it.
+    If backend is None (default), use settings.CLAIM_POOL_BACKEND.
+    """
+    cls = import_string(backend or settings.CLAIM_POOL_BACKEND)
+
+    return cls()
+
+
+claim_pool = get_claim_pool_backend()
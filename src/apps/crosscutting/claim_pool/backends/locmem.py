@@ -0,0 +1,70 @@
+import threading
+
+from apps.crosscutting.claim_pool.base import BaseClaimPoolBackend
+
+
+class LocMemClaimPoolBackend(BaseClaimPoolBackend):
+    """
+    In-process stand-in of the claim pool.
+
+    It is not shared between processes, use it only for
+    development and tests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._remaining = {}
+        self._claimers = {}
+        self._pending = []
+
+    def claim(self, discount_id, user_id):
+        discount_id, user_id = str(discount_id), str(user_id)
+
+        with self._lock:
+            if discount_id not in self._remaining:
+                return None
+
+            claimers = self._claimers.setdefault(discount_id, set())
+
+            if user_id in claimers:
+                return self.to_status(2)
+
+            if self._remaining[discount_id] <= 0:
+                return self.to_status(0)
+
+            self._remaining[discount_id] -= 1
+            claimers.add(user_id)
+            self._pending.append((discount_id, user_id))
+            return self.to_status(1)
+
+    def sync(self, discount_id, quantity, user_ids=None):
+        discount_id = str(discount_id)
+
+        with self._lock:
+            claimers = self._claimers.setdefault(discount_id, set())
+            claimers.update(map(str, user_ids or []))
+
+            self._remaining[discount_id] = max(quantity - len(claimers), 0)
+            return self._remaining[discount_id]
+
+    def unload(self, discount_id, purge=False):
+        discount_id = str(discount_id)
+
+        with self._lock:
+            self._remaining.pop(discount_id, None)
+
+            if purge:
+                self._claimers.pop(discount_id, None)
+
+    def claimers(self, discount_id):
+        with self._lock:
+            return set(self._claimers.get(str(discount_id), set()))
+
+    def enqueue(self, claims):
+        with self._lock:
+            self._pending.extend((str(d), str(u)) for d, u in claims)
+
+    def dequeue(self, size):
+        with self._lock:
+            claims, self._pending = self._pending[:size], self._pending[size:]
+            return claims
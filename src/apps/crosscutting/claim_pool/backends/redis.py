@@ -0,0 +1,137 @@
+import logging
+
+import redis
+from django.conf import settings
+from django.utils.functional import cached_property
+
+from apps.crosscutting.claim_pool.base import BaseClaimPoolBackend
+from apps.domain.enums import ClaimStatus
+
+logger = logging.getLogger(__name__)
+
+# KEYS: remaining counter, claimers set, pending queue.
+# ARGV: user id, pending claim.
+CLAIM_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return -1
+end
+
+if redis.call("SISMEMBER", KEYS[2], ARGV[1]) == 1 then
+    return 2
+end
+
+if tonumber(redis.call("GET", KEYS[1])) <= 0 then
+    return 0
+end
+
+redis.call("DECR", KEYS[1])
+redis.call("SADD", KEYS[2], ARGV[1])
+redis.call("RPUSH", KEYS[3], ARGV[2])
+return 1
+"""
+
+# KEYS: remaining counter, claimers set.
+# ARGV: quantity, user ids.
+SYNC_SCRIPT = """
+for index = 2, #ARGV do
+    redis.call("SADD", KEYS[2], ARGV[index])
+end
+
+local remaining = math.max(tonumber(ARGV[1]) - redis.call("SCARD", KEYS[2]), 0)
+redis.call("SET", KEYS[1], remaining)
+return remaining
+"""
+
+# KEYS: pending queue.
+# ARGV: size.
+DEQUEUE_SCRIPT = """
+local claims = redis.call("LRANGE", KEYS[1], 0, tonumber(ARGV[1]) - 1)
+redis.call("LTRIM", KEYS[1], #claims, -1)
+return claims
+"""
+
+
+class RedisClaimPoolBackend(BaseClaimPoolBackend):
+    def __init__(self, url=None, prefix="claim_pool"):
+        self._url = url or getattr(settings, "CLAIM_POOL_REDIS_URL", None)
+        self.prefix = prefix
+
+    @cached_property
+    def client(self):
+        """
+        Returns the redis client, connecting on first usage.
+        """
+        return redis.Redis.from_url(self._url)
+
+    @cached_property
+    def scripts(self):
+        return {
+            "claim": self.client.register_script(CLAIM_SCRIPT),
+            "sync": self.client.register_script(SYNC_SCRIPT),
+            "dequeue": self.client.register_script(DEQUEUE_SCRIPT),
+        }
+
+    def _keys(self, discount_id):
+        return (
+            f"{self.prefix}:{discount_id}:remaining",
+            f"{self.prefix}:{discount_id}:claimers",
+        )
+
+    @property
+    def pending_key(self):
+        return f"{self.prefix}:pending"
+
+    def claim(self, discount_id, user_id):
+        try:
+            code = self.scripts["claim"](
+                keys=[*self._keys(discount_id), self.pending_key],
+                args=[str(user_id), self.encode_claim(discount_id, user_id)],
+            )
+
+        except redis.RedisError:
+            # the database does not know the claims accepted but not yet
+            # persisted, so it cannot serve the claim either.
+            logger.warning("Claim pool unavailable.", exc_info=True)
+            return ClaimStatus.UNAVAILABLE
+
+        return self.to_status(code)
+
+    def sync(self, discount_id, quantity, user_ids=None):
+        try:
+            return self.scripts["sync"](
+                keys=list(self._keys(discount_id)),
+                args=[quantity, *map(str, user_ids or [])],
+            )
+
+        except redis.RedisError:
+            # called once the discount change is committed, the
+            # ``reconcile_claim_pool`` task syncs it later.
+            logger.warning("Claim pool unavailable.", exc_info=True)
+            return None
+
+    def unload(self, discount_id, purge=False):
+        remaining_key, claimers_key = self._keys(discount_id)
+
+        try:
+            self.client.delete(
+                *([remaining_key, claimers_key] if purge else [remaining_key])
+            )
+
+        except redis.RedisError:
+            # a discount left loaded is not claimed from the pool once it
+            # is disabled or not hot anymore, see ``DiscountFetchViewSet``.
+            logger.warning("Claim pool unavailable.", exc_info=True)
+
+    def claimers(self, discount_id):
+        _, claimers_key = self._keys(discount_id)
+        return {value.decode("utf-8") for value in self.client.smembers(claimers_key)}
+
+    def enqueue(self, claims):
+        if claims:
+            self.client.rpush(
+                self.pending_key, *[self.encode_claim(*claim) for claim in claims]
+            )
+
+    def dequeue(self, size):
+        claims = self.scripts["dequeue"](keys=[self.pending_key], args=[size])
+        return [self.decode_claim(claim) for claim in claims]
@@ -0,0 +1,114 @@
+"""
+Supports the pre-allocated claim pool used by hot discounts.
+
+While a discount is loaded into the pool, claims are served by the pool
+instead of the database. Accepted claims are queued and persisted into
+``user_discount`` in batches by the worker.
+"""
+from apps.domain.enums import ClaimStatus
+
+
+class BaseClaimPoolBackend:
+    def claim(self, discount_id, user_id):
+        """
+        Claim a discount code from the pool.
+
+        Args:
+            discount_id (uuid.UUID, required): Discount to be claimed.
+            user_id (uuid.UUID, required): User that is claiming the discount.
+
+        Returns:
+            ClaimStatus, ``UNAVAILABLE`` if the pool is unavailable, or None
+            if the discount is not loaded into the pool.
+        """
+        raise NotImplementedError(
+            "subclasses of BaseClaimPoolBackend must provide a claim() method"
+        )
+
+    def sync(self, discount_id, quantity, user_ids=None):
+        """
+        Load a discount into the pool or reconcile a loaded one.
+
+        The given users are registered as claimers and the remaining
+        codes are recomputed as ``quantity`` minus all registered claimers,
+        so it is safe to call it at any time.
+
+        Args:
+            discount_id (uuid.UUID, required): Discount to be loaded.
+            quantity (int, required): Total that can be claimed.
+            user_ids (list<uuid.UUID>, optional): Users that already claimed it.
+
+        Returns:
+            int or None if the pool is unavailable.
+        """
+        raise NotImplementedError(
+            "subclasses of BaseClaimPoolBackend must provide a sync() method"
+        )
+
+    def unload(self, discount_id, purge=False):
+        """
+        Stop serving claims of a discount from the pool.
+
+        Args:
+            discount_id (uuid.UUID, required): Discount to be unloaded.
+            purge (bool, optional): Also forget the registered claimers.
+        """
+        raise NotImplementedError(
+            "subclasses of BaseClaimPoolBackend must provide a unload() method"
+        )
+
+    def claimers(self, discount_id):
+        """
+        Returns all users registered as claimers of a discount.
+
+        Returns:
+            set<str>
+        """
+        raise NotImplementedError(
+            "subclasses of BaseClaimPoolBackend must provide a claimers() method"
+        )
+
+    def enqueue(self, claims):
+        """
+        Queue claims to be persisted.
+
+        Args:
+            claims (list<tuple<str, str>>, required): Discount and user ids.
+        """
+        raise NotImplementedError(
+            "subclasses of BaseClaimPoolBackend must provide a enqueue() method"
+        )
+
+    def dequeue(self, size):
+        """
+        Pop at most ``size`` queued claims to be persisted.
+
+        Returns:
+            list<tuple<str, str>>
+        """
+        raise NotImplementedError(
+            "subclasses of BaseClaimPoolBackend must provide a dequeue() method"
+        )
+
+    @staticmethod
+    def to_status(code):
+        """
+        Map the pool claim result code to a claim status.
+        """
+        return {
+            0: ClaimStatus.SOLD_OUT,
+            1: ClaimStatus.CLAIMED,
+            2: ClaimStatus.DUPLICATED,
+        }.get(code)
+
+    @staticmethod
+    def encode_claim(discount_id, user_id):
+        return f"{discount_id}:{user_id}"
+
+    @staticmethod
+    def decode_claim(value):
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+
+        discount_id, user_id = value.split(":")
+        return discount_id, user_id
@@ -1,17 +1,39 @@
-from celery.utils.collections import OrderedDict
+import time
+
 from django.apps import apps as django_apps
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 
 from apps.crosscutting.dynamic_config.base import BaseDynamicConfigBackend
+from commons.metrics import registry
+
+CACHE_LOOKUPS = registry.counter(
+    "dynamic_config_cache_lookups_total",
+    "Dynamic config values read from the process cache (hit) or the database (miss).",
+    ["result"],
+)
 
 
 class DBDynamicConfigBackend(BaseDynamicConfigBackend):
-    def __init__(self, model=None, config=None):
+    def __init__(self, model=None, config=None, ttl=None, check_interval=None):
         super().__init__(config=config)
         self._model = model or getattr(settings, "DYNAMIC_CONFIG_MODEL", None)
+        self._ttl = (
+            ttl
+            if ttl is not None
+            else getattr(settings, "DYNAMIC_CONFIG_CACHE_TTL", 60)
+        )
+        self._check_interval = (
+            check_interval
+            if check_interval is not None
+            else getattr(settings, "DYNAMIC_CONFIG_CHECK_INTERVAL", 2)
+        )
+
+        # cached values by key, as ``(value, expires_at)``.
         self._cached_values = {}
+        self._version = None
+        self._checked_at = float("-inf")
 
     @property
     def model(self):
@@ -47,68 +69,112 @@ class DBDynamicConfigBackend(BaseDynamicConfigBackend):
         """
         return self.model.objects.all()
 
-    def get_all(self):
+    def get_version(self):
         """
-        Fetch all settings from the dynamic config module.
+        Returns the version of the stored config. It changes whenever
+        a parameter is saved or deleted, in any process.
+        """
+        return tuple(
+            self.get_queryset()
+            .aggregate(updated_at=models.Max("updated_at"), count=models.Count("pk"))
+            .values()
+        )
 
-        Returns:
-            dict<str: any>
+    def check_version(self):
+        """
+        Flush the cached values if the stored config changed. The version
+        is checked at most once per ``settings.DYNAMIC_CONFIG_CHECK_INTERVAL``.
         """
-        stored_config = dict(self.get_queryset().values_list("key", "value"))
+        now = time.monotonic()
 
-        def get_value_from_key(key, cast=None, default=None):
-            if key not in stored_config:
-                return default
+        if now - self._checked_at < self._check_interval:
+            return
 
-            return self.to_python(stored_config[key], cast=cast)
+        version = self.get_version()
 
-        return OrderedDict(
-            (
-                key,
-                get_value_from_key(
-                    key, cast=config.get("cast"), default=config.get("default")
-                ),
-            )
-            for key, config in sorted(self._config.items(), key=lambda x: x[0])
-        )
+        if version != self._version:
+            self._cached_values.clear()
+            self._version = version
 
-    def get(self, item):
+        self._checked_at = now
+
+    def get_all(self):
         """
-        Fetch a given key from the dynamic config. If the key does not exist, return
-        default, which itself defaults to None.
+        Fetch all settings from the dynamic config module.
 
-        The value will be cast based on project settings.
+        Returns:
+            dict<str: any>
+        """
+        return self.snapshot()
+
+    def get_many(self, items):
+        """
+        Fetch the given keys from the dynamic config, loading the
+        ones not cached yet with a single query.
 
         Args:
-            item (str, required): Item key to retrieve the value.
+            items (list<str>, required): Item keys to retrieve the values.
 
         Returns:
-            any
+            dict<str: any>
         """
-        if item not in self._cached_values:
+        for item in items:
             if item not in self._config:
                 # do not accept not configured key.
                 raise KeyError(
                     f'Key "{item}" was not defined in settings.DYNAMIC_CONFIG.'
                 )
 
-            config = self._config[item]
-            value = (
-                self.get_queryset()
-                .filter(key=item)
-                .values_list("value", flat=True)
-                .first()
+        self.check_version()
+
+        now = time.monotonic()
+        values, missing = {}, []
+
+        for item in items:
+            cached = self._cached_values.get(item)
+
+            if cached is not None and cached[1] > now:
+                values[item] = cached[0]
+
+            else:
+                missing.append(item)
+
+        if values:
+            CACHE_LOOKUPS.inc(len(values), result="hit")
+
+        if missing:
+            CACHE_LOOKUPS.inc(len(missing), result="miss")
+            stored_values = dict(
+                self.get_queryset().filter(key__in=missing).values_list("key", "value")
             )
 
-            value = self.to_python(value, cast=config.get("cast"))
+            for item in missing:
+                config = self._config[item]
+                value = self.to_python(stored_values.get(item), cast=config.get("cast"))
+
+                if value is None:
+                    value = config.get("default")
 
-            if value is not None:
-                self._cached_values["key"] = value
-                return value
+                ttl = config.get("ttl", self._ttl)
+                self._cached_values[item] = (value, now + ttl)
+                values[item] = value
 
-            return config.get("default")
+        return {item: values[item] for item in items}
 
-        return self._cached_values[item]
+    def get(self, item):
+        """
+        Fetch a given key from the dynamic config. If the key does not exist, return
+        default, which itself defaults to None.
+
+        The value will be cast based on project settings.
+
+        Args:
+            item (str, required): Item key to retrieve the value.
+
+        Returns:
+            any
+        """
+        return self.get_many([item])[item]
 
     def set(self, item, value):
         """
@@ -120,6 +186,6 @@ class DBDynamicConfigBackend(BaseDynamicConfigBackend):
         """
         self.model.objects.update_or_create(key=item, defaults={"value": value})
 
-        if item in self._cached_values:
-            # flush cached value.
-            del self._cached_values[item]
+        # the other processes see the new version within the check interval.
+        self._cached_values.pop(item, None)
+        self._checked_at = float("-inf")
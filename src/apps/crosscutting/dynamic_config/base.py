@@ -71,6 +71,27 @@ class BaseDynamicConfigBackend:
             "subclasses of BaseDynamicConfigClient must provide a get() method"
         )
 
+    def get_many(self, items):
+        """
+        Fetch the given keys from the dynamic config.
+
+        Args:
+            items (list<str>, required): Item keys to retrieve the values.
+
+        Returns:
+            dict<str: any>
+        """
+        return {item: self.get(item) for item in items}
+
+    def snapshot(self):
+        """
+        Fetch all configured keys at once, sorted by key.
+
+        Returns:
+            dict<str: any>
+        """
+        return dict(self.get_many(sorted(self._config)))
+
     def set(self, item, value):
         """
         Set a value in the dynamic config.
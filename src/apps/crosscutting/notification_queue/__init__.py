@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def get_notification_queue_backend(backend=None):
+    """
+    Load a notification queue backend and return an instance of it.
+    If backend is None (default), use settings.NOTIFICATION_QUEUE_BACKEND.
+    """
+    cls = import_string(backend or settings.NOTIFICATION_QUEUE_BACKEND)
+
+    return cls()
+
+
+notification_queue = get_notification_queue_backend()
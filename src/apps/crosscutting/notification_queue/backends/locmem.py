@@ -0,0 +1,26 @@
+import threading
+from collections import deque
+
+from apps.crosscutting.notification_queue.base import BaseNotificationQueueBackend
+
+
+class LocMemNotificationQueueBackend(BaseNotificationQueueBackend):
+    """
+    In-process stand-in of the notification queue.
+
+    It is not shared between processes, use it only for
+    development and tests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = deque()
+
+    def push(self, events):
+        with self._lock:
+            self._events.extend(map(self.encode_event, events))
+
+    def pop(self, size):
+        with self._lock:
+            size = min(size, len(self._events))
+            return [self.decode_event(self._events.popleft()) for _ in range(size)]
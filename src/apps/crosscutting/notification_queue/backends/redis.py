@@ -0,0 +1,38 @@
+import redis
+from django.conf import settings
+from django.utils.functional import cached_property
+
+from apps.crosscutting.notification_queue.base import BaseNotificationQueueBackend
+
+# KEYS: events queue.
+# ARGV: size.
+POP_SCRIPT = """
+local events = redis.call("LRANGE", KEYS[1], 0, tonumber(ARGV[1]) - 1)
+redis.call("LTRIM", KEYS[1], #events, -1)
+return events
+"""
+
+
+class RedisNotificationQueueBackend(BaseNotificationQueueBackend):
+    def __init__(self, url=None, key="notification_queue:events"):
+        self._url = url or getattr(settings, "NOTIFICATION_QUEUE_REDIS_URL", None)
+        self.key = key
+
+    @cached_property
+    def client(self):
+        """
+        Returns the redis client, connecting on first usage.
+        """
+        return redis.Redis.from_url(self._url)
+
+    @cached_property
+    def pop_script(self):
+        return self.client.register_script(POP_SCRIPT)
+
+    def push(self, events):
+        if events:
+            self.client.rpush(self.key, *map(self.encode_event, events))
+
+    def pop(self, size):
+        events = self.pop_script(keys=[self.key], args=[size])
+        return [self.decode_event(event) for event in events]
@@ -0,0 +1,42 @@
+"""
+Supports the queue of notification events.
+
+Events are appended by the request path and drained in batches by the
+worker, which sends them as digests instead of one email per event.
+"""
+import json
+
+
+class BaseNotificationQueueBackend:
+    def push(self, events):
+        """
+        Append events to the queue.
+
+        Args:
+            events (list<dict>, required): JSON serializable events.
+        """
+        raise NotImplementedError(
+            "subclasses of BaseNotificationQueueBackend must provide a push() method"
+        )
+
+    def pop(self, size):
+        """
+        Remove and return the oldest events of the queue.
+
+        Args:
+            size (int, required): Max number of events.
+
+        Returns:
+            list<dict>
+        """
+        raise NotImplementedError(
+            "subclasses of BaseNotificationQueueBackend must provide a pop() method"
+        )
+
+    @staticmethod
+    def encode_event(event):
+        return json.dumps(event, separators=(",", ":"))
+
+    @staticmethod
+    def decode_event(value):
+        return json.loads(value)
@@ -0,0 +1,31 @@
+from enum import Enum
+
+
+class ClaimStatus(Enum):
+    """
+    Outcome of a user trying to claim a discount code.
+    """
+
+    CLAIMED = "claimed"
+    NOT_FOUND = "not_found"
+    DISABLED = "disabled"
+    DUPLICATED = "duplicated"
+    SOLD_OUT = "sold_out"
+    UNAVAILABLE = "unavailable"
+
+
+class CacheNamespace(Enum):
+    """
+    Namespaces of the cached API responses.
+    """
+
+    # discounts listed to the users, changes with discounts and brands.
+    DISCOUNT_CATALOG = "discount-catalog"
+
+
+class OutboxTopic(Enum):
+    """
+    Topics of the events written to the transactional outbox.
+    """
+
+    DISCOUNT_CLAIMED = "discount.claimed"
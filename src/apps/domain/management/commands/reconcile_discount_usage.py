@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from apps.domain import models
+
+
+class Command(BaseCommand):
+    help = "Recompute the discounts used counter from the claimed discounts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of discounts reconciled in each transaction.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = models.Discount.objects.order_by("pk")
+
+        last_pk, total = None, 0
+
+        while True:
+            batch_qs = queryset.filter(pk__gt=last_pk) if last_pk else queryset
+            pks = list(batch_qs.values_list("pk", flat=True)[:batch_size])
+
+            if not pks:
+                break
+
+            total += models.Discount.objects.filter(pk__in=pks).reconcile_used()
+            last_pk = pks[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"{total} discounts reconciled."))
@@ -0,0 +1,140 @@
+import random
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.domain import models
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed brands, discounts, users and claims for the benchmarks. The same "
+        "seed always creates the same rows, ids included."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--brands", type=int, default=100)
+        parser.add_argument("--discounts", type=int, default=1000)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--claims", type=int, default=10000)
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed of the generated data."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows inserted by each query.",
+        )
+
+    def handle(self, *args, **options):
+        brands, discounts, users, claims = (
+            options["brands"],
+            options["discounts"],
+            options["users"],
+            options["claims"],
+        )
+
+        if min(brands, discounts, users) < 1:
+            raise CommandError("Seed at least one brand, discount and user.")
+
+        if claims > discounts * users:
+            raise CommandError("There are more claims than user and discount pairs.")
+
+        self.random = random.Random(options["seed"])
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            brands = models.Brand.objects.bulk_create(
+                self.make_brands(brands), batch_size=batch_size
+            )
+            users = models.User.objects.bulk_create(
+                self.make_users(users), batch_size=batch_size
+            )
+
+            pairs = self.make_claims(len(users), discounts, claims)
+            discounts = models.Discount.objects.bulk_create(
+                self.make_discounts(discounts, brands, pairs), batch_size=batch_size
+            )
+            models.UserDiscount.objects.bulk_create(
+                [
+                    models.UserDiscount(
+                        id=self.make_id(),
+                        user=users[user],
+                        discount=discounts[discount],
+                    )
+                    for user, discount in pairs
+                ],
+                batch_size=batch_size,
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(brands)} brands, {len(discounts)} discounts, "
+                f"{len(users)} users and {len(pairs)} claims seeded."
+            )
+        )
+
+    def make_id(self):
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def make_brands(self, count):
+        return [
+            models.Brand(
+                id=self.make_id(),
+                name=f"Brand {i}",
+                website=f"https://brand{i}.com",
+                email=f"contact@brand{i}.com",
+            )
+            for i in range(count)
+        ]
+
+    def make_users(self, count):
+        return [
+            models.User(
+                id=self.make_id(),
+                first_name="User",
+                last_name=str(i),
+                email=f"user{i}@bench.com",
+            )
+            for i in range(count)
+        ]
+
+    def make_claims(self, users, discounts, count):
+        """
+        Returns distinct ``(user, discount)`` index pairs, spread evenly
+        over the users.
+        """
+        pairs = []
+
+        for user in range(users):
+            claims = count // users + (user < count % users)
+            pairs.extend(
+                (user, discount)
+                for discount in self.random.sample(range(discounts), claims)
+            )
+
+        return pairs
+
+    def make_discounts(self, count, brands, claims):
+        used = [0] * count
+
+        for _, discount in claims:
+            used[discount] += 1
+
+        return [
+            models.Discount(
+                id=self.make_id(),
+                code=f"BENCH{i}",
+                description=f"Benchmark discount {i}",
+                # about a tenth of the discounts are sold out.
+                quantity=used[i] + self.random.choice([0, *range(1, 10)]) * 10,
+                used=used[i],
+                # and a twentieth disabled or hidden.
+                enable=self.random.random() >= 0.05,
+                hide=self.random.random() < 0.05,
+                brand=brands[i % len(brands)],
+            )
+            for i in range(count)
+        ]
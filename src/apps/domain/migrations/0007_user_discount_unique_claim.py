@@ -0,0 +1,36 @@
+# Generated by Django 4.0.4 on 2026-10-18 14:55
+
+from django.db import migrations, models
+
+# the check-then-insert claim could store a claim more than once under
+# concurrent requests, only the oldest claim of a user is kept.
+DELETE_DUPLICATED_CLAIMS_SQL = """
+DELETE FROM user_discount WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY user_id, discount_id ORDER BY created_at, id
+        ) AS position
+        FROM user_discount
+    ) AS claims
+    WHERE position > 1
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0006_discount_enable_alter_discount_hide"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=DELETE_DUPLICATED_CLAIMS_SQL, reverse_sql=migrations.RunSQL.noop
+        ),
+        migrations.AddConstraint(
+            model_name="userdiscount",
+            constraint=models.UniqueConstraint(
+                fields=("user", "discount"), name="user_discount_unique_claim"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.0.4 on 2026-10-18 14:57
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0007_user_discount_unique_claim"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="discount",
+            name="used",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Total already claimed",
+                verbose_name="Used",
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE discount SET used = ("
+                "SELECT COUNT(*) FROM user_discount "
+                "WHERE user_discount.discount_id = discount.id)"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="discount",
+            index=models.Index(
+                django.db.models.expressions.F("brand"),
+                django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.F("quantity"),
+                    "-",
+                    django.db.models.expressions.F("used"),
+                ),
+                name="discount_brand_balance_idx",
+            ),
+        ),
+    ]
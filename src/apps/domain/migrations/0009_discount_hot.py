@@ -0,0 +1,22 @@
+# Generated by Django 4.0.4 on 2026-10-18 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0008_discount_used"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="discount",
+            name="hot",
+            field=models.BooleanField(
+                default=False,
+                help_text="Serve claims from a pre-allocated pool, for flash sales",
+                verbose_name="Hot",
+            ),
+        ),
+    ]
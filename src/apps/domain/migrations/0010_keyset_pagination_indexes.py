@@ -0,0 +1,30 @@
+# Generated by Django 4.0.4 on 2026-10-18 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0009_discount_hot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="discount",
+            index=models.Index(fields=["created_at", "id"], name="discount_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="userdiscount",
+            index=models.Index(
+                fields=["discount", "created_at", "id"],
+                name="user_discount_discount_keyset",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userdiscount",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="user_discount_user_keyset"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.0.4 on 2026-10-18 15:17
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0010_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxEvent",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created At"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Id",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.CharField(
+                        choices=[("discount.claimed", "discount.claimed")],
+                        max_length=64,
+                        verbose_name="Topic",
+                    ),
+                ),
+                ("payload", models.JSONField(default=dict, verbose_name="Payload")),
+            ],
+            options={
+                "verbose_name": "Outbox Event",
+                "verbose_name_plural": "Outbox Events",
+                "db_table": "outbox_event",
+                "ordering": ["created_at", "id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="outboxevent",
+            index=models.Index(
+                fields=["created_at", "id"], name="outbox_event_relay_order"
+            ),
+        ),
+    ]
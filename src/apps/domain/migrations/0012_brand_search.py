@@ -0,0 +1,86 @@
+# Generated by Django 4.0.4 on 2026-10-18 15:26
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# keeps ``brand.search_vector`` in sync with the name.
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE FUNCTION brand_search_vector() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('simple', coalesce(NEW.name, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER brand_search_vector
+BEFORE INSERT OR UPDATE OF name, search_vector ON brand
+FOR EACH ROW EXECUTE FUNCTION brand_search_vector();
+
+UPDATE brand SET search_vector = to_tsvector('simple', coalesce(name, ''));
+"""
+
+SEARCH_VECTOR_TRIGGER_REVERSE_SQL = """
+DROP TRIGGER IF EXISTS brand_search_vector ON brand;
+DROP FUNCTION IF EXISTS brand_search_vector();
+"""
+
+# serves the ``icontains`` searches on the brand name, which compare
+# ``UPPER(name)``, wherever the ``pg_trgm`` extension is available.
+TRIGRAM_INDEX_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS brand_name_trgm_idx
+            ON brand USING gin (UPPER(name::text) gin_trgm_ops);
+    END IF;
+END
+$$;
+"""
+
+TRIGRAM_INDEX_REVERSE_SQL = "DROP INDEX IF EXISTS brand_name_trgm_idx;"
+
+
+def run_on_postgresql(sql):
+    """
+    Returns a ``RunPython`` function running the SQL on PostgreSQL only,
+    other databases keep searching with the lookups.
+    """
+
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0011_outbox_event"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="brand",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="brand",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="brand_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(
+            run_on_postgresql(SEARCH_VECTOR_TRIGGER_SQL),
+            run_on_postgresql(SEARCH_VECTOR_TRIGGER_REVERSE_SQL),
+        ),
+        migrations.RunPython(
+            run_on_postgresql(TRIGRAM_INDEX_SQL),
+            run_on_postgresql(TRIGRAM_INDEX_REVERSE_SQL),
+        ),
+    ]
@@ -5,6 +5,10 @@ from apps.domain.models.user.models import User
 from apps.domain.models.brand.models import Brand
 from apps.domain.models.discount.models import Discount
 from apps.domain.models.user_discount.models import UserDiscount
+from apps.domain.models.outbox_event.models import OutboxEvent
+from apps.domain.models.brand import signals as brand_signals  # noqa
+from apps.domain.models.discount import signals as discount_signals  # noqa
+from apps.domain.models.user_discount import signals as user_discount_signals  # noqa
 from apps.domain.views import *  # noqa
 from django.db.models import CharField
 from django.db.models.signals import post_migrate
@@ -22,4 +26,8 @@ def enable_unaccent_postgres_extension(sender, *args, **kwargs):
     Unable unccent in database
     """
     db = Database()
+
+    if db.connection.vendor != "postgresql":
+        return
+
     db.execute("CREATE EXTENSION IF NOT EXISTS unaccent;")
@@ -0,0 +1,24 @@
+from django.utils.translation import gettext_lazy as _
+
+from commons.mail import send_mail
+
+
+def send_claims_digest_email(brand, discounts, connection=None):
+    """
+    Send the digest of the brand discounts claimed since the last one.
+
+    Args:
+        brand (domain.Brand, required): Brand of the discounts.
+        discounts (list<dict>, required): Claimed discounts, with their ``code``,
+            ``total`` of claims, claimer ``users`` and number of ``others``.
+        connection (BaseEmailBackend, optional): Connection to reuse between emails.
+    """
+    subject = _("Your discounts were claimed")
+
+    send_mail(
+        subject=subject,
+        template="email/brand/claims_digest.html",
+        to=brand.email,
+        context={"subject": subject, "brand": brand, "discounts": discounts},
+        connection=connection,
+    )
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -13,6 +15,9 @@ class Brand(Model):
 
     email = models.EmailField(_("Email"))
 
+    # maintained by the ``brand_search_vector`` trigger from ``name``.
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
     objects = BrandManager()
 
     class Meta:
@@ -20,6 +25,7 @@ class Brand(Model):
         verbose_name = _("Brand")
         verbose_name_plural = _("Brands")
         ordering = ["website"]
+        indexes = [GinIndex(fields=["search_vector"], name="brand_search_vector_idx")]
 
     def __str__(self):
         return self.website
@@ -0,0 +1,20 @@
+"""
+Keep the cached discount catalog up to date.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.domain.enums import CacheNamespace
+from apps.domain.models.brand.models import Brand
+from commons.api.cache import response_cache
+
+
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+def invalidate_catalog_cache(sender, instance, **kwargs):  # noqa
+    """
+    Invalidate the cached catalog once the change is committed.
+    """
+    namespace = CacheNamespace.DISCOUNT_CATALOG.value
+    transaction.on_commit(lambda: response_cache.bump(namespace))
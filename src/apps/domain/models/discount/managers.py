@@ -1,13 +1,199 @@
-from django.db import models
+import uuid
+
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+
+from apps.domain.enums import CacheNamespace, ClaimStatus, OutboxTopic
+from commons.api.cache import response_cache
 from commons.models.subquery import SubqueryCount
 
+# Claims a discount code in a single statement. The conditional update of the
+# ``used`` counter locks the discount row and is re-evaluated against its
+# latest version, so concurrent claims can never oversell the discount. The
+# duplication check is backed by the ``user_discount_unique_claim`` constraint.
+# The claim event is written to the outbox by the same statement, so it is
+# published only if the claim commits.
+CLAIM_SQL = """
+WITH target AS (
+    SELECT discount.* FROM discount WHERE discount.id = %(discount)s
+), duplicated AS (
+    SELECT EXISTS (
+        SELECT 1 FROM user_discount
+        WHERE discount_id = %(discount)s AND user_id = %(user)s
+    ) AS duplicated
+), updated AS (
+    UPDATE discount SET used = discount.used + 1
+    FROM duplicated
+    WHERE discount.id = %(discount)s
+        AND discount.enable
+        AND discount.used < discount.quantity
+        AND NOT duplicated.duplicated
+        AND (%(hot)s OR NOT discount.hot)
+    RETURNING discount.id
+), inserted AS (
+    INSERT INTO user_discount (id, created_at, updated_at, discount_id, user_id)
+    SELECT %(id)s, %(now)s, %(now)s, updated.id, %(user)s FROM updated
+    RETURNING id
+), outbox AS (
+    INSERT INTO outbox_event (id, created_at, updated_at, topic, payload)
+    SELECT %(event)s, %(now)s, %(now)s, %(topic)s, jsonb_build_object(
+        'brand', target.brand_id::text,
+        'discount', target.code,
+        'user', %(user)s::text
+    )
+    FROM inserted, target
+)
+SELECT
+    target.*,
+    duplicated.duplicated,
+    EXISTS (SELECT 1 FROM inserted) AS claimed
+FROM target, duplicated
+"""
+
 
 class DiscountQuerySet(models.QuerySet):
-    def with_used(self):
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Create the discounts and invalidate the cached catalog once
+        committed, as ``post_save`` is not sent by ``bulk_create``.
+        """
+        objs = super().bulk_create(objs, *args, **kwargs)
+
+        namespace = CacheNamespace.DISCOUNT_CATALOG.value
+        transaction.on_commit(lambda: response_cache.bump(namespace), using=self.db)
+        return objs
+
+    def set_flags(self, **flags):
+        """
+        Set the ``enable`` and ``hide`` flags of the discounts in a single
+        update, bumping ``updated_at``.
+
+        As ``post_save`` is not sent, the claim pool of the hot discounts
+        and the cached catalog are refreshed here, once for all discounts.
+
+        Returns:
+            int
+        """
+        pks = list(self.values_list("pk", flat=True))
+
+        if not pks:
+            return 0
+
+        with transaction.atomic(using=self.db):
+            updated = (
+                self.model.objects.using(self.db)
+                .filter(pk__in=pks)
+                .update(updated_at=timezone.now(), **flags)
+            )
+
+            hot = self.model.objects.using(self.db).filter(pk__in=pks, hot=True)
+            transaction.on_commit(hot.sync_claim_pool, using=self.db)
+
+            namespace = CacheNamespace.DISCOUNT_CATALOG.value
+            transaction.on_commit(lambda: response_cache.bump(namespace), using=self.db)
+
+        return updated
+
+    def with_balance(self):
+        """
+        Annotate ``balance`` to queryset.
+        """
+        return self.annotate(balance=models.F("quantity") - models.F("used"))
+
+    def reconcile_used(self):
+        """
+        Recompute the ``used`` counter from the claimed discounts.
+
+        Rows are locked before counting, so claims committed while
+        waiting for the lock are not missed.
+
+        Returns:
+            int
+        """
         from apps.domain.models import UserDiscount
 
-        balance_qs = UserDiscount.objects.filter(discount_id=models.OuterRef("id"))
-        return self.annotate(used=SubqueryCount(balance_qs))
+        with transaction.atomic(using=self.db):
+            pks = list(self.select_for_update().values_list("pk", flat=True))
+
+            used_qs = UserDiscount.objects.filter(discount_id=models.OuterRef("id"))
+            return (
+                self.model.objects.using(self.db)
+                .filter(pk__in=pks)
+                .update(used=SubqueryCount(used_qs))
+            )
+
+    def sync_claim_pool(self):
+        """
+        Load hot discounts into the claim pool and unload the other ones.
+        """
+        from apps.crosscutting.claim_pool import claim_pool
+        from apps.domain.models import UserDiscount
+
+        for discount in self.only("pk", "quantity", "hot", "enable"):
+            if not (discount.hot and discount.enable):
+                claim_pool.unload(discount.pk)
+                continue
+
+            user_ids = UserDiscount.objects.filter(discount_id=discount.pk).values_list(
+                "user_id", flat=True
+            )
+
+            claim_pool.sync(discount.pk, discount.quantity, user_ids=list(user_ids))
+
+    def claim(self, discount_id, user_id, hot=True):
+        """
+        Claim a discount code to a user.
+
+        Args:
+            discount_id (uuid.UUID, required): Discount to be claimed.
+            user_id (uuid.UUID, required): User that is claiming the discount.
+            hot (bool, optional): Claim hot discounts too. Otherwise, they are
+                left to the claim pool and returned with a ``None`` status.
+
+        Returns:
+            tuple<ClaimStatus, Discount>
+        """
+        params = {
+            "hot": hot,
+            "id": uuid.uuid4(),
+            "now": timezone.now(),
+            "discount": discount_id,
+            "user": user_id,
+            "event": uuid.uuid4(),
+            "topic": OutboxTopic.DISCOUNT_CLAIMED.value,
+        }
+
+        try:
+            with transaction.atomic(using=self.db):
+                discount = next(iter(self.raw(CLAIM_SQL, params)), None)
+
+        except IntegrityError as exc:
+            constraint = getattr(
+                getattr(exc.__cause__, "diag", None), "constraint_name", None
+            )
+
+            if constraint != "user_discount_unique_claim":
+                raise
+
+            # a concurrent claim from the same user won the race.
+            return ClaimStatus.DUPLICATED, None
+
+        if discount is None:
+            return ClaimStatus.NOT_FOUND, None
+
+        if discount.duplicated:
+            return ClaimStatus.DUPLICATED, discount
+
+        if not discount.enable:
+            return ClaimStatus.DISABLED, discount
+
+        if not discount.claimed:
+            if discount.hot and not hot:
+                return None, discount
+
+            return ClaimStatus.SOLD_OUT, discount
+
+        return ClaimStatus.CLAIMED, discount
 
 
 class DiscountManager(models.Manager.from_queryset(DiscountQuerySet)):
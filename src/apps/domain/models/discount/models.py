@@ -15,10 +15,20 @@ class Discount(Model):
         _("Quantity"), help_text=_("Total that can be used")
     )
 
+    used = models.PositiveIntegerField(
+        _("Used"), default=0, editable=False, help_text=_("Total already claimed")
+    )
+
     hide = models.BooleanField(_("Hide"), default=False)
 
     enable = models.BooleanField(_("Enable"), default=True)
 
+    hot = models.BooleanField(
+        _("Hot"),
+        default=False,
+        help_text=_("Serve claims from a pre-allocated pool, for flash sales"),
+    )
+
     brand = models.ForeignKey(
         "domain.Brand",
         verbose_name=_("Brand"),
@@ -33,6 +43,43 @@ class Discount(Model):
         verbose_name = _("Discount")
         verbose_name_plural = _("Discounts")
         ordering = ["code"]
+        indexes = [
+            models.Index(
+                "brand",
+                models.F("quantity") - models.F("used"),
+                name="discount_brand_balance_idx",
+            ),
+            models.Index(fields=["created_at", "id"], name="discount_keyset_idx"),
+        ]
 
     def __str__(self):
         return self.code
+
+    def save(self, *args, **kwargs):
+        """
+        Save the discount, leaving out the ``used`` counter once created.
+        It is only changed by the claims and ``reconcile_used`` with single
+        statement updates, a stale instance must not overwrite it.
+        """
+        if not self._state.adding and not kwargs.get("force_insert"):
+            update_fields = kwargs.get("update_fields")
+
+            if update_fields is None:
+                deferred = self.get_deferred_fields()
+                update_fields = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.attname not in deferred
+                ]
+
+            kwargs["update_fields"] = [name for name in update_fields if name != "used"]
+
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+
+        # whether the stored discount is hot, see ``sync_claim_pool_on_save``.
+        instance._stored_hot = dict(zip(field_names, values)).get("hot")
+        return instance
@@ -0,0 +1,48 @@
+"""
+Keep hot discounts loaded into the claim pool and
+the cached discount catalog up to date.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.domain.enums import CacheNamespace
+from apps.domain.models.discount.models import Discount
+from commons.api.cache import response_cache
+
+
+@receiver(post_save, sender=Discount)
+def sync_claim_pool_on_save(sender, instance, created=False, **kwargs):  # noqa
+    """
+    Load, reconcile or unload the discount once the change is committed.
+    Discounts that neither are nor were hot are never in the pool.
+    """
+    was_hot = not created and getattr(instance, "_stored_hot", None) is not False
+    instance._stored_hot = instance.hot
+
+    if not (instance.hot or was_hot):
+        return
+
+    transaction.on_commit(
+        lambda: sender.objects.filter(pk=instance.pk).sync_claim_pool()
+    )
+
+
+@receiver(post_delete, sender=Discount)
+def unload_claim_pool_on_delete(sender, instance, **kwargs):  # noqa
+    """
+    Forget the discount from the claim pool.
+    """
+    from apps.crosscutting.claim_pool import claim_pool
+
+    transaction.on_commit(lambda: claim_pool.unload(instance.pk, purge=True))
+
+
+@receiver(post_save, sender=Discount)
+@receiver(post_delete, sender=Discount)
+def invalidate_catalog_cache(sender, instance, **kwargs):  # noqa
+    """
+    Invalidate the cached catalog once the change is committed.
+    """
+    namespace = CacheNamespace.DISCOUNT_CATALOG.value
+    transaction.on_commit(lambda: response_cache.bump(namespace))
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class OutboxEventQuerySet(models.QuerySet):
+    def next_batch(self, size):
+        """
+        Lock the oldest events not locked by other relays.
+
+        Must be called inside a transaction, the locks are held until
+        it ends.
+
+        Args:
+            size (int, required): Max number of events.
+
+        Returns:
+            list<OutboxEvent>
+        """
+        return list(
+            self.select_for_update(skip_locked=True).order_by("created_at", "id")[:size]
+        )
+
+
+class OutboxEventManager(models.Manager.from_queryset(OutboxEventQuerySet)):
+    pass
@@ -0,0 +1,34 @@
+from django.db import models
+from commons.models.base import Model
+from django.utils.translation import gettext_lazy as _
+from apps.domain.enums import OutboxTopic
+from apps.domain.models.outbox_event.managers import OutboxEventManager
+
+
+class OutboxEvent(Model):
+    """
+    Side effect of a change, written in the same transaction as the
+    change and published later by the outbox relay.
+    """
+
+    topic = models.CharField(
+        verbose_name=_("Topic"),
+        max_length=64,
+        choices=[(topic.value, topic.value) for topic in OutboxTopic],
+    )
+
+    payload = models.JSONField(verbose_name=_("Payload"), default=dict)
+
+    objects = OutboxEventManager()
+
+    class Meta:
+        db_table = "outbox_event"
+        verbose_name = _("Outbox Event")
+        verbose_name_plural = _("Outbox Events")
+        ordering = ["created_at", "id"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="outbox_event_relay_order"),
+        ]
+
+    def __str__(self):
+        return f"{self.topic} ({self.id})"
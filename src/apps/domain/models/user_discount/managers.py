@@ -1,9 +1,26 @@
 from django.db import models
 from commons.models.subquery import SubqueryCount
 
+# columns of the claim history exports, see ``UserDiscountQuerySet.history``.
+HISTORY_COLUMNS = ["id", "claimed_at", "code", "user_id", "first_name", "email"]
+
 
 class UserDiscountQuerySet(models.QuerySet):
-    pass
+    def history(self):
+        """
+        Claim history as flat rows, in claim order.
+
+        Returns:
+            django.db.Queryset<dict>
+        """
+        return self.order_by("created_at", "id").values(
+            "id",
+            "user_id",
+            claimed_at=models.F("created_at"),
+            code=models.F("discount__code"),
+            first_name=models.F("user__first_name"),
+            email=models.F("user__email"),
+        )
 
 
 class UserDiscountManager(models.Manager.from_queryset(UserDiscountQuerySet)):
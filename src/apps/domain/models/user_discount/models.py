@@ -26,6 +26,20 @@ class UserDiscount(Model):
         verbose_name = _("User Discount")
         verbose_name_plural = _("User Discounts")
         ordering = ["pk"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "discount"], name="user_discount_unique_claim"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["discount", "created_at", "id"],
+                name="user_discount_discount_keyset",
+            ),
+            models.Index(
+                fields=["user", "created_at", "id"], name="user_discount_user_keyset"
+            ),
+        ]
 
     def __str__(self):
         return str(self.id)
@@ -0,0 +1,59 @@
+"""
+Keep the ``Discount.used`` counter in sync with claims made outside
+``DiscountQuerySet.claim``, like administration panel edits and cascades.
+"""
+from django.db import models
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.domain.models.discount.models import Discount
+from apps.domain.models.user_discount.models import UserDiscount
+
+
+def _increment_used(discount_id, amount):
+    queryset = Discount.objects.filter(pk=discount_id)
+
+    if amount < 0:
+        # never let the counter get negative.
+        queryset = queryset.filter(used__gte=-amount)
+
+    queryset.update(used=models.F("used") + amount)
+
+
+@receiver(pre_save, sender=UserDiscount)
+def track_user_discount_change(sender, instance, **kwargs):  # noqa
+    """
+    Store the previous discount of a changed claim.
+    """
+    if instance._state.adding:  # noqa
+        return
+
+    instance._previous_discount_id = (  # noqa
+        sender.objects.filter(pk=instance.pk)
+        .values_list("discount_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=UserDiscount)
+def update_used_on_save(sender, instance, created, **kwargs):  # noqa
+    """
+    Count new claims and move changed claims between discounts.
+    """
+    if created:
+        _increment_used(instance.discount_id, 1)
+        return
+
+    previous_discount_id = getattr(instance, "_previous_discount_id", None)
+
+    if previous_discount_id and previous_discount_id != instance.discount_id:
+        _increment_used(previous_discount_id, -1)
+        _increment_used(instance.discount_id, 1)
+
+
+@receiver(post_delete, sender=UserDiscount)
+def update_used_on_delete(sender, instance, **kwargs):  # noqa
+    """
+    Release deleted claims.
+    """
+    _increment_used(instance.discount_id, -1)
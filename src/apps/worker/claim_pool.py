@@ -0,0 +1,103 @@
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from apps.crosscutting.claim_pool import claim_pool
+from apps.domain.enums import OutboxTopic
+from celery_app import app as celery
+
+logger = get_task_logger(__name__)
+
+
+@celery.task(name="persist_claim_pool", soft_time_limit=3600)
+def persist_claim_pool(batch_size=None):
+    """
+    Persist the claims accepted by the claim pool into ``user_discount``.
+    """
+    from apps.domain.models import Discount, OutboxEvent, UserDiscount
+
+    batch_size = batch_size or settings.CLAIM_POOL_PERSIST_BATCH_SIZE
+    total = 0
+
+    while claims := claim_pool.dequeue(batch_size):
+        try:
+            with transaction.atomic():
+                discounts = {
+                    str(pk): (brand_id, code)
+                    for pk, brand_id, code in Discount.objects.filter(
+                        pk__in={d for d, _ in claims}
+                    ).values_list("pk", "brand_id", "code")
+                }
+                persisted = {
+                    (str(d), str(u))
+                    for d, u in UserDiscount.objects.filter(
+                        discount_id__in=discounts, user_id__in={u for _, u in claims}
+                    ).values_list("discount_id", "user_id")
+                }
+
+                # claims are idempotent, re-queued claims that were
+                # already persisted are just ignored.
+                UserDiscount.objects.bulk_create(
+                    [UserDiscount(discount_id=d, user_id=u) for d, u in claims],
+                    ignore_conflicts=True,
+                )
+                OutboxEvent.objects.bulk_create(
+                    [
+                        OutboxEvent(
+                            topic=OutboxTopic.DISCOUNT_CLAIMED.value,
+                            payload={
+                                "brand": str(discounts[d][0]),
+                                "discount": discounts[d][1],
+                                "user": u,
+                            },
+                        )
+                        for d, u in dict.fromkeys(claims)
+                        if d in discounts and (d, u) not in persisted
+                    ]
+                )
+                Discount.objects.filter(pk__in=discounts).reconcile_used()
+
+        except DatabaseError:
+            # give the claims back to be persisted later.
+            claim_pool.enqueue(claims)
+            raise
+
+        total += len(claims)
+
+    logger.info("%s claims persisted from the claim pool.", total)
+    return total
+
+
+@celery.task(name="reconcile_claim_pool", soft_time_limit=3600)
+def reconcile_claim_pool():
+    """
+    Compare the claim pool of hot discounts against ``user_discount``.
+
+    Claims registered in the pool but never persisted (e.g. a worker crash
+    after dequeuing) are queued again, claims persisted but unknown by the
+    pool are registered, and the remaining codes are recomputed.
+    """
+    from apps.domain.models import Discount, UserDiscount
+
+    requeued = 0
+
+    for discount in Discount.objects.filter(hot=True, enable=True).only(
+        "pk", "quantity"
+    ):
+        persisted = set(
+            map(
+                str,
+                UserDiscount.objects.filter(discount_id=discount.pk).values_list(
+                    "user_id", flat=True
+                ),
+            )
+        )
+
+        missing = claim_pool.claimers(discount.pk) - persisted
+        claim_pool.enqueue([(str(discount.pk), user_id) for user_id in missing])
+        claim_pool.sync(discount.pk, discount.quantity, user_ids=persisted)
+
+        requeued += len(missing)
+
+    logger.info("%s claims re-queued by the claim pool reconciliation.", requeued)
+    return requeued
@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from apps.domain.models.user_discount.managers import HISTORY_COLUMNS
+from celery_app import app as celery
+from commons.api.export import EXPORT_FORMATS, EXPORT_READY_FILENAME
+from commons.djutils.upload import upload_file
+
+logger = get_task_logger(__name__)
+
+
+@celery.task(name="export_discount_history", soft_time_limit=3600)
+def export_discount_history(discount_id, export_format, path):
+    """
+    Write the claim history of a discount to the storage.
+
+    The file is spooled to disk while the rows are streamed from a
+    server-side cursor, so memory stays constant for any history size.
+    Once it is stored, ``EXPORT_READY_FILENAME`` is written next to it.
+
+    Args:
+        discount_id (str, required): Discount to be exported.
+        export_format (str, required): One of ``EXPORT_FORMATS``.
+        path (str, required): Storage path of the file.
+
+    Returns:
+        str
+    """
+    from apps.domain.models import UserDiscount
+
+    encode = EXPORT_FORMATS[export_format][2]
+    rows = (
+        UserDiscount.objects.filter(discount_id=discount_id)
+        .history()
+        .iterator(chunk_size=settings.HISTORY_EXPORT_CHUNK_SIZE)
+    )
+
+    with tempfile.TemporaryFile() as stream:
+        for chunk in encode(rows, HISTORY_COLUMNS):
+            stream.write(chunk.encode("utf-8"))
+
+        stream.seek(0)
+        upload_path, filename = os.path.split(path)
+        name = upload_file(stream, upload_path, filename=filename)
+
+    default_storage.save(
+        f"{upload_path}/{EXPORT_READY_FILENAME}",
+        ContentFile(f"{name}\n".encode("utf-8")),
+    )
+
+    logger.info("Claim history of discount %s exported to %s.", discount_id, name)
+    return name
@@ -0,0 +1,135 @@
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.core import mail
+
+from apps.crosscutting.notification_queue import notification_queue
+from celery_app import app as celery
+
+logger = get_task_logger(__name__)
+
+
+def _add_to_digests(digests, events, max_users):
+    """
+    Add the claim events to the digest of their brand, which groups them
+    by discount code, keeping the first ``max_users`` claimers of each code.
+    Events with a ``count`` stand for that many claims by other users.
+    """
+    for event in events:
+        discounts = digests.setdefault(event["brand"], {})
+        discount = discounts.setdefault(
+            event["discount"], {"code": event["discount"], "total": 0, "users": []}
+        )
+        discount["total"] += event.get("count", 1)
+
+        if event["user"] is not None and len(discount["users"]) < max_users:
+            discount["users"].append(event["user"])
+
+
+def _get_digest_events(brand_id, discounts):
+    """
+    Returns the events the digest of a brand is built from again: one per
+    kept claimer and one counting the other claims of each code.
+    """
+    events = []
+
+    for discount in discounts.values():
+        event = {"brand": brand_id, "discount": discount["code"]}
+        events.extend({**event, "user": user} for user in discount["users"])
+
+        if others := discount["total"] - len(discount["users"]):
+            events.append({**event, "user": None, "count": others})
+
+    return events
+
+
+def _send_digests(digests, connection):
+    """
+    Send the digest of each brand.
+
+    Returns:
+        int
+    """
+    from apps.domain.models import Brand, User
+    from apps.domain.models.brand.emails import send_claims_digest_email
+
+    brands = {
+        str(pk): brand for pk, brand in Brand.objects.in_bulk(list(digests)).items()
+    }
+    users = {
+        str(pk): user.full_name
+        for pk, user in User.objects.in_bulk(
+            {
+                user
+                for discounts in digests.values()
+                for x in discounts.values()
+                for user in x["users"]
+            }
+        ).items()
+    }
+
+    sent = 0
+
+    try:
+        for brand_id in list(digests):
+            if (brand := brands.get(brand_id)) is not None:
+                discounts = [
+                    {
+                        **discount,
+                        "users": [users[x] for x in discount["users"] if x in users],
+                        "others": discount["total"] - len(discount["users"]),
+                    }
+                    for discount in digests[brand_id].values()
+                ]
+                send_claims_digest_email(brand, discounts, connection=connection)
+                sent += 1
+
+            del digests[brand_id]
+
+    except Exception:
+        # give the claims of the brands not notified back to the queue.
+        notification_queue.push(
+            [
+                event
+                for brand_id, discounts in digests.items()
+                for event in _get_digest_events(brand_id, discounts)
+            ]
+        )
+        raise
+
+    return sent
+
+
+@celery.task(name="send_notification_digests", soft_time_limit=3600)
+def send_notification_digests(batch_size=None, max_events=None):
+    """
+    Drain the notification queue in batches and send one digest per brand
+    with all the claims of the window, through a single mail connection.
+
+    The events are added to the digests batch by batch and only the digests
+    are kept, i.e. the claim counts and the first claimers of each code.
+    At most ``max_events`` events are drained per run, the rest are left
+    to the next run.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_DIGEST_BATCH_SIZE
+    max_events = max_events or settings.NOTIFICATION_DIGEST_MAX_EVENTS
+
+    digests = {}
+    popped = 0
+
+    while popped < max_events:
+        events = notification_queue.pop(min(batch_size, max_events - popped))
+
+        if not events:
+            break
+
+        popped += len(events)
+        _add_to_digests(digests, events, settings.NOTIFICATION_DIGEST_MAX_USERS)
+
+    if not digests:
+        return 0
+
+    with mail.get_connection() as connection:
+        sent = _send_digests(digests, connection)
+
+    logger.info("%s notification digests sent.", sent)
+    return sent
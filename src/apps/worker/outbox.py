@@ -0,0 +1,62 @@
+from collections import defaultdict
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import transaction
+
+from apps.crosscutting.notification_queue import notification_queue
+from apps.domain.enums import OutboxTopic
+from celery_app import app as celery
+
+logger = get_task_logger(__name__)
+
+
+def publish_discount_claimed(payloads):
+    """
+    Queue the claims to be notified to the brands in the next digest.
+    """
+    notification_queue.push(payloads)
+
+
+# publishers of each topic, receiving all payloads of a batch at once.
+PUBLISHERS = {
+    OutboxTopic.DISCOUNT_CLAIMED.value: publish_discount_claimed,
+}
+
+
+@celery.task(name="relay_outbox", soft_time_limit=3600)
+def relay_outbox(batch_size=None):
+    """
+    Publish the outbox events in batches and delete them.
+
+    Each batch is locked with ``FOR UPDATE SKIP LOCKED``, so concurrent
+    relays never publish the same event, and deleted in the transaction
+    that published it. An event may be published again if the commit
+    fails after publishing, consumers must tolerate duplicates.
+    """
+    from apps.domain.models import OutboxEvent
+
+    batch_size = batch_size or settings.OUTBOX_RELAY_BATCH_SIZE
+    total = 0
+
+    while True:
+        with transaction.atomic():
+            events = OutboxEvent.objects.next_batch(batch_size)
+
+            if not events:
+                break
+
+            payloads_by_topic = defaultdict(list)
+
+            for event in events:
+                payloads_by_topic[event.topic].append(event.payload)
+
+            for topic, payloads in payloads_by_topic.items():
+                PUBLISHERS[topic](payloads)
+
+            OutboxEvent.objects.filter(pk__in=[event.pk for event in events]).delete()
+
+        total += len(events)
+
+    logger.info("%s outbox events relayed.", total)
+    return total
@@ -1,3 +1,15 @@
 from apps.worker.send_email import send_notification, example_task
+from apps.worker.claim_pool import persist_claim_pool, reconcile_claim_pool
+from apps.worker.notifications import send_notification_digests
+from apps.worker.outbox import relay_outbox
+from apps.worker.exports import export_discount_history
 
-__all__ = ["send_notification", "example_task"]
+__all__ = [
+    "send_notification",
+    "example_task",
+    "persist_claim_pool",
+    "reconcile_claim_pool",
+    "send_notification_digests",
+    "relay_outbox",
+    "export_discount_history",
+]
@@ -0,0 +1,56 @@
+"""
+Benchmarks of the discount service.
+
+Run them from ``src`` as modules, e.g. ``python -m benchmarks.pagination``.
+Each benchmark seeds and drops its own test database, so they never touch
+the configured database data.
+"""
+import contextlib
+import os
+import statistics
+import time
+
+
+def setup(settings_module="settings.test"):
+    """
+    Configure django to run a benchmark.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+
+    django.setup()
+
+
+@contextlib.contextmanager
+def test_database():
+    """
+    Run the benchmark inside a throwaway test database.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+    try:
+        yield
+
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, repeat=5):
+    """
+    Returns the median duration of the function in milliseconds.
+    """
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(durations)
@@ -0,0 +1,65 @@
+"""
+Compare creating discounts with one request each against a single
+bulk create request.
+
+Usage: python -m benchmarks.bulk_create [discounts]
+"""
+import sys
+import time
+
+from benchmarks import setup, test_database
+
+
+def payload(discounts):
+    return [
+        {
+            "code": f"BENCH{i}",
+            "description": "Benchmark",
+            "quantity": 100,
+            "hide": False,
+            "enable": True,
+        }
+        for i in range(discounts)
+    ]
+
+
+def run(discounts):
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+
+    from apps.api.permissions import UserRoleEnum
+    from apps.domain import models
+
+    brand = models.Brand.objects.create(
+        name="Brand", website="https://brand.com", email="brand@brand.com"
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"{UserRoleEnum.BRAND.value} {brand.pk}")
+    data = payload(discounts)
+
+    start = time.perf_counter()
+
+    for item in data:
+        client.post(reverse("api:brand-discount-create"), data=item, format="json")
+
+    single = time.perf_counter() - start
+    models.Discount.objects.all().delete()
+
+    start = time.perf_counter()
+    response = client.post(reverse("api:brand-discount-bulk"), data=data, format="json")
+    bulk = time.perf_counter() - start
+
+    assert response.status_code == 201, response.content
+    assert models.Discount.objects.count() == discounts
+
+    print(f"{discounts} discounts")
+    print(f"{'endpoint':<10} {'requests':>9} {'seconds':>10} {'discounts/s':>12}")
+    print(f"{'single':<10} {discounts:>9} {single:>10.2f} {discounts / single:>12.0f}")
+    print(f"{'bulk':<10} {1:>9} {bulk:>10.2f} {discounts / bulk:>12.0f}")
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(discounts=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
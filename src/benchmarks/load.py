@@ -0,0 +1,423 @@
+"""
+Load test of the main api endpoints. Seeds a database with the
+``seed_benchmark`` command, mints a token per user and brand, and sends
+concurrent requests to the discount list, fetch (claim), brand history
+and user profile endpoints. Reports the throughput, the p50, p95 and
+p99 latencies and the queries per request of each endpoint, and compares
+them with a stored baseline.
+
+The requests are served in process by default, through django's test
+client, so the latencies leave out the http server and the concurrency
+is bound by the GIL. With ``--gunicorn``, they are sent over http to
+local gunicorn workers instead, when gunicorn is installed.
+
+Usage: python -m benchmarks.load [--requests 500] [--concurrency 8] [--gunicorn]
+           [--baseline benchmarks/baseline.json] [--save]
+
+Exits with status 1 when an endpoint regresses against the baseline.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from benchmarks import setup, test_database
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+ENDPOINTS = ["list", "fetch", "history", "profile"]
+
+# the queries counted by ``commons.middleware.ServerTimingMiddleware``.
+QUERIES_RE = re.compile(r'(?:^|,)\s*db;[^,]*desc="(\d+)"')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--brands", type=int, default=100)
+    parser.add_argument("--discounts", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--claims", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Requests per endpoint."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Concurrent clients."
+    )
+    parser.add_argument(
+        "--gunicorn", action="store_true", help="Serve the requests with gunicorn."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Gunicorn worker processes."
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the baseline."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed throughput and latency regression, 0.2 is 20%%.",
+    )
+    return parser.parse_args(argv)
+
+
+class InProcessDriver:
+    """
+    Sends the requests through django's test client, one client per thread.
+    """
+
+    name = "wsgi"
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def get(self, url, token):
+        from django.test import Client
+
+        if not hasattr(self.local, "client"):
+            self.local.client = Client()
+
+        response = self.local.client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+        return response.status_code, response.get("Server-Timing", "")
+
+    def close(self):
+        """
+        Called by each thread when it is done.
+        """
+        from django.db import connections
+
+        connections.close_all()
+
+
+class GunicornDriver:
+    """
+    Starts local gunicorn workers on the seeded database and sends the
+    requests over http, one session per thread.
+    """
+
+    name = "gunicorn"
+
+    def __init__(self, workers):
+        from django.db import connection
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.local = threading.local()
+        self.process = subprocess.Popen(
+            [
+                shutil.which("gunicorn"),
+                "wsgi:application",
+                f"--bind=127.0.0.1:{port}",
+                f"--workers={workers}",
+                "--log-level=warning",
+            ],
+            cwd=Path(__file__).parent.parent,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": "benchmarks.settings",
+                "BENCHMARK_DATABASE_NAME": connection.settings_dict["NAME"],
+            },
+        )
+        self.wait(port)
+
+    def wait(self, port, timeout=30):
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError("gunicorn exited before serving requests.")
+
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                return
+
+            except OSError:
+                time.sleep(0.1)
+
+        self.stop()
+        raise RuntimeError("gunicorn did not start in time.")
+
+    def get(self, url, token):
+        import requests
+
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+
+        response = self.local.session.get(
+            self.base_url + url, headers={"Authorization": f"Bearer {token}"}
+        )
+        return response.status_code, response.headers.get("Server-Timing", "")
+
+    def close(self):
+        if hasattr(self.local, "session"):
+            self.local.session.close()
+
+    def stop(self):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+def make_requests(endpoint, count, seed):
+    """
+    Returns the ``(url, token)`` of each request to an endpoint, the same
+    for the same seed and seeded data.
+    """
+    from django.urls import reverse
+
+    from apps.api.shortcuts import generate_user_token
+    from apps.domain import models
+
+    rng = random.Random(f"{seed}-{endpoint}")
+    users = list(models.User.objects.order_by("pk"))
+    tokens = {}
+
+    def token(instance):
+        if instance.pk not in tokens:
+            tokens[instance.pk] = generate_user_token(instance)
+
+        return tokens[instance.pk]
+
+    if endpoint == "list":
+        url = reverse("api:discount-list")
+        return [(url, token(rng.choice(users))) for _ in range(count)]
+
+    if endpoint == "profile":
+        url = reverse("api:user-profile")
+        return [(url, token(rng.choice(users))) for _ in range(count)]
+
+    discounts = list(models.Discount.objects.select_related("brand").order_by("pk"))
+
+    if endpoint == "fetch":
+        # claimed, duplicated, sold out and disabled claims.
+        return [
+            (
+                reverse("api:discount-fetch", args=[rng.choice(discounts).pk]),
+                token(rng.choice(users)),
+            )
+            for _ in range(count)
+        ]
+
+    if endpoint == "history":
+        return [
+            (
+                reverse("api:brand-discount-history", args=[discount.pk]),
+                token(discount.brand),
+            )
+            for discount in (rng.choice(discounts) for _ in range(count))
+        ]
+
+    raise ValueError(f"Unknown endpoint '{endpoint}'.")
+
+
+def percentile(values, percent):
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def run_endpoint(driver, requests, concurrency):
+    """
+    Sends the requests from concurrent threads.
+
+    Returns:
+        dict: Throughput, latencies (ms), queries per request and status counts.
+    """
+    results = []
+    chunks = [requests[i::concurrency] for i in range(concurrency)]
+
+    def work(chunk):
+        try:
+            for url, token in chunk:
+                start = time.perf_counter()
+                status, server_timing = driver.get(url, token)
+                duration = (time.perf_counter() - start) * 1000
+                match = QUERIES_RE.search(server_timing)
+                # list.append is atomic, no lock needed.
+                results.append((duration, status, int(match[1]) if match else 0))
+
+        finally:
+            driver.close()
+
+    threads = [threading.Thread(target=work, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+    durations = [duration for duration, _, _ in results]
+    queries = [count for _, _, count in results]
+    statuses = {}
+
+    for _, status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    return {
+        "throughput": round(len(results) / elapsed, 1),
+        "p50": round(percentile(durations, 50), 2),
+        "p95": round(percentile(durations, 95), 2),
+        "p99": round(percentile(durations, 99), 2),
+        "queries": round(statistics.mean(queries), 2),
+        "max_queries": max(queries),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns the regressions of the results against the baseline. Slower
+    throughput and latencies are allowed up to the tolerance, but not
+    a single extra query per request.
+    """
+    regressions = []
+
+    for endpoint, result in results.items():
+        if endpoint not in baseline:
+            continue
+
+        expected = baseline[endpoint]
+
+        if result["throughput"] < expected["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{endpoint}: throughput {result['throughput']:.0f} req/s "
+                f"< {expected['throughput']:.0f} req/s"
+            )
+
+        for name in ["p50", "p95", "p99"]:
+            if result[name] > expected[name] * (1 + tolerance):
+                regressions.append(
+                    f"{endpoint}: {name} {result[name]:.1f}ms > {expected[name]:.1f}ms"
+                )
+
+        if result["max_queries"] > expected["max_queries"]:
+            regressions.append(
+                f"{endpoint}: {result['max_queries']} queries per request "
+                f"> {expected['max_queries']}"
+            )
+
+    return regressions
+
+
+def report(results, baseline):
+    print(
+        f"{'endpoint':<10} {'req/s':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} "
+        f"{'p99 (ms)':>9} {'queries':>8} {'baseline req/s':>15}  statuses"
+    )
+
+    for endpoint, result in results.items():
+        expected = baseline.get(endpoint, {}).get("throughput")
+        expected = f"{expected:.0f}" if expected else "-"
+        statuses = " ".join(f"{k}x{v}" for k, v in result["statuses"].items())
+        print(
+            f"{endpoint:<10} {result['throughput']:>8.0f} {result['p50']:>9.1f} "
+            f"{result['p95']:>9.1f} {result['p99']:>9.1f} "
+            f"{result['queries']:>8.1f} {expected:>15}  {statuses}"
+        )
+
+
+def run(options):
+    from django.core.management import call_command
+
+    # the log lines are built, but not printed.
+    logging.getLogger("commons.server_timing").handlers = [logging.NullHandler()]
+
+    call_command(
+        "seed_benchmark",
+        brands=options.brands,
+        discounts=options.discounts,
+        users=options.users,
+        claims=options.claims,
+        seed=options.seed,
+    )
+
+    if options.gunicorn and not shutil.which("gunicorn"):
+        print("gunicorn is not installed, serving the requests in process.")
+        options.gunicorn = False
+
+    driver = GunicornDriver(options.workers) if options.gunicorn else InProcessDriver()
+    parameters = {
+        "driver": driver.name,
+        **{
+            name: getattr(options, name)
+            for name in [
+                "brands",
+                "discounts",
+                "users",
+                "claims",
+                "seed",
+                "requests",
+                "concurrency",
+            ]
+        },
+    }
+
+    try:
+        results = {}
+
+        for endpoint in ENDPOINTS:
+            requests = make_requests(endpoint, options.requests, options.seed)
+            # warm up connections, caches and lazy imports.
+            run_endpoint(driver, requests[: options.concurrency], options.concurrency)
+            results[endpoint] = run_endpoint(driver, requests, options.concurrency)
+
+    finally:
+        if isinstance(driver, GunicornDriver):
+            driver.stop()
+
+    stored = {}
+
+    if options.baseline.exists():
+        stored = json.loads(options.baseline.read_text())
+
+    baseline = {}
+
+    if stored.get("parameters") == parameters:
+        baseline = stored["results"]
+
+    elif stored:
+        print(f"{options.baseline} was measured with other parameters, skipped.")
+
+    print(f"{options.requests} requests per endpoint, {options.concurrency} clients")
+    report(results, baseline)
+
+    if options.save:
+        options.baseline.write_text(
+            json.dumps({"parameters": parameters, "results": results}, indent=2) + "\n"
+        )
+        print(f"Baseline saved to {options.baseline}.")
+        return 0
+
+    regressions = compare(results, baseline, options.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    options = parse_args()
+    setup("benchmarks.settings")
+
+    with test_database():
+        status = run(options)
+
+    sys.exit(status)
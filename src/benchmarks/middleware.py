@@ -0,0 +1,70 @@
+"""
+Compare the requests per second of api endpoints served by the
+full and the lean middleware chains.
+
+Usage: python -m benchmarks.middleware [requests]
+"""
+import sys
+import time
+
+from benchmarks import setup, test_database
+
+
+def seed():
+    from apps.domain import models
+
+    brand = models.Brand.objects.create(
+        name="Brand", website="https://brand.com", email="brand@brand.com"
+    )
+    models.Discount.objects.bulk_create(
+        [
+            models.Discount(
+                code=f"BENCH{i}", description="Benchmark", quantity=10, brand=brand
+            )
+            for i in range(20)
+        ]
+    )
+    return models.User.objects.create(
+        first_name="User", last_name="Bench", email="user@bench.com"
+    )
+
+
+def requests_per_second(client, url, requests, **headers):
+    start = time.perf_counter()
+
+    for _ in range(requests):
+        client.get(url, **headers)
+
+    return requests / (time.perf_counter() - start)
+
+
+def run(requests):
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from apps.api.permissions import UserRoleEnum
+
+    user = seed()
+    client = Client()
+    auth = {"HTTP_AUTHORIZATION": f"{UserRoleEnum.USER.value} {user.pk}"}
+    urls = [(reverse("api:healthcheck"), {}), (reverse("api:discount-list"), auth)]
+
+    print(f"{requests} requests per endpoint")
+    print(f"{'url':<20} {'full (req/s)':>14} {'lean (req/s)':>14}")
+
+    for url, headers in urls:
+        # warm up caches and lazy imports.
+        client.get(url, **headers)
+
+        with override_settings(LEAN_MIDDLEWARE_ROUTES=[]):
+            full = requests_per_second(client, url, requests, **headers)
+
+        lean = requests_per_second(client, url, requests, **headers)
+        print(f"{url:<20} {full:>14.0f} {lean:>14.0f}")
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(requests=int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
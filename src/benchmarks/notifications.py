@@ -0,0 +1,98 @@
+"""
+Compare the throughput of sending one email per claim against
+sending the claims as one digest per brand.
+
+Usage: python -m benchmarks.notifications [events] [brands]
+"""
+import sys
+import time
+
+from benchmarks import setup, test_database
+
+
+def seed(events, brands):
+    from apps.domain import models
+
+    brands = models.Brand.objects.bulk_create(
+        [
+            models.Brand(
+                name=f"Brand {i}", website=f"https://{i}.com", email=f"{i}@b.com"
+            )
+            for i in range(brands)
+        ]
+    )
+    discounts = models.Discount.objects.bulk_create(
+        [
+            models.Discount(code=f"BENCH{i}", description="", quantity=events, brand=b)
+            for i, b in enumerate(brands)
+        ]
+    )
+    users = models.User.objects.bulk_create(
+        [
+            models.User(first_name="User", last_name=str(i), email=f"{i}@u.com")
+            for i in range(events)
+        ],
+        batch_size=5000,
+    )
+
+    return [
+        {
+            "brand": str(discounts[i % len(discounts)].brand_id),
+            "discount": discounts[i % len(discounts)].code,
+            "user": str(user.pk),
+        }
+        for i, user in enumerate(users)
+    ]
+
+
+def run(events, brands):
+    from django.core import mail
+
+    from apps.crosscutting.notification_queue import notification_queue
+    from apps.domain import models
+    from apps.domain.models.brand.emails import send_claims_digest_email
+    from apps.worker.notifications import send_notification_digests
+
+    claims = seed(events, brands)
+    brands = {str(x.pk): x for x in models.Brand.objects.all()}
+    users = {str(x.pk): x for x in models.User.objects.all()}
+
+    start = time.perf_counter()
+
+    for claim in claims:
+        # the previous pipeline: one task and one email per claim.
+        discount = {
+            "code": claim["discount"],
+            "total": 1,
+            "users": [users[claim["user"]].full_name],
+            "others": 0,
+        }
+        send_claims_digest_email(brands[claim["brand"]], [discount])
+
+    per_claim = time.perf_counter() - start
+    per_claim_emails, mail.outbox = len(mail.outbox), []
+
+    start = time.perf_counter()
+    notification_queue.push(claims)
+    send_notification_digests()
+    digest = time.perf_counter() - start
+
+    print(f"{events} claims of {len(brands)} brands")
+    print(f"{'pipeline':<12} {'emails':>8} {'seconds':>10} {'claims/s':>10}")
+    print(
+        f"{'per claim':<12} {per_claim_emails:>8} {per_claim:>10.2f} "
+        f"{events / per_claim:>10.0f}"
+    )
+    print(
+        f"{'digest':<12} {len(mail.outbox):>8} {digest:>10.2f} {events / digest:>10.0f}"
+    )
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(
+            events=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            brands=int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        )
@@ -0,0 +1,88 @@
+"""
+Compare the page latency of page number and cursor pagination
+on the brand discount history.
+
+Usage: python -m benchmarks.pagination [rows] [page_size]
+"""
+import sys
+
+from benchmarks import measure, setup, test_database
+
+
+def seed(rows):
+    from apps.domain import models
+
+    brand = models.Brand.objects.create(
+        name="Brand", website="https://brand.com", email="brand@brand.com"
+    )
+    discount = models.Discount.objects.create(
+        code="BENCH", description="Benchmark", quantity=rows, brand=brand
+    )
+
+    users = models.User.objects.bulk_create(
+        [
+            models.User(first_name="User", last_name=str(i), email=f"{i}@user.com")
+            for i in range(rows)
+        ],
+        batch_size=5000,
+    )
+    models.UserDiscount.objects.bulk_create(
+        [models.UserDiscount(discount=discount, user=user) for user in users],
+        batch_size=5000,
+    )
+
+    return discount
+
+
+def run(rows, page_size):
+    from django.db import connection
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from apps.domain import models
+    from commons.djutils.api.pagination import CursorPagination, DefaultPagination
+
+    discount = seed(rows)
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE user_discount")
+
+    queryset = models.UserDiscount.objects.filter(discount_id=discount.pk)
+    factory = APIRequestFactory()
+
+    print(f"{rows} rows, {page_size} per page")
+    print(f"{'page':>8} {'page number (ms)':>18} {'cursor (ms)':>12}")
+
+    page = 1
+
+    while (page - 1) * page_size < rows:
+        request = Request(factory.get("/", {"page": page, "page_size": page_size}))
+        page_number_ms = measure(
+            lambda: DefaultPagination().paginate_queryset(queryset, request)
+        )
+
+        paginator = CursorPagination()
+        params = {"page_size": page_size}
+
+        if page > 1:
+            # position the cursor at the last row of the previous page.
+            boundary = queryset.order_by(*paginator.ordering)[
+                (page - 1) * page_size - 1
+            ]
+            params["cursor"] = paginator.encode_cursor(boundary)
+
+        request = Request(factory.get("/", params))
+        cursor_ms = measure(lambda: paginator.paginate_queryset(queryset, request))
+
+        print(f"{page:>8} {page_number_ms:>18.2f} {cursor_ms:>12.2f}")
+        page *= 10
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(
+            rows=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+            page_size=int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
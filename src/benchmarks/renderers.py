@@ -0,0 +1,52 @@
+"""
+Compare the throughput of the ``rest_framework`` JSON renderer and parser
+against the ``commons.api`` ones, on serialized discount list rows.
+
+Usage: python -m benchmarks.renderers [rows]
+"""
+import io
+import sys
+
+from benchmarks import measure, setup, test_database
+from benchmarks.serializers import seed
+
+
+def run(rows):
+    from rest_framework import parsers, renderers
+
+    from apps.api.discount.serializers.list import DiscountSerializer
+    from apps.domain import models
+    from commons.api.parsers import JSONParser
+    from commons.api.renderers import JSONRenderer
+
+    seed(rows)
+
+    queryset = models.Discount.objects.select_related("brand")
+    data = DiscountSerializer(queryset, many=True).data
+    content = renderers.JSONRenderer().render(data)
+
+    assert JSONRenderer().render(data) == content
+
+    size = len(content) / 1024 / 1024
+
+    print(f"{rows} rows, {size:.1f} MiB")
+    print(f"{'':<16} {'render (ms)':>12} {'MiB/s':>8} {'parse (ms)':>11} {'MiB/s':>8}")
+
+    for name, renderer, parser in [
+        ("rest_framework", renderers.JSONRenderer(), parsers.JSONParser()),
+        ("commons.api", JSONRenderer(), JSONParser()),
+    ]:
+        render_ms = measure(lambda: renderer.render(data))
+        parse_ms = measure(lambda: parser.parse(io.BytesIO(content)))
+
+        print(
+            f"{name:<16} {render_ms:>12.2f} {size / render_ms * 1000:>8.1f}"
+            f" {parse_ms:>11.2f} {size / parse_ms * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(rows=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,79 @@
+"""
+Compare the ``icontains`` and the full-text search backends of the
+``Search`` filter, as used by the brands list: count and first page.
+
+The ``icontains`` search is served by a trigram index only where the
+``pg_trgm`` extension is available, see migration ``0012_brand_search``.
+
+Usage: python -m benchmarks.search [brands]
+"""
+import sys
+
+from benchmarks import measure, setup, test_database
+
+QUERIES = ["store123456", "brand17"]
+
+
+def seed(brands):
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO brand (id, created_at, updated_at, name, website, email)
+            SELECT
+                gen_random_uuid(), now(), now(),
+                'brand' || (i %% 1000) || ' store' || i,
+                'https://' || i || '.com',
+                i || '@brand.com'
+            FROM generate_series(1, %s) AS i
+            """,
+            [brands],
+        )
+        cursor.execute("ANALYZE brand")
+
+
+def run(brands):
+    from django.db import connection
+
+    from apps.domain import models
+    from commons.djutils.models.filters import ContainsSearch, FullTextSearch
+
+    seed(brands)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = %s)",
+            ["brand_name_trgm_idx"],
+        )
+        trigram = cursor.fetchone()[0]
+
+    backends = {
+        "icontains": ContainsSearch(),
+        "full-text": FullTextSearch("search_vector", rank=True),
+    }
+
+    print(f"{brands} brands, trigram index: {'yes' if trigram else 'no'}")
+    print(f"{'query':<14} {'backend':<10} {'matches':>8} {'ms':>10}")
+
+    for query in QUERIES:
+        for name, backend in backends.items():
+            queryset = backend.search(
+                models.Brand.objects.all(), ["name__icontains"], query
+            )
+
+            def page():
+                queryset.count()
+                list(queryset[:10])
+
+            print(
+                f"{query:<14} {name:<10} {queryset.count():>8} "
+                f"{measure(page):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(brands=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,77 @@
+"""
+Compare rendering the discount list rows with the DRF serializer
+against the compiled serializer.
+
+Usage: python -m benchmarks.serializers [rows]
+"""
+import sys
+
+from benchmarks import measure, setup, test_database
+
+
+def seed(rows):
+    from apps.domain import models
+
+    brands = models.Brand.objects.bulk_create(
+        [
+            models.Brand(
+                name=f"Brand {i}",
+                website=f"https://brand{i}.com",
+                email=f"{i}@brand.com",
+            )
+            for i in range(100)
+        ]
+    )
+    models.Discount.objects.bulk_create(
+        [
+            models.Discount(
+                code=f"BENCH{i}",
+                description="Benchmark",
+                quantity=100,
+                brand=brands[i % len(brands)],
+            )
+            for i in range(rows)
+        ],
+        batch_size=5000,
+    )
+
+
+def run(rows):
+    from apps.api.discount.viewsets.list import DiscountListViewSet
+    from apps.domain import models
+    from commons.api.serializers import compile_serializer
+
+    seed(rows)
+
+    serializer_class = DiscountListViewSet.serializer_class
+    compiled = compile_serializer(serializer_class)
+    queryset = models.Discount.objects.select_related("brand").order_by("pk")
+
+    instances = list(queryset)
+    values = list(compiled.project(queryset))
+
+    assert (
+        compiled.to_representation(values)
+        == serializer_class(instances, many=True).data
+    )
+
+    drf_ms = measure(lambda: serializer_class(instances, many=True).data)
+    compiled_ms = measure(lambda: compiled.to_representation(values))
+    drf_query_ms = measure(
+        lambda: serializer_class(list(queryset.all()), many=True).data
+    )
+    compiled_query_ms = measure(
+        lambda: compiled.to_representation(list(compiled.project(queryset)))
+    )
+
+    print(f"{rows} rows")
+    print(f"{'serializer':<10} {'render (ms)':>12} {'fetch + render (ms)':>20}")
+    print(f"{'drf':<10} {drf_ms:>12.2f} {drf_query_ms:>20.2f}")
+    print(f"{'compiled':<10} {compiled_ms:>12.2f} {compiled_query_ms:>20.2f}")
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(rows=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
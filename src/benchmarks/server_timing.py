@@ -0,0 +1,60 @@
+"""
+Measure the overhead of the server timing middleware, comparing the
+requests per second of api endpoints with no and all requests sampled.
+
+Usage: python -m benchmarks.server_timing [requests]
+"""
+import logging
+import statistics
+import sys
+
+from benchmarks import setup, test_database
+from benchmarks.middleware import requests_per_second, seed
+
+
+def run(requests):
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from apps.api.discount.viewsets.list import DiscountListViewSet
+    from apps.api.permissions import UserRoleEnum
+
+    # the log lines are built, but not printed.
+    logger = logging.getLogger("commons.server_timing")
+    logger.handlers = [logging.NullHandler()]
+
+    user = seed()
+    client = Client()
+    auth = {"HTTP_AUTHORIZATION": f"{UserRoleEnum.USER.value} {user.pk}"}
+    urls = [(reverse("api:healthcheck"), {}), (reverse("api:discount-list"), auth)]
+
+    # render every list request instead of serving it from the cache.
+    DiscountListViewSet.cache_namespace = None
+
+    print(f"{requests} requests per endpoint")
+    print(f"{'url':<20} {'off (req/s)':>12} {'sampled (req/s)':>16} {'overhead':>9}")
+
+    for url, headers in urls:
+        # warm up caches and lazy imports.
+        client.get(url, **headers)
+        off, sampled = [], []
+
+        # interleaved rounds, so both see the same machine noise.
+        for _ in range(5):
+            with override_settings(SERVER_TIMING_SAMPLE_RATE=0):
+                off.append(requests_per_second(client, url, requests, **headers))
+
+            with override_settings(SERVER_TIMING_SAMPLE_RATE=1):
+                sampled.append(requests_per_second(client, url, requests, **headers))
+
+        off, sampled = statistics.median(off), statistics.median(sampled)
+        overhead = (off - sampled) / off * 100
+
+        print(f"{url:<20} {off:>12.0f} {sampled:>16.0f} {overhead:>8.1f}%")
+
+
+if __name__ == "__main__":
+    setup()
+
+    with test_database():
+        run(requests=int(sys.argv[1]) if len(sys.argv) > 1 else 500)
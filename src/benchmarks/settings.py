@@ -0,0 +1,20 @@
+"""
+Settings of the load test, see ``benchmarks.load``. They are the test
+settings with the production authentication, every request timed and
+debug off, so django does not keep the executed queries.
+"""
+import os
+
+from settings.test import *  # noqa: F401,F403
+from settings.test import DATABASES
+
+DEBUG = False
+
+AUTHENTICATION_CLIENT = "commons.api.jwt_auth.JwtAuthenticationClient"
+
+# the queries per request are read from the ``Server-Timing`` header.
+SERVER_TIMING_SAMPLE_RATE = 1
+
+# the database seeded by the load test, for the gunicorn workers.
+if os.environ.get("BENCHMARK_DATABASE_NAME"):
+    DATABASES["default"]["NAME"] = os.environ["BENCHMARK_DATABASE_NAME"]
@@ -1,6 +1,11 @@
 import os
+import threading
+import time
 
 import celery
+from celery import signals
+
+from commons.metrics import registry
 
 # set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings.production")
@@ -18,3 +23,29 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
+
+
+ENQUEUE_DURATION = registry.histogram(
+    "celery_task_enqueue_duration_seconds",
+    "Time to publish a task to the broker, by task.",
+    ["task"],
+)
+
+# id and publish start of the task being sent by each thread. Both signals
+# are sent by the publishing thread, and a failed publish, which sends no
+# ``after_task_publish``, is replaced by the next one.
+_publishing = threading.local()
+
+
+@signals.before_task_publish.connect
+def start_publish(sender=None, headers=None, **kwargs):
+    _publishing.task = ((headers or {}).get("id"), time.perf_counter())
+
+
+@signals.after_task_publish.connect
+def end_publish(sender=None, headers=None, **kwargs):
+    task_id, start = getattr(_publishing, "task", (None, None))
+    _publishing.task = None, None
+
+    if start is not None and task_id == (headers or {}).get("id"):
+        ENQUEUE_DURATION.observe(time.perf_counter() - start, task=sender)
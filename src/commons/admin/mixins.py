@@ -31,8 +31,9 @@ class AdminActionMixin:
         actions = []
 
         for name in filter(lambda x: x.endswith("_action"), dir(self)):
-            # get only actions names with the suffix `_action`.
-            func = getattr(self, name)
+            # get only actions names with the suffix `_action`, unbound
+            # as django calls them with the model admin.
+            func = getattr(type(self), name)
 
             if not getattr(func, "is_extra_action", False):
                 # ignores if the function was not wrapped
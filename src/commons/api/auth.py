@@ -71,7 +71,7 @@ class AuthenticatedUser:
     is_active = True
 
     def __init__(self, pk, role, **kwargs):
-        self.pk = self.id = uuid.UUID(pk)
+        self.pk = self.id = pk if isinstance(pk, uuid.UUID) else uuid.UUID(pk)
 
         try:
             self.role = int(role)
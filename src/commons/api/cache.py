@@ -0,0 +1,125 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from commons.middleware import count_server_timing
+
+
+class ResponseCache:
+    """
+    Caches response data by namespace. Each namespace has a version
+    number that is part of the keys, so bumping it invalidates every
+    cached response of the namespace at once.
+    """
+
+    key_prefix = "response_cache"
+
+    def __init__(self, alias=None, timeout=None):
+        self._alias = alias
+        self._timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self._alias or settings.RESPONSE_CACHE_ALIAS]
+
+    @property
+    def timeout(self):
+        return self._timeout or settings.RESPONSE_CACHE_TIMEOUT
+
+    def _key(self, namespace, *parts):
+        return ":".join([self.key_prefix, namespace, *map(str, parts)])
+
+    def get_version(self, namespace):
+        """
+        Returns the current version of the namespace.
+
+        The first version is based on the current time, so versions
+        never repeat if the cache loses the version key.
+        """
+        key = self._key(namespace, "version")
+        version = self.cache.get(key)
+
+        if version is None:
+            self.cache.add(key, time.time_ns(), timeout=None)
+            version = self.cache.get(key)
+
+        return version
+
+    def bump(self, namespace):
+        """
+        Invalidates all cached responses of the namespace.
+        """
+        key = self._key(namespace, "version")
+
+        try:
+            self.cache.incr(key)
+
+        except ValueError:
+            # the key is missing, start a new version.
+            self.cache.add(key, time.time_ns(), timeout=None)
+
+    def get_key(self, namespace, path, params):
+        """
+        Returns the cache key of a request path and its query params.
+
+        Args:
+            namespace (str, required): Cache namespace.
+            path (str, required): Request path.
+            params (QueryDict, required): Request query params.
+
+        Returns:
+            str
+        """
+        normalized = "&".join(
+            f"{name}={value}"
+            for name in sorted(params)
+            for value in sorted(params.getlist(name))
+            if value != ""
+        )
+        digest = hashlib.md5(f"{path}?{normalized}".encode()).hexdigest()
+        return self._key(namespace, self.get_version(namespace), digest)
+
+    def get(self, namespace, key):
+        """
+        Returns the cached data or ``None``, counting hits and misses.
+        """
+        data = self.cache.get(key)
+        counter = "hits" if data is not None else "misses"
+
+        self._count(namespace, counter)
+        count_server_timing(f"cache_{counter}")
+        return data
+
+    def set(self, namespace, key, data):
+        self.cache.set(key, data, timeout=self.timeout)
+
+    def _count(self, namespace, counter):
+        key = self._key(namespace, counter)
+
+        if not self.cache.add(key, 1, timeout=None):
+            try:
+                self.cache.incr(key)
+
+            except ValueError:
+                # expired between the calls.
+                self.cache.add(key, 1, timeout=None)
+
+    def stats(self, namespace):
+        """
+        Returns the hit and miss counters of the namespace.
+
+        Returns:
+            dict
+        """
+        counters = self.cache.get_many(
+            [self._key(namespace, "hits"), self._key(namespace, "misses")]
+        )
+        return {
+            "hits": counters.get(self._key(namespace, "hits"), 0),
+            "misses": counters.get(self._key(namespace, "misses"), 0),
+        }
+
+
+response_cache = ResponseCache()
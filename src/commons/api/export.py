@@ -0,0 +1,99 @@
+import csv
+import io
+import itertools
+from urllib.parse import quote
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def _batches(rows, size):
+    """
+    Yields lists of up to ``size`` rows, without loading the rows at once.
+    """
+    rows = iter(rows)
+
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+def ndjson_lines(rows, columns, batch_size=500):
+    """
+    Encodes rows as newline delimited JSON, one object per line.
+
+    Args:
+        rows (Iterable<dict>, required): Rows, as returned by ``QuerySet.values``.
+        columns (list, required): Keys of each row, in order.
+        batch_size (int, optional): Rows joined into each yielded chunk.
+
+    Returns:
+        Iterator<str>
+    """
+    encode = DjangoJSONEncoder().encode
+
+    for batch in _batches(rows, batch_size):
+        yield "".join(
+            encode({column: row[column] for column in columns}) + "\n" for row in batch
+        )
+
+
+def csv_lines(rows, columns, batch_size=500):
+    """
+    Encodes rows as CSV, starting with a header line.
+
+    Args:
+        rows (Iterable<dict>, required): Rows, as returned by ``QuerySet.values``.
+        columns (list, required): Keys of each row, in order.
+        batch_size (int, optional): Rows joined into each yielded chunk.
+
+    Returns:
+        Iterator<str>
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for batch in _batches(rows, batch_size):
+        writer.writerows([row[column] for column in columns] for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        # header of an empty export.
+        yield buffer.getvalue()
+
+
+def content_disposition(filename, as_attachment=True):
+    """
+    Returns a ``Content-Disposition`` header value for the filename,
+    escaping it, or percent-encoding it if it is not ASCII (RFC 6266).
+
+    Args:
+        filename (str, required): Name of the downloaded file.
+        as_attachment (bool, optional): Download instead of display the file.
+
+    Returns:
+        str
+    """
+    disposition = "attachment" if as_attachment else "inline"
+
+    try:
+        filename.encode("ascii")
+
+    except UnicodeEncodeError:
+        return f"{disposition}; filename*=utf-8''{quote(filename)}"
+
+    escaped = filename.replace("\\", "\\\\").replace('"', r"\"")
+    return f'{disposition}; filename="{escaped}"'
+
+
+# content type, file extension and encoder of each export format.
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson", ndjson_lines),
+    "csv": ("text/csv", "csv", csv_lines),
+}
+
+# written next to an export made by a worker once it is complete, it holds
+# the storage name of the export and a line break. Storages write files in chunks, so the
+# export itself may be found before it is complete.
+EXPORT_READY_FILENAME = ".ready"
@@ -1,3 +1,5 @@
+import uuid
+
 from rest_framework.authentication import get_authorization_header
 
 from commons import jwt
@@ -5,6 +7,9 @@ from commons.api import auth
 
 
 class JwtAuthenticationClient(auth.BaseAuthenticationClient):
+    # Verified claims shared by the clients of the process.
+    claims_cache = jwt.ClaimsCache()
+
     def _authenticate_token(self, token):  # noqa
         """
         Authenticate panel_user using the provided token.
@@ -12,7 +17,25 @@ class JwtAuthenticationClient(auth.BaseAuthenticationClient):
         Args:
             token: (string, required) - User token to be validated.
         """
-        return jwt.Jwt.verify(token=token, key=jwt.JWT_KEY)
+        if (claims := self.claims_cache.get(token)) is not None:
+            return claims
+
+        if not (claims := jwt.Jwt.verify(token=token, key=jwt.JWT_KEY)):
+            return claims
+
+        if isinstance(claims.get("id"), str):
+            # parse the identity once per token.
+            claims["id"] = uuid.UUID(claims["id"])
+
+        self.claims_cache.set(token, claims)
+        return claims
+
+    @classmethod
+    def evict(cls, token):
+        """
+        Forget the cached claims of a token, e.g. when it is revoked.
+        """
+        return cls.claims_cache.evict(token)
 
     def authenticate(self, request):
         """
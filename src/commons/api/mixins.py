@@ -1,10 +1,16 @@
-import re
+import functools
 
 from django.utils.functional import cached_property
 from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+from commons.api.cache import response_cache
+from commons.api.planner import plan_queryset
+from commons.api.serializers import FIELDS_CACHE_SIZE, compile_serializer
+from commons.middleware import server_timing
+
 
 def _resolve(*fields, tree=None):
     tree = tree or {}
@@ -21,7 +27,13 @@ def _resolve(*fields, tree=None):
     return tree
 
 
+@functools.lru_cache(maxsize=FIELDS_CACHE_SIZE)
 def resolve_fields(fields):
+    """
+    Parses a ``fields`` param, e.g. ``id,brand.name``, into a field tree,
+    e.g. ``{"id": None, "brand": {"name": None}}``. Trees are memoized,
+    so they are shared and must not be changed.
+    """
     return _resolve(*map(lambda x: x.strip().split("."), fields.split(",")))
 
 
@@ -29,6 +41,9 @@ class PartialViewSetMixin:
     fields_url_kwarg = "fields"
     resolver_suffix = "queryset_resolver"
 
+    # Set to ``False`` to rely only on the explicit resolvers.
+    plan_queryset = True
+
     @cached_property
     def partial_fields(self):
         fields = self.request.GET.get(self.fields_url_kwarg)
@@ -43,25 +58,46 @@ class PartialViewSetMixin:
         context["fields"] = self.partial_fields
         return context
 
+    @classmethod
+    def get_queryset_resolvers(cls):
+        """
+        Returns the resolver method names of the class by the field path
+        they resolve, e.g. ``discount_brand`` for the
+        ``discount_brand_queryset_resolver`` method.
+        Collected once per class.
+        """
+        if "_queryset_resolvers" not in cls.__dict__:
+            suffix = f"_{cls.resolver_suffix}"
+            cls._queryset_resolvers = {
+                name[: -len(suffix)]: name
+                for name in dir(cls)
+                if name.endswith(suffix) and len(name) > len(suffix)
+            }
+
+        return cls._queryset_resolvers
+
     def _get_field_resolvers(self, field):
         """
         Returns all specific field resolvers to nested fields.
         """
-        nested_re = re.compile(
-            r"{field}_(.+)_{suffix}".format(field=field, suffix=self.resolver_suffix)
-        )
+        prefix = f"{field}_"
 
-        return filter(lambda x: bool(nested_re.match(x)), dir(self))
+        return (
+            name
+            for path, name in self.get_queryset_resolvers().items()
+            if path.startswith(prefix) and len(path) > len(prefix)
+        )
 
     def resolve_queryset_fields(self, queryset, fields, prefix=None):
         prefix = prefix or ""
+        resolvers = self.get_queryset_resolvers()
 
         for field, nested in fields.items():
             field = f"{prefix}_{field}" if prefix else field
-            resolver = getattr(self, f"{field}_{self.resolver_suffix}", None)
+            resolver = resolvers.get(field)
 
             if resolver is not None:
-                queryset = resolver(queryset)
+                queryset = getattr(self, resolver)(queryset)
 
             if not nested:
 
@@ -75,18 +111,99 @@ class PartialViewSetMixin:
         return queryset
 
     def resolve_all_fields(self, queryset):
-        for resolver in filter(lambda x: x.endswith("_queryset_resolver"), dir(self)):
+        for resolver in self.get_queryset_resolvers().values():
             resolver = getattr(self, resolver)
             queryset = resolver(queryset)
         return queryset
 
+    def has_field_resolver(self, field):
+        """
+        Returns whether the field or any of its nested
+        fields has an explicit resolver.
+        """
+        if field in self.get_queryset_resolvers():
+            return True
+
+        return any(self._get_field_resolvers(field))
+
+    def get_plan_serializer(self):
+        """
+        Returns the serializer that renders the response of the current action.
+        """
+        action = getattr(self, "action", None)
+        serializer_class = getattr(self, f"{action}_response_serializer_class", None)
+        return self.get_serializer(serializer_class=serializer_class)
+
+    def resolve_planned_fields(self, queryset):
+        """
+        Optimizes the queryset to the requested fields of the serializer.
+        Fields with explicit resolvers are left to them.
+        """
+        return plan_queryset(
+            queryset,
+            self.get_plan_serializer(),
+            fields=self.partial_fields,
+            resolved=self.has_field_resolver,
+            # never save instances with deferred columns.
+            project=self.request.method in SAFE_METHODS,
+        )
+
     def get_queryset(self):
         queryset = super().get_queryset()
 
         if self.partial_fields:
-            return self.resolve_queryset_fields(queryset, self.partial_fields)
+            queryset = self.resolve_queryset_fields(queryset, self.partial_fields)
+        else:
+            queryset = self.resolve_all_fields(queryset)
+
+        if self.plan_queryset:
+            queryset = self.resolve_planned_fields(queryset)
+
+        return queryset
+
+
+class CacheResponseMixin:
+    """
+    Cache the ``list()`` response data by request path and query params.
+    With ``conditional_get``, the validator aggregates are cached along, so
+    a cached response runs no query to answer conditional requests.
+    """
+
+    # Namespace of the cached responses, bump its version to invalidate
+    # them. Set to ``None`` to disable the cache.
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        if not self.cache_namespace:
+            return super().list(request, *args, **kwargs)
+
+        key = response_cache.get_key(
+            self.cache_namespace, request.path, request.query_params
+        )
+        cached = response_cache.get(self.cache_namespace, key)
+
+        if cached is not None:
+            data, aggregates = cached["data"], cached["aggregates"]
 
-        return self.resolve_all_fields(queryset)
+            if aggregates is not None:
+                self._conditional_aggregates = aggregates
+
+            not_modified = self.get_not_modified_response(request)
+            return Response(data) if not_modified is None else not_modified
+
+        response = super().list(request, *args, **kwargs)
+
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.set(
+                self.cache_namespace,
+                key,
+                {
+                    "data": response.data,
+                    "aggregates": getattr(self, "_conditional_aggregates", None),
+                },
+            )
+
+        return response
 
 
 class CreateModelMixin:
@@ -110,10 +227,11 @@ class CreateModelMixin:
             serializer_class=self.create_response_serializer_class,
         )
 
-        headers = self.get_success_headers(serializer.data)
-        return Response(
-            serializer.data, status=status.HTTP_201_CREATED, headers=headers
-        )
+        with server_timing("serialize"):
+            data = serializer.data
+
+        headers = self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
 
     def perform_create(self, serializer):
         serializer.save()
@@ -132,20 +250,69 @@ class ListModelMixin:
 
     list_response_serializer_class = None
 
+    # Set to ``True`` to render the list from ``values()`` rows, without
+    # the serializer fields, when the serializer can be compiled.
+    compile_list_serializer = False
+
+    def get_compiled_serializer(self):
+        """
+        Returns the compiled list serializer, if enabled and possible.
+        """
+        if not self.compile_list_serializer:
+            return None
+
+        serializer_class = (
+            self.list_response_serializer_class or self.get_serializer_class()
+        )
+        return compile_serializer(
+            serializer_class, fields=getattr(self, "partial_fields", None)
+        )
+
     def list(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+
+        if not_modified is not None:
+            return not_modified
+
         queryset = self.filter_queryset(self.get_queryset())
+        compiled = self.get_compiled_serializer()
+
+        if compiled is not None:
+            # cursors are built from the ordering columns of the rows.
+            ordering = getattr(self.paginator, "ordering", None) or []
+            queryset = compiled.project(
+                queryset, *[field.lstrip("-") for field in ordering]
+            )
+
+            page = self.paginate_queryset(queryset)
+
+            with server_timing("serialize"):
+                data = compiled.to_representation(queryset if page is None else page)
+
+            if page is not None:
+                return self.get_paginated_response(data)
+
+            return Response(data)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(
                 page, many=True, serializer_class=self.list_response_serializer_class
             )
-            return self.get_paginated_response(serializer.data)
+
+            with server_timing("serialize"):
+                data = serializer.data
+
+            return self.get_paginated_response(data)
 
         serializer = self.get_serializer(
             queryset, many=True, serializer_class=self.list_response_serializer_class
         )
-        return Response(serializer.data)
+
+        with server_timing("serialize"):
+            data = serializer.data
+
+        return Response(data)
 
 
 class RetrieveModelMixin:
@@ -156,11 +323,20 @@ class RetrieveModelMixin:
     retrieve_response_serializer_class = None
 
     def retrieve(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+
+        if not_modified is not None:
+            return not_modified
+
         instance = self.get_object()
         serializer = self.get_serializer(
             instance, serializer_class=self.retrieve_response_serializer_class
         )
-        return Response(serializer.data)
+
+        with server_timing("serialize"):
+            data = serializer.data
+
+        return Response(data)
 
 
 class UpdateModelMixin:
@@ -192,7 +368,11 @@ class UpdateModelMixin:
         serializer = self.get_serializer(
             instance=instance, serializer_class=self.update_response_serializer_class
         )
-        return Response(serializer.data)
+
+        with server_timing("serialize"):
+            data = serializer.data
+
+        return Response(data)
 
     def perform_update(self, serializer):
         serializer.save()
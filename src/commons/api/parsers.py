@@ -0,0 +1,33 @@
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from commons.api.renderers import JSONRenderer, orjson
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    Parses JSON with ``orjson`` when it is installed, falling back to the
+    standard library parser otherwise.
+    """
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None or not self.strict:
+            # ``orjson`` always refuses ``NaN`` and ``Infinity``.
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = stream.read()
+
+            if encoding.lower().replace("-", "") != "utf8":
+                data = data.decode(encoding)
+
+            return orjson.loads(data)
+
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
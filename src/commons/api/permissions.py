@@ -72,3 +72,23 @@ class IsPublic(BasePermission):
             return True
 
         return self.is_authorized(request)
+
+
+class HasMetricsAccess(IsPublic):
+    """
+    Grants the metrics scrapers, which send ``settings.METRICS_ACCESS_KEY``
+    as a bearer token. Without a key, the metrics are only open in
+    development, i.e. with ``settings.DEBUG``.
+    """
+
+    scheme = "bearer"
+
+    @property
+    def access_key(self):
+        return getattr(settings, "METRICS_ACCESS_KEY", None)
+
+    def has_permission(self, request, view):
+        if not self.access_key:
+            return settings.DEBUG
+
+        return self.is_authorized(request)
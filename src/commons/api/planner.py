@@ -0,0 +1,199 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from commons.api.serializers import PartialSerializerMixin, readable_field_plan
+
+
+class QuerysetPlan:
+    """
+    Relations and columns a serializer needs to render a queryset.
+    """
+
+    def __init__(self):
+        self.select_related = []
+        self.prefetch_related = []
+        self.only = []
+
+    def apply(self, queryset, project=True):
+        """
+        Returns the queryset optimized by the plan.
+
+        Args:
+            queryset (django.db.Queryset, required): Queryset object.
+            project (bool, optional): Whether to load only the planned columns.
+
+        Returns:
+            django.db.Queryset
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        if project and self.only:
+            queryset = queryset.only(*self.only)
+
+        return queryset
+
+
+def _nested_serializer(field):
+    """
+    Returns the serializer rendering a relation field, if any.
+    """
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+
+    if isinstance(field, serializers.BaseSerializer):
+        return field
+
+    return None
+
+
+def _requested_fields(serializer, fields):
+    """
+    Returns the readable fields and their nested field tree the
+    same way ``PartialSerializerMixin`` renders them.
+    """
+    if not (isinstance(serializer, PartialSerializerMixin) and fields):
+        for field in serializer.fields.values():
+            if not field.write_only:
+                yield field, None
+
+        return
+
+    declared_fields = serializer.fields
+
+    for name, nested in readable_field_plan(type(serializer), fields):
+        yield declared_fields[name], nested
+
+
+def _plan(
+    plan,
+    model,
+    serializer,
+    fields,
+    resolved,
+    project=True,
+    path="",
+    prefix="",
+    annotations=(),
+):
+    """
+    Plans the relations of the serializer and returns the columns of
+    the model it reads. All columns are returned if any field reads
+    something other than a model field, e.g. a method or a property.
+    """
+    columns = {model._meta.pk.name}
+    projectable = True
+
+    for field, nested_fields in _requested_fields(serializer, fields):
+        field_path = f"{path}_{field.field_name}" if path else field.field_name
+
+        if len(field.source_attrs) != 1:
+            # method fields, ``source="*"`` and dotted sources.
+            projectable = False
+            continue
+
+        name = field.source_attrs[0]
+
+        if name in annotations:
+            continue
+
+        try:
+            model_field = model._meta.get_field(name)
+
+        except FieldDoesNotExist:
+            projectable = False
+            continue
+
+        nested = _nested_serializer(field)
+
+        if resolved(field_path) or not model_field.is_relation or nested is None:
+            # explicit resolvers and plain values load only their column.
+            if model_field.concrete:
+                columns.add(name)
+
+            elif model_field.is_relation and not resolved(field_path):
+                plan.prefetch_related.append(prefix + name)
+
+            continue
+
+        lookup = prefix + name
+
+        if (model_field.many_to_one or model_field.one_to_one) and nested is field:
+            plan.select_related.append(lookup)
+
+            if model_field.concrete:
+                columns.add(name)
+
+            related_columns = _plan(
+                plan,
+                model_field.related_model,
+                nested,
+                nested_fields,
+                resolved,
+                project=project,
+                path=field_path,
+                prefix=f"{lookup}__",
+            )
+            columns.update(f"{name}__{column}" for column in related_columns)
+            continue
+
+        related_plan = QuerysetPlan()
+        related_columns = _plan(
+            related_plan,
+            model_field.related_model,
+            nested,
+            nested_fields,
+            resolved,
+            project=project,
+            path=field_path,
+        )
+
+        if model_field.one_to_many:
+            # the prefetch joins the rows back by their foreign key.
+            related_columns.add(model_field.field.name)
+
+        related_plan.only = sorted(related_columns)
+        related_queryset = related_plan.apply(
+            model_field.related_model._default_manager.all(), project=project
+        )
+        plan.prefetch_related.append(Prefetch(lookup, queryset=related_queryset))
+
+    if not projectable:
+        return {field.name for field in model._meta.concrete_fields}
+
+    return columns
+
+
+def plan_queryset(queryset, serializer, fields=None, resolved=None, project=True):
+    """
+    Optimizes the queryset to render the given serializer, following
+    the related objects with ``select_related`` and ``prefetch_related``
+    and loading only the columns of the requested fields.
+
+    Args:
+        queryset (django.db.Queryset, required): Queryset object.
+        serializer (Serializer, required): Serializer instance that renders the queryset.
+        fields (dict, optional): Requested field tree, as returned by ``resolve_fields``.
+        resolved (callable, optional): Tells whether a field path is already
+            optimized, so it is left as it is.
+        project (bool, optional): Whether to load only the requested columns.
+
+    Returns:
+        django.db.Queryset
+    """
+    plan = QuerysetPlan()
+    columns = _plan(
+        plan,
+        queryset.model,
+        serializer,
+        fields,
+        resolved or (lambda path: False),
+        project=project,
+        annotations=queryset.query.annotations,
+    )
+    plan.only = sorted(columns)
+    return plan.apply(queryset, project=project)
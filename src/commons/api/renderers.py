@@ -0,0 +1,126 @@
+import decimal
+import itertools
+
+from rest_framework import renderers
+
+from commons.middleware import server_timing
+
+try:
+    import orjson
+
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def is_standard_float(value):
+    """
+    Returns whether ``orjson`` writes the float, or ``Decimal`` encoded
+    as a float, as the standard library does. It does not for ``NaN`` and
+    infinities, written as ``null``, nor for the floats the standard
+    library writes with an exponent, e.g. ``1e16`` for ``1e+16`` and
+    ``0.00001`` for ``1e-05``.
+    """
+    value = abs(float(value))
+    return value == 0 or 1e-4 <= value < 1e16
+
+
+def has_non_standard_floats(data):
+    """
+    Returns whether ``data`` holds a float or ``Decimal`` ``orjson`` writes
+    other than the standard library, looking into its dicts, lists and
+    tuples. The values are checked a nesting level at a time with builtins,
+    a loop over each value costs about as much as the standard library
+    renderer.
+    """
+    values = [data]
+
+    while values:
+        types = set(map(type, values))
+        children = []
+
+        if any(issubclass(cls, (float, decimal.Decimal)) for cls in types) and not all(
+            map(
+                is_standard_float,
+                filter(
+                    lambda value: isinstance(value, (float, decimal.Decimal)), values
+                ),
+            )
+        ):
+            return True
+
+        if any(issubclass(cls, dict) for cls in types):
+            children.extend(
+                itertools.chain.from_iterable(
+                    map(dict.values, filter(dict.__instancecheck__, values))
+                )
+            )
+
+        if any(issubclass(cls, (list, tuple)) for cls in types):
+            children.extend(
+                itertools.chain.from_iterable(filter(list.__instancecheck__, values))
+            )
+            children.extend(
+                itertools.chain.from_iterable(filter(tuple.__instancecheck__, values))
+            )
+
+        values = children
+
+    return False
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Renders JSON with ``orjson`` when it is installed, falling back to the
+    standard library renderer otherwise. Types ``orjson`` does not encode
+    natively (datetimes, ``Decimal``, lazy strings, querysets...) are
+    encoded by the ``rest_framework`` encoder.
+
+    Indented, ASCII only or non strict outputs, values ``orjson`` cannot
+    encode, e.g. integers over 64 bits, and floats ``orjson`` writes other
+    than the standard library, i.e. with an exponent, ``NaN`` or infinite,
+    are rendered by the standard library, so the output is the same as the
+    ``rest_framework`` renderer and non finite floats raise ``ValueError``.
+    Floats in iterables other than lists and tuples, or returned by the
+    encoder, e.g. from a queryset, are not looked for and are written by
+    ``orjson`` though.
+    """
+
+    # datetimes are left to the encoder, which writes UTC as ``Z``.
+    options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else None
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with server_timing("render"):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            or has_non_standard_floats(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # as the ``rest_framework`` renderer, escape the line and paragraph
+        # separators to output a strict javascript subset.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+
+        return ret
@@ -1,4 +1,9 @@
+import functools
+import operator
+
+from django.core.exceptions import FieldDoesNotExist
 from django.core.files.storage import default_storage
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
@@ -11,6 +16,23 @@ class Serializer(serializers.Serializer):
         pass
 
 
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """
+    Creates the items with ``bulk_create`` in batches of ``batch_size``
+    inside a single transaction. The model ``save()`` and its signals
+    are not called.
+    """
+
+    batch_size = 1000
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        objs = [model(**attrs) for attrs in validated_data]
+
+        with transaction.atomic(using=model._default_manager.db):
+            return model._default_manager.bulk_create(objs, batch_size=self.batch_size)
+
+
 class DatePeriodSerializer(Serializer):
     start_date = serializers.DateField()
     end_date = serializers.DateField()
@@ -30,6 +52,56 @@ class DatePeriodSerializer(Serializer):
         return validated_data
 
 
+def _freeze(fields):
+    """
+    Returns a hashable copy of a field tree.
+    """
+    if not fields:
+        return None
+
+    return tuple(sorted((name, _freeze(nested)) for name, nested in fields.items()))
+
+
+def _thaw(fields):
+    if fields is None:
+        return None
+
+    return {name: _thaw(nested) for name, nested in fields}
+
+
+# bound of the memoized field trees and readable field plans, which are
+# keyed by the requested ``fields``.
+FIELDS_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=FIELDS_CACHE_SIZE)
+def _readable_field_plan(serializer_class, fields):
+    serializer = serializer_class()
+    fields = _thaw(fields)
+
+    return tuple(
+        (field.field_name, fields[field.field_name])
+        for field in serializer.fields.values()
+        if not field.write_only and field.field_name in fields
+    )
+
+
+def readable_field_plan(serializer_class, fields):
+    """
+    Returns the names of the readable fields of the serializer that are
+    in the requested field tree, in the serializer order, and the field
+    tree of each one. Plans are cached by class and field tree.
+
+    Args:
+        serializer_class (type, required): Serializer class.
+        fields (dict, required): Requested field tree, as returned by ``resolve_fields``.
+
+    Returns:
+        tuple<(str, dict)>
+    """
+    return _readable_field_plan(serializer_class, _freeze(fields))
+
+
 class PartialSerializerMixin:
     @property
     def _readable_fields(self):
@@ -40,28 +112,27 @@ class PartialSerializerMixin:
         _cached_prop = "__readable_fields"
 
         if not hasattr(self, _cached_prop):
-            readable_fields = getattr(super(), "_readable_fields")
             context = getattr(self, "_context")
-
             fields = context.get("fields")
 
             if not fields:
                 # it is not a partial response
-                return readable_fields
+                return getattr(super(), "_readable_fields")
 
-            partial_fields = list(
-                filter(lambda x: x.field_name in fields, readable_fields)
-            )
+            declared_fields = self.fields
+            partial_fields = []
 
-            for field in partial_fields:
-                field_context = context.copy()
-                field_context.update({"fields": fields.get(field.field_name)})
+            for name, nested in readable_field_plan(type(self), fields):
+                field = declared_fields[name]
+                field_context = {**context, "fields": nested}
 
                 setattr(field, "_context", field_context)
 
                 if hasattr(field, "child"):
                     setattr(field.child, "_context", field_context.copy())
 
+                partial_fields.append(field)
+
             setattr(self, _cached_prop, partial_fields)
 
         return getattr(self, _cached_prop)
@@ -73,6 +144,178 @@ class PartialModelSerializer(PartialSerializerMixin, serializers.ModelSerializer
     """
 
 
+def _uuid_representation(field):
+    if field.uuid_format == "hex_verbose":
+        return str
+
+    return operator.attrgetter(field.uuid_format)
+
+
+# representation of the values of simple fields, as their ``to_representation``.
+_REPRESENTATIONS = {
+    serializers.CharField: lambda field: str,
+    serializers.EmailField: lambda field: str,
+    serializers.URLField: lambda field: str,
+    serializers.SlugField: lambda field: str,
+    serializers.UUIDField: _uuid_representation,
+    serializers.IntegerField: lambda field: int,
+    serializers.BooleanField: lambda field: bool,
+    serializers.DateTimeField: lambda field: field.to_representation,
+    serializers.DateField: lambda field: field.to_representation,
+    serializers.TimeField: lambda field: field.to_representation,
+    serializers.DecimalField: lambda field: field.to_representation,
+    serializers.FloatField: lambda field: field.to_representation,
+    serializers.ChoiceField: lambda field: field.to_representation,
+}
+
+
+class NotCompilable(Exception):
+    """
+    The serializer renders something a ``values()`` row does not hold.
+    """
+
+
+class CompiledSerializer:
+    """
+    Read-only rendering of a serializer from ``values()`` rows.
+
+    Args:
+        columns (list, required): Columns of the ``values()`` projection.
+        build (callable, required): Builds the representation of a row.
+    """
+
+    def __init__(self, columns, build):
+        self.columns = columns
+        self.build = build
+
+    def project(self, queryset, *columns):
+        """
+        Returns the queryset of the rows to be rendered, with the
+        extra columns, e.g. the ones a cursor is built from.
+        """
+        return queryset.prefetch_related(None).values(*self.columns, *columns)
+
+    def to_representation(self, rows):
+        build = self.build
+        return [build(row) for row in rows]
+
+
+def _compile_value(field, model, prefix):
+    """
+    Returns the column and the representation of a plain model field.
+    """
+    representation = _REPRESENTATIONS.get(type(field))
+    name = field.source_attrs[0]
+
+    try:
+        model_field = model._meta.get_field(name)
+
+    except FieldDoesNotExist as exc:
+        raise NotCompilable(f"'{name}' is not a model field.") from exc
+
+    if representation is None or model_field.is_relation or not model_field.concrete:
+        raise NotCompilable(f"'{field.field_name}' is not a plain column.")
+
+    column, represent = prefix + name, representation(field)
+
+    def get(row):
+        value = row[column]
+        return None if value is None else represent(value)
+
+    return [column], get
+
+
+def _compile(serializer, model, fields, prefix=""):
+    """
+    Returns the columns and the row builder of the serializer, following
+    the ``PartialSerializerMixin`` rules to pick the fields.
+    """
+    if (
+        type(serializer).to_representation
+        is not serializers.Serializer.to_representation
+    ):
+        raise NotCompilable(
+            f"'{type(serializer).__name__}' has a custom representation."
+        )
+
+    partial = isinstance(serializer, PartialSerializerMixin) and bool(fields)
+    columns, getters = [], []
+
+    for field in serializer.fields.values():
+        if field.write_only or (partial and field.field_name not in fields):
+            continue
+
+        if len(field.source_attrs) != 1:
+            raise NotCompilable(f"'{field.field_name}' has no single source.")
+
+        if not isinstance(field, serializers.BaseSerializer):
+            field_columns, get = _compile_value(field, model, prefix)
+
+        elif isinstance(field, serializers.ListSerializer):
+            raise NotCompilable(f"'{field.field_name}' is a to-many relation.")
+
+        else:
+            name = field.source_attrs[0]
+            model_field = model._meta.get_field(name)
+
+            if not (model_field.concrete and model_field.is_relation):
+                raise NotCompilable(f"'{field.field_name}' is not a foreign key.")
+
+            nested_columns, nested_build = _compile(
+                field,
+                model_field.related_model,
+                fields.get(field.field_name) if partial else None,
+                prefix=f"{prefix}{name}__",
+            )
+            field_columns = [prefix + name, *nested_columns]
+            get = _nested_getter(prefix + name, nested_build)
+
+        columns.extend(field_columns)
+        getters.append((field.field_name, get))
+
+    def build(row):
+        return {name: get(row) for name, get in getters}
+
+    return columns, build
+
+
+def _nested_getter(column, build):
+    def get(row):
+        return None if row[column] is None else build(row)
+
+    return get
+
+
+@functools.lru_cache(maxsize=FIELDS_CACHE_SIZE)
+def _compile_serializer(serializer_class, fields):
+    serializer = serializer_class(context={"fields": _thaw(fields)})
+
+    try:
+        columns, build = _compile(serializer, serializer.Meta.model, _thaw(fields))
+
+    except NotCompilable:
+        return None
+
+    return CompiledSerializer(list(dict.fromkeys(columns)), build)
+
+
+def compile_serializer(serializer_class, fields=None):
+    """
+    Compiles a model serializer into a ``values()`` projection and a
+    row builder rendering the same representation, skipping the DRF
+    fields. Only serializers of plain columns and nested foreign keys
+    are compiled, compilations are cached by class and fields.
+
+    Args:
+        serializer_class (type, required): ``ModelSerializer`` class.
+        fields (dict, optional): Requested field tree, as returned by ``resolve_fields``.
+
+    Returns:
+        CompiledSerializer: Or ``None`` if the serializer cannot be compiled.
+    """
+    return _compile_serializer(serializer_class, _freeze(fields))
+
+
 class URLField(serializers.URLField):
     """
     A field that automatically convert partial urls to absolute one.
@@ -180,7 +423,7 @@ def modelserializer_factory(
     serializer=None,
     field_classes=None,
     meta=None,
-    **kwargs
+    **kwargs,
 ):
     """
     Return a ModelSerializer containing form fields for the given model. You can
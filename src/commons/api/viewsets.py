@@ -1,4 +1,9 @@
-from rest_framework import generics
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import generics, status
 from rest_framework.viewsets import ViewSetMixin
 
 from commons.api import mixins
@@ -11,6 +16,140 @@ class GenericViewSet(ViewSetMixin, generics.GenericAPIView):
     the `get_object` and `get_queryset` methods.
     """
 
+    # Set to a cursor pagination class to let clients opt in to it
+    # by passing ``?pagination=cursor`` or a cursor.
+    cursor_pagination_class = None
+    pagination_query_param = "pagination"
+
+    # Set to ``True`` to answer conditional GET requests with ``304 Not Modified``
+    # before serializing. The validators are built from the row count and the
+    # latest ``last_modified_fields`` of ``get_conditional_queryset()``, or
+    # from the ones cached with the response, see ``CacheResponseMixin``.
+    conditional_get = False
+    last_modified_fields = ["updated_at"]
+
+    # Max queries of a request, a warning is logged when a sampled request
+    # runs more. Defaults to ``settings.QUERY_BUDGET``.
+    query_budget = None
+
+    @property
+    def paginator(self):
+        """
+        The paginator instance associated with the view, or `None`.
+        """
+        if not hasattr(self, "_paginator"):
+            pagination_class = self.get_pagination_class()
+            self._paginator = pagination_class() if pagination_class else None
+
+        return self._paginator
+
+    def get_pagination_class(self):
+        """
+        Returns the pagination class selected by the request.
+        """
+        cursor_pagination_class = self.cursor_pagination_class
+        query_params = self.request.query_params
+
+        if cursor_pagination_class and (
+            query_params.get(self.pagination_query_param) == "cursor"
+            or cursor_pagination_class.cursor_query_param in query_params
+        ):
+            return cursor_pagination_class
+
+        return self.pagination_class
+
+    def get_conditional_queryset(self):
+        """
+        Returns the rows the response is built from.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+
+        if lookup_url_kwarg in self.kwargs:
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+
+        return queryset
+
+    def get_conditional_aggregates(self):
+        """
+        Returns the row count and the latest ``last_modified_fields`` dates
+        of the response, computed with a single aggregate query.
+
+        Returns:
+            tuple<int, list>
+        """
+        if not hasattr(self, "_conditional_aggregates"):
+            aggregates = self.get_conditional_queryset().aggregate(
+                count=Count("pk"),
+                **{
+                    f"last_modified_{index}": Max(field)
+                    for index, field in enumerate(self.last_modified_fields)
+                },
+            )
+
+            count = aggregates.pop("count")
+            dates = [x for x in aggregates.values() if x is not None]
+            self._conditional_aggregates = count, dates
+
+        return self._conditional_aggregates
+
+    def get_validators(self):
+        """
+        Returns the ``ETag`` and the ``Last-Modified`` timestamp of the response.
+
+        Returns:
+            tuple<str, int>
+        """
+        if not hasattr(self, "_validators"):
+            count, dates = self.get_conditional_aggregates()
+            last_modified = int(max(dates).timestamp()) if dates else None
+
+            # the representation also depends on the request.
+            request = self.request
+            state = [
+                request.path,
+                sorted(request.query_params.lists()),
+                request.META.get("HTTP_ACCEPT"),
+                getattr(request.user, "pk", None),
+                count,
+                [x.isoformat() for x in dates],
+            ]
+
+            etag = hashlib.md5(repr(state).encode()).hexdigest()
+            self._validators = f'"{etag}"', last_modified
+
+        return self._validators
+
+    def get_not_modified_response(self, request):
+        """
+        Returns a ``304 Not Modified`` response when the client
+        representation is still valid, otherwise ``None``.
+        """
+        if not self.conditional_get or request.method not in ("GET", "HEAD"):
+            return None
+
+        etag, last_modified = self.get_validators()
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if (
+            self.conditional_get
+            and request.method in ("GET", "HEAD")
+            and response.status_code
+            in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED)
+        ):
+            etag, last_modified = self.get_validators()
+            response.setdefault("ETag", etag)
+
+            if last_modified is not None:
+                response.setdefault("Last-Modified", http_date(last_modified))
+
+        return response
+
     def get_serializer(self, *args, **kwargs):
         """
         Return the serializer instance that should be used for validating and
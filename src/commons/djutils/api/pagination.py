@@ -1,10 +1,15 @@
 from collections import OrderedDict
 
+from django.core import signing
 from django.core.paginator import Paginator as BasePaginator
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
 from commons.utils.collections import DataDict
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination, BasePagination
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class Paginator(BasePaginator):
@@ -94,3 +99,190 @@ class SkipPagination(BasePagination):
             rest_framework.response.Response
         """
         return Response(OrderedDict([("results", data)]))
+
+
+class CursorPagination(BasePagination):
+    """
+    Keyset pagination, the cost of a page does not depend on how deep it is.
+
+    Pages are positioned by the values of the ``ordering`` fields of the
+    boundary rows, which must be unique together. The position is signed
+    into an opaque cursor, so clients cannot forge it.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Invalid cursor")
+
+    # Client can control the page size using this query parameter.
+    page_size_query_param = "page_size"
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 100
+
+    # Fields that position the pages, prefix with "-" to sort descending.
+    ordering = ("created_at", "id")
+
+    signing_salt = "commons.djutils.api.pagination.CursorPagination"
+
+    def get_page_size(self, request):
+        """
+        Returns the requested page size, limited by ``max_page_size``.
+
+        Args:
+            request (Request, required): Request object.
+
+        Returns:
+            int
+        """
+        page_size = DataDict(request.query_params).get(
+            self.page_size_query_param, default=None, cast=int
+        )
+
+        if not page_size or page_size < 0:
+            return self.page_size or 10
+
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, instance, reverse=False):
+        """
+        Returns the signed cursor positioned at the given instance.
+
+        Args:
+            instance (Model|dict, required): Boundary instance or ``values()`` row of the page.
+            reverse (bool, optional): Whether the cursor points backwards.
+
+        Returns:
+            str
+        """
+        get = dict.get if isinstance(instance, dict) else getattr
+        position = [str(get(instance, field.lstrip("-"))) for field in self.ordering]
+        return signing.dumps(
+            {"p": position, "r": reverse}, salt=self.signing_salt, compress=True
+        )
+
+    def decode_cursor(self, request):
+        """
+        Returns the position and direction from the request cursor.
+
+        Args:
+            request (Request, required): Request object.
+
+        Returns:
+            tuple<list, bool>
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        if not cursor:
+            return None, False
+
+        try:
+            data = signing.loads(cursor, salt=self.signing_salt)
+            position, reverse = data["p"], bool(data["r"])
+
+        except (signing.BadSignature, KeyError, TypeError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def get_ordering(self, reverse=False):
+        """
+        Returns the queryset ordering for the given direction.
+        """
+        if not reverse:
+            return list(self.ordering)
+
+        return [
+            field.lstrip("-") if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def get_keyset_lookup(self, position, reverse=False):
+        """
+        Returns the lookup of the rows placed after the position.
+
+        For ``(a, b)`` it is ``a > x OR (a = x AND b > y)``.
+        """
+        lookup = Q()
+
+        for index, field in enumerate(self.get_ordering(reverse)):
+            name = field.lstrip("-")
+            operator = "lt" if field.startswith("-") else "gt"
+
+            equals = {
+                previous.lstrip("-"): value
+                for previous, value in zip(self.ordering[:index], position)
+            }
+            lookup |= Q(**equals, **{f"{name}__{operator}": position[index]})
+
+        return lookup
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns the page of the queryset positioned by the request cursor.
+
+        Args:
+            queryset (django.db.Queryset, required): Queryset object.
+            request (Request, required): Request object.
+            view (django.views.generic.base.View, optional): View that is handling the queryset.
+
+        Returns:
+            list
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.get_ordering(reverse))
+        field_names, deferred = queryset.query.deferred_loading
+
+        if field_names and not deferred:
+            # the cursors are built from the ordering fields, keep them loaded.
+            ordering = [field.lstrip("-") for field in self.ordering]
+            queryset = queryset.only(*field_names, *ordering)
+
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_lookup(position, reverse))
+
+        # fetch an extra row to find out whether there are more pages.
+        results = list(queryset[: page_size + 1])
+        has_more, results = len(results) > page_size, results[:page_size]
+
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = has_more if reverse else position is not None
+
+        self.page = results
+        return results
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        cursor = self.encode_cursor(self.page[-1])
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+
+        cursor = self.encode_cursor(self.page[0], reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
@@ -1,15 +1,39 @@
-from collections import OrderedDict
-from typing import Optional, Union, Any, Tuple
+from collections import namedtuple
+from typing import Optional, Union, Any, Tuple, Iterator
 
 from django.db import connections, DEFAULT_DB_ALIAS
 
+Params = Optional[Union[dict, list, tuple]]
+
+
+def row_factory(columns):
+    """
+    Returns a namedtuple class for rows with the given columns. Columns
+    that are not valid identifiers are renamed to their position (``_0``).
+
+    Args:
+        columns (list, required): Column names.
+
+    Returns:
+        type
+    """
+    return namedtuple("Row", columns, rename=True)
+
 
 class DatabaseResult:
-    __slots__ = ("columns", "result")
+    __slots__ = ("columns", "result", "_row_class")
 
     def __init__(self, columns, result):
         self.columns = columns
         self.result = result
+        self._row_class = None
+
+    @property
+    def row_class(self):
+        if self._row_class is None:
+            self._row_class = row_factory(self.columns)
+
+        return self._row_class
 
     def as_dict(self):
         """
@@ -18,7 +42,18 @@ class DatabaseResult:
         Returns:
             list
         """
-        return list(map(lambda row: OrderedDict(zip(self.columns, row)), self.result))
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.result]
+
+    def as_namedtuple(self):
+        """
+        Map the result into namedtuples, whose fields are the columns.
+
+        Returns:
+            list
+        """
+        make = self.row_class._make
+        return [make(row) for row in self.result]
 
     def __iter__(self):
         return iter(self.result)
@@ -31,6 +66,14 @@ class DatabaseResult:
 
 
 class Database:
+    """
+    Runs raw SQL on a database. Params are bound by the database
+    driver, so queries use its placeholders, e.g. ``%(name)s`` or ``%s``.
+    """
+
+    # rows fetched from the server at a time by ``iterate``.
+    chunk_size = 2000
+
     def __init__(self, using=None):
         self.using: str = using or DEFAULT_DB_ALIAS
 
@@ -60,45 +103,96 @@ class Database:
         cls = type(self)
         return cls(using)
 
-    def select(self, query: str, params: Optional[dict] = None) -> "DatabaseResult":
+    def select(self, query: str, params: Params = None) -> "DatabaseResult":
         """
         Execute SQL select query on database.
 
         Args:
             query (str, required): Query to be executed.
-            params (dict, optional): Parameters to embed into the query.
+            params (dict|list, optional): Parameters bound to the query placeholders.
 
         Returns:
             DatabaseResult
         """
         with self.connection.cursor() as cursor:
-            cursor.execute(query.format(**(params or {})))
+            cursor.execute(query, params)
             result = cursor.fetchall()
-            columns = list(map(lambda x: x[0], cursor.description))
+            columns = [column[0] for column in cursor.description]
 
             return DatabaseResult(columns=columns, result=result)
 
-    def select_one(
-        self, query: str, params: Optional[dict] = None
-    ) -> Union[Any, Tuple]:
+    def select_one(self, query: str, params: Params = None) -> Union[Any, Tuple]:
         """
         Execute SQL query on database that returns a single value.
 
         Args:
             query (str, required): Query to be executed.
-            params (dict, optional): Parameters to embed into the query.
+            params (dict|list, optional): Parameters bound to the query placeholders.
 
         Returns:
             Any
         """
         with self.connection.cursor() as cursor:
-            cursor.execute(query.format(**(params or {})))
+            cursor.execute(query, params)
             data = cursor.fetchone()
+
+            if data is None:
+                return None
+
             return data[0] if len(data) == 1 else data
 
-    def execute(self, query: str, params: Optional[dict] = None) -> None:
+    def iterate(
+        self,
+        query: str,
+        params: Params = None,
+        chunk_size: Optional[int] = None,
+        named: bool = False,
+    ) -> Iterator[Tuple]:
+        """
+        Execute SQL select query on database and yield its rows, fetching
+        them in chunks through a server-side cursor when the database
+        supports it, so the result is never loaded at once.
+
+        Args:
+            query (str, required): Query to be executed.
+            params (dict|list, optional): Parameters bound to the query placeholders.
+            chunk_size (int, optional): Rows fetched at a time.
+            named (bool, optional): Yield namedtuples instead of plain tuples.
+
+        Returns:
+            Iterator<tuple>
+        """
+        chunk_size = chunk_size or self.chunk_size
+
+        if self.connection.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+            # e.g. behind a transaction pooler like pgbouncer.
+            cursor = self.connection.cursor()
+
+        else:
+            cursor = self.connection.chunked_cursor()
+
+        with cursor:
+            cursor.execute(query, params)
+
+            # named cursors only describe the columns after the first fetch.
+            rows = cursor.fetchmany(chunk_size)
+
+            if not named:
+                while rows:
+                    yield from rows
+                    rows = cursor.fetchmany(chunk_size)
+
+                return
+
+            make = row_factory([column[0] for column in cursor.description])._make
+
+            while rows:
+                yield from map(make, rows)
+                rows = cursor.fetchmany(chunk_size)
+
+    def execute(self, query: str, params: Params = None) -> None:
         """
         Executes any query on a database and it does not return anything.
         """
         with self.connection.cursor() as cursor:
-            cursor.execute(query.format(**(params or {})))
+            cursor.execute(query, params)
@@ -1,8 +1,11 @@
 import functools
 import operator
+import re
 from typing import Sequence
 
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, Q
 from commons.utils import parser
 from commons.utils.collections import DataDict
 
@@ -103,12 +106,76 @@ class ChoiceFilter(Filter):
         return self.choices.get(value, unset)
 
 
+class ContainsSearch:
+    """
+    Search backend that ORs the search lookups, e.g. ``name__icontains``.
+    """
+
+    def search(self, queryset, lookups, value):
+        return queryset.filter(
+            functools.reduce(operator.or_, map(lambda x: Q(**{x: value}), lookups))
+        )
+
+
+class FullTextSearch(ContainsSearch):
+    """
+    Search backend that matches the words of the search, as prefixes,
+    against a ``tsvector`` column kept up to date by the database, so
+    it is served by its GIN index. Falls back to the lookups on
+    databases other than Postgres.
+
+    Args:
+        vector_field (str, required): ``SearchVectorField`` lookup, may span relations.
+        config (str, optional): Text search config the column is built with.
+        rank (bool, optional): Order the results by relevance, annotated as ``search_rank``.
+    """
+
+    rank_annotation = "search_rank"
+
+    def __init__(self, vector_field, config="simple", rank=False):
+        self.vector_field = vector_field
+        self.config = config
+        self.rank = rank
+
+    def get_query(self, value):
+        """
+        Returns the prefix query of the search words, if any.
+        """
+        words = re.findall(r"\w+", value)
+
+        if not words:
+            return None
+
+        return SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config=self.config,
+        )
+
+    def search(self, queryset, lookups, value):
+        query = self.get_query(value)
+
+        if query is None or connections[queryset.db].vendor != "postgresql":
+            return super().search(queryset, lookups, value)
+
+        queryset = queryset.filter(**{self.vector_field: query})
+
+        if self.rank:
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+            queryset = queryset.annotate(
+                **{self.rank_annotation: SearchRank(F(self.vector_field), query)}
+            ).order_by(f"-{self.rank_annotation}", *ordering)
+
+        return queryset
+
+
 class Search(BaseFilter):
-    def __init__(self, lookups, url_kwarg="query", distinct=False):
+    def __init__(self, lookups, url_kwarg="query", distinct=False, backend=None):
         super().__init__(url_kwarg)
 
         self.lookups = lookups
         self.distinct = distinct
+        self.backend = backend or ContainsSearch()
 
     def filter(self, request, queryset):
         value = self.value(request)
@@ -116,9 +183,7 @@ class Search(BaseFilter):
         if not value:
             return queryset
 
-        queryset = queryset.filter(
-            functools.reduce(operator.or_, map(lambda x: Q(**{x: value}), self.lookups))
-        )
+        queryset = self.backend.search(queryset, self.lookups, value)
 
         if self.distinct:
             queryset = queryset.distinct()
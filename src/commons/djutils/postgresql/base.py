@@ -0,0 +1,29 @@
+import time
+
+from django.db.backends.postgresql import base
+
+from commons.metrics import registry
+
+CONNECTION_WAIT = registry.histogram(
+    "db_connection_wait_seconds",
+    "Time to get a new database connection, including the wait for a slot "
+    "of a connection pooler such as pgbouncer.",
+    ["alias"],
+)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend measuring the time to get new connections. Django
+    has no pool of its own, a connection is opened per request unless
+    ``CONN_MAX_AGE`` keeps it.
+    """
+
+    def get_new_connection(self, conn_params):
+        start = time.perf_counter()
+
+        try:
+            return super().get_new_connection(conn_params)
+
+        finally:
+            CONNECTION_WAIT.observe(time.perf_counter() - start, alias=self.alias)
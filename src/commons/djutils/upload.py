@@ -1,27 +1,28 @@
 import os
 
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.core.files.storage import default_storage
 
 
 def _get_file(path_or_stream, filename=None):
     """
-    Get a file instance from filesystem or stream.
+    Get a file instance from filesystem or stream. The content is not
+    read, so storages copy it in chunks.
 
     Args:
         path_or_stream (Union[str, File], required): File.
         filename (str, optional): Filename.
 
     Returns:
-        django.core.files.base.ContentFile
+        django.core.files.base.File
     """
     if isinstance(path_or_stream, str):
-        with open(path_or_stream, "rb") as f:
-            return ContentFile(
-                f.read(), name=filename or os.path.split(path_or_stream)[1]
-            )
+        return File(
+            open(path_or_stream, "rb"),
+            name=filename or os.path.split(path_or_stream)[1],
+        )
 
-    return ContentFile(path_or_stream.read(), name=filename or path_or_stream.name)
+    return File(path_or_stream, name=filename or path_or_stream.name)
 
 
 def upload_file(path_or_stream, upload_path, filename=None, storage=None):
@@ -45,4 +46,10 @@ def upload_file(path_or_stream, upload_path, filename=None, storage=None):
         if callable(upload_path)
         else os.path.join(upload_path, file.name)
     )
-    return storage.save(name=name, content=file)
+
+    try:
+        return storage.save(name=name, content=file)
+
+    finally:
+        if isinstance(path_or_stream, str):
+            file.close()
@@ -1,10 +1,15 @@
 import datetime
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 
 import jwt
 from django.conf import settings
 
 JWT_KEY = getattr(settings, "JWT_KEY")
 JWT_EXP = getattr(settings, "JWT_EXP")
+JWT_CACHE_SIZE = getattr(settings, "JWT_CACHE_SIZE", 1024)
 
 
 class Jwt:
@@ -38,3 +43,102 @@ class Jwt:
 
         else:
             return claims
+
+
+class ClaimsCache:
+    """
+    Bounded LRU cache of verified token claims, so repeated tokens skip
+    the signature verification. Tokens are keyed by their digest and
+    are evicted once their ``exp`` claim is reached.
+    """
+
+    def __init__(self, maxsize=JWT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._claims = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token):
+        """
+        Returns the cached claims of the token, or ``None``.
+
+        Args:
+            token (str, required): Verified token.
+
+        Returns:
+            dict
+        """
+        key = self._key(token)
+
+        with self._lock:
+            if (entry := self._claims.get(key)) is not None:
+                claims, expires_at = entry
+
+                if expires_at is None or expires_at > time.time():
+                    self._claims.move_to_end(key)
+                    self.hits += 1
+                    return claims
+
+                # expired, it must be verified (and refused) again.
+                del self._claims[key]
+
+            self.misses += 1
+            return None
+
+    def set(self, token, claims):
+        """
+        Caches the verified claims of the token.
+
+        Args:
+            token (str, required): Verified token.
+            claims (dict, required): Token claims.
+        """
+        if self.maxsize <= 0:
+            return
+
+        key = self._key(token)
+
+        with self._lock:
+            self._claims[key] = (claims, claims.get("exp"))
+            self._claims.move_to_end(key)
+
+            while len(self._claims) > self.maxsize:
+                self._claims.popitem(last=False)
+
+    def evict(self, token):
+        """
+        Forgets a revoked token.
+
+        Returns:
+            bool: whether the token was cached.
+        """
+        with self._lock:
+            return self._claims.pop(self._key(token), None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._claims.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        """
+        Returns the cache counters, for instrumentation.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._claims),
+                "maxsize": self.maxsize,
+            }
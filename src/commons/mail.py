@@ -7,7 +7,9 @@ from django.utils.html import strip_tags
 from commons.timezone import timezone
 
 
-def send_mail(subject, template, to, from_email=None, context=None, tz=None):
+def send_mail(
+    subject, template, to, from_email=None, context=None, tz=None, connection=None
+):
     """
     Send template email shortcut.
 
@@ -18,6 +20,7 @@ def send_mail(subject, template, to, from_email=None, context=None, tz=None):
         from_email (str, required): From email.
         context (dict, optional): Extra data for the Message.
         tz (str, optional): Timezone to render template.
+        connection (BaseEmailBackend, optional): Connection to reuse between emails.
     """
     context = context or {}
 
@@ -45,6 +48,7 @@ def send_mail(subject, template, to, from_email=None, context=None, tz=None):
         ),
         from_email=from_email or getattr(settings, "DEFAULT_FROM_EMAIL"),
         recipient_list=[to] if not isinstance(to, (list, tuple)) else to,
+        connection=connection,
     )
 
 
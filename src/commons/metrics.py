@@ -0,0 +1,473 @@
+import atexit
+import bisect
+import contextlib
+import fcntl
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+
+# histogram buckets (seconds) fitting request and query latencies.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# interval (seconds) between merges of the files of exited processes.
+COMPACT_INTERVAL = 60
+
+# file of the values of the exited processes, see ``MetricsRegistry.compact``.
+AGGREGATE_FILENAME = "aggregate.json"
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+
+    return "{%s}" % ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value))
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+
+    except ProcessLookupError:
+        return False
+
+    except PermissionError:
+        # running as another user.
+        return True
+
+    return True
+
+
+class Metric:
+    """
+    Base metric, its values are kept by label values.
+
+    Args:
+        registry (MetricsRegistry, required): Registry the metric is collected by.
+        name (str, required): Metric name, e.g. ``http_requests_total``.
+        documentation (str, required): Help text.
+        labelnames (list, optional): Names of the labels.
+    """
+
+    type = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def _key(self, labels):
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+
+        except KeyError as exc:
+            raise ValueError(f"Missing label {exc} of '{self.name}'.") from exc
+
+    def describe(self):
+        return {"type": self.type, "help": self.documentation}
+
+    @staticmethod
+    def merge(value, other):
+        """
+        Returns the sum of two values of a label set.
+        """
+        raise NotImplementedError()
+
+    def samples(self, labels, value, description):
+        """
+        Yields the exposition lines of the value of a label set.
+        """
+        raise NotImplementedError()
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, e.g. the number of requests.
+    """
+
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+
+        with self.registry.lock:
+            self.registry.check_process()
+            self.values[key] = self.values.get(key, 0) + amount
+            self.registry.dirty = True
+
+    @staticmethod
+    def merge(value, other):
+        return value + other
+
+    def samples(self, labels, value, description):
+        yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    """
+    Counts observations, e.g. latencies, in cumulative buckets.
+
+    Args:
+        buckets (list, optional): Upper bounds of the buckets, ``+Inf`` is implicit.
+    """
+
+    type = "histogram"
+
+    def __init__(self, *args, buckets=DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self.registry.lock:
+            self.registry.check_process()
+            # a count per bucket, the observations count and sum.
+            counts = self.values.get(key)
+
+            if counts is None:
+                counts = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+
+            if index < len(self.buckets):
+                counts[index] += 1
+
+            counts[-2] += 1
+            counts[-1] += value
+            self.registry.dirty = True
+
+    def describe(self):
+        return {**super().describe(), "buckets": self.buckets}
+
+    @staticmethod
+    def merge(value, other):
+        return [a + b for a, b in zip(value, other)]
+
+    def samples(self, labels, value, description):
+        cumulative = 0
+
+        for bound, count in zip(description["buckets"], value):
+            cumulative += count
+            bucket_labels = [*labels, ("le", _format_value(bound))]
+            yield f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+
+        bucket_labels = [*labels, ("le", "+Inf")]
+        yield f"{self.name}_bucket{_format_labels(bucket_labels)} {value[-2]}"
+        yield f"{self.name}_count{_format_labels(labels)} {value[-2]}"
+        yield f"{self.name}_sum{_format_labels(labels)} {_format_value(value[-1])}"
+
+
+METRIC_TYPES = {Counter.type: Counter, Histogram.type: Histogram}
+
+
+class MetricsRegistry:
+    """
+    Keeps the metrics of a process and aggregates the metrics of all the
+    processes sharing ``settings.METRICS_DIRECTORY``, e.g. gunicorn and
+    celery workers. Each process writes its values to its own file every
+    ``settings.METRICS_FLUSH_INTERVAL`` seconds and the exposition sums
+    the files, so no external service is needed. The files of the processes
+    that exited, e.g. recycled workers, are merged into a single file every
+    ``COMPACT_INTERVAL`` seconds. The processes are told apart by their pid,
+    so the directory must not be shared between hosts.
+
+    Without a directory, only the values of the current process are exposed.
+    """
+
+    def __init__(self, directory=None, flush_interval=None):
+        self._directory = directory
+        self._flush_interval = flush_interval
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self.dirty = False
+        self._pid = None
+        self._path = None
+
+    @property
+    def directory(self):
+        if self._directory is not None:
+            return self._directory
+
+        return getattr(settings, "METRICS_DIRECTORY", None)
+
+    @property
+    def flush_interval(self):
+        return self._flush_interval or getattr(settings, "METRICS_FLUSH_INTERVAL", 1)
+
+    def register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(self, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(
+            Histogram(self, name, documentation, labelnames, buckets=buckets)
+        )
+
+    def check_process(self):
+        """
+        Starts the values of a new process, e.g. a forked worker does not
+        count the values of its parent again. Called with the lock held.
+        """
+        pid = os.getpid()
+
+        if pid == self._pid:
+            return
+
+        for metric in self.metrics.values():
+            metric.values.clear()
+
+        self._pid = pid
+        self._path = None
+
+        if self.directory:
+            self._path = Path(self.directory) / f"{pid}-{uuid.uuid4().hex}.json"
+            flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            flusher.start()
+            atexit.register(self.flush)
+
+    def _flush_periodically(self):
+        pid = os.getpid()
+        compacted_at = time.monotonic()
+
+        while self._pid == pid:
+            time.sleep(self.flush_interval)
+
+            if self.dirty:
+                self.flush()
+
+            if time.monotonic() - compacted_at >= COMPACT_INTERVAL:
+                compacted_at = time.monotonic()
+                self.compact()
+
+    def snapshot(self):
+        """
+        Returns the values of the current process by metric.
+        """
+        with self.lock:
+            return {
+                name: {
+                    **metric.describe(),
+                    "samples": [
+                        [list(key), value] for key, value in metric.values.items()
+                    ],
+                    "labelnames": list(metric.labelnames),
+                }
+                for name, metric in self.metrics.items()
+                if metric.values and os.getpid() == self._pid
+            }
+
+    def flush(self):
+        """
+        Writes the values of the current process to its file.
+        """
+        path = self._path
+
+        if path is None or not self.dirty or os.getpid() != self._pid:
+            return
+
+        self.dirty = False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write(path, self.snapshot())
+
+    @contextlib.contextmanager
+    def _locked(self, exclusive=False):
+        """
+        Locks the directory against the other processes, exclusively while
+        the files of exited processes are merged, so they are not counted
+        twice or lost.
+        """
+        path = Path(self.directory)
+        path.mkdir(parents=True, exist_ok=True)
+
+        with open(path / ".lock", "a") as file:
+            fcntl.flock(file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+            try:
+                yield path
+
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+    def _process_files(self):
+        """
+        Yields the path and pid of the files of the other processes.
+        """
+        for path in Path(self.directory).glob("*-*.json"):
+            pid, _, _ = path.stem.partition("-")
+
+            if path != self._path and pid.isdigit():
+                yield path, int(pid)
+
+    def _read(self, path):
+        try:
+            return json.loads(path.read_text())
+
+        except (OSError, ValueError):
+            # removed or written by an incompatible version.
+            return {}
+
+    def _write(self, path, snapshot):
+        # readers see the previous or the new file, never a partial one.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            file.write(json.dumps(snapshot))
+
+        os.replace(file.name, path)
+
+    def _read_files(self):
+        if not self.directory:
+            return []
+
+        with self._locked() as directory:
+            paths = [path for path, _ in self._process_files()]
+            return [
+                self._read(path) for path in [directory / AGGREGATE_FILENAME, *paths]
+            ]
+
+    def compact(self):
+        """
+        Merges the files of the processes that exited into the aggregate
+        file and removes them, so the directory does not grow with each
+        recycled worker while their values are still counted.
+        """
+        if not self.directory:
+            return
+
+        with self._locked(exclusive=True) as directory:
+            exited = [
+                path for path, pid in self._process_files() if not _is_running(pid)
+            ]
+
+            if not exited:
+                return
+
+            aggregate = directory / AGGREGATE_FILENAME
+            self._write(
+                aggregate,
+                self.merge_snapshots(
+                    [self._read(path) for path in [aggregate, *exited]]
+                ),
+            )
+
+            for path in exited:
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """
+        Removes the aggregate file and the files of the processes that
+        exited, so the values start from zero, e.g. when the gunicorn master
+        starts. The files of the running processes are left.
+        """
+        if not self.directory:
+            return
+
+        with self._locked(exclusive=True) as directory:
+            (directory / AGGREGATE_FILENAME).unlink(missing_ok=True)
+
+            for path, pid in self._process_files():
+                if not _is_running(pid):
+                    path.unlink(missing_ok=True)
+
+    @staticmethod
+    def merge_snapshots(snapshots):
+        """
+        Returns the snapshot of the sum of the given snapshots, with the
+        values of the same labels summed up.
+        """
+        merged = {}
+
+        for snapshot in snapshots:
+            for name, description in snapshot.items():
+                merge = METRIC_TYPES[description["type"]].merge
+                current = merged.setdefault(name, {**description, "samples": {}})
+                samples = current["samples"]
+
+                for key, value in description["samples"]:
+                    key = tuple(key)
+                    samples[key] = (
+                        merge(samples[key], value) if key in samples else value
+                    )
+
+        return {
+            name: {
+                **description,
+                "samples": [
+                    [list(key), value] for key, value in description["samples"].items()
+                ],
+            }
+            for name, description in merged.items()
+        }
+
+    def collect(self):
+        """
+        Returns the metrics of all the processes, with the values of
+        the same labels summed up.
+
+        Returns:
+            dict<str: (Metric, dict, dict)>: Metric, description and values by labels.
+        """
+        collected = {}
+        snapshots = [self.snapshot(), *self._read_files()]
+
+        for name, description in self.merge_snapshots(snapshots).items():
+            metric = self.metrics.get(name)
+
+            if metric is None or metric.type != description["type"]:
+                # registered by other processes only, e.g. celery workers.
+                metric = METRIC_TYPES[description["type"]](
+                    self, name, description["help"], description["labelnames"]
+                )
+
+            collected[name] = (
+                metric,
+                description,
+                {
+                    tuple(zip(description["labelnames"], key)): value
+                    for key, value in description["samples"]
+                },
+            )
+
+        return collected
+
+    def expose(self):
+        """
+        Returns the metrics in the prometheus text exposition format.
+        """
+        lines = []
+
+        for name, (metric, description, values) in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {_escape(description['help'])}")
+            lines.append(f"# TYPE {name} {description['type']}")
+
+            for labels, value in sorted(values.items()):
+                lines.extend(metric.samples(labels, value, description))
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -1,9 +1,297 @@
+import contextlib
+import contextvars
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+
 from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import connections
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
 from django.utils import timezone
 from django.utils.deprecation import MiddlewareMixin
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from commons.metrics import registry
+
+logger = logging.getLogger("commons.server_timing")
+
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests by route.",
+    ["route", "method", "status"],
+)
+
+# methods counted by name, the others are counted as ``OTHER``.
+REQUEST_METHODS = {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}
 
 
 class TimezoneMiddleware(MiddlewareMixin):
     def process_request(self, request):  # noqa
         tz = request.META.get("HTTP_ACCEPT_TIMEZONE") or settings.TIME_ZONE
         timezone.activate(tz)
+
+
+def is_lean_route(request):
+    """
+    Returns whether the request is served by the lean middleware chain.
+    """
+    return request.path_info.startswith(tuple(settings.LEAN_MIDDLEWARE_ROUTES))
+
+
+def skip_on_lean_routes(middleware_class):
+    """
+    Returns a subclass of the middleware that passes the requests to
+    ``settings.LEAN_MIDDLEWARE_ROUTES`` straight to the next middleware,
+    including its view, exception and template response hooks.
+    """
+
+    def __call__(self, request):
+        if is_lean_route(request):
+            return self.get_response(request)
+
+        return middleware_class.__call__(self, request)
+
+    def process_view(self, request, *args, **kwargs):
+        if is_lean_route(request):
+            return None
+
+        return middleware_class.process_view(self, request, *args, **kwargs)
+
+    def process_exception(self, request, exception):
+        if is_lean_route(request):
+            return None
+
+        return middleware_class.process_exception(self, request, exception)
+
+    def process_template_response(self, request, response):
+        if is_lean_route(request):
+            return response
+
+        return middleware_class.process_template_response(self, request, response)
+
+    attrs = {"__call__": __call__, "__module__": __name__}
+    hooks = [process_view, process_exception, process_template_response]
+
+    # the handler registers only the hooks the middleware has.
+    attrs.update(
+        {
+            hook.__name__: hook
+            for hook in hooks
+            if hasattr(middleware_class, hook.__name__)
+        }
+    )
+
+    return type(f"Lean{middleware_class.__name__}", (middleware_class,), attrs)
+
+
+# Middlewares of the stateful (session based) views, the stateless
+# api does not need them.
+LeanSessionMiddleware = skip_on_lean_routes(SessionMiddleware)
+LeanCsrfViewMiddleware = skip_on_lean_routes(CsrfViewMiddleware)
+LeanAuthenticationMiddleware = skip_on_lean_routes(AuthenticationMiddleware)
+LeanMessageMiddleware = skip_on_lean_routes(MessageMiddleware)
+LeanXFrameOptionsMiddleware = skip_on_lean_routes(XFrameOptionsMiddleware)
+LeanWhiteNoiseMiddleware = skip_on_lean_routes(WhiteNoiseMiddleware)
+
+
+class ServerTimings:
+    """
+    Durations (in seconds) and counters recorded during a request.
+    """
+
+    __slots__ = ("durations", "counters")
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+        self.counters = defaultdict(int)
+
+    def add(self, name, duration):
+        self.durations[name] += duration
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+
+    def execute(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper, see ``connection.execute_wrapper``.
+        """
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+
+        finally:
+            self.durations["db"] += time.perf_counter() - start
+            self.counters["db"] += 1
+
+    def header(self):
+        """
+        Returns the ``Server-Timing`` header value, in milliseconds.
+        """
+        metrics = []
+
+        for name, duration in self.durations.items():
+            metric = f"{name};dur={duration * 1000:.2f}"
+
+            if name in self.counters:
+                metric += f';desc="{self.counters[name]}"'
+
+            metrics.append(metric)
+
+        metrics.extend(
+            f'{name};desc="{value}"'
+            for name, value in self.counters.items()
+            if name not in self.durations
+        )
+        return ", ".join(metrics)
+
+    def as_dict(self):
+        return {
+            **{
+                f"{name}_ms": round(value * 1000, 2)
+                for name, value in self.durations.items()
+            },
+            **self.counters,
+        }
+
+
+_server_timings = contextvars.ContextVar("server_timings", default=None)
+
+
+@contextlib.contextmanager
+def server_timing(name):
+    """
+    Adds the duration of the block to the ``name`` metric of the
+    sampled request, if any.
+    """
+    timings = _server_timings.get()
+
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def count_server_timing(name, value=1):
+    """
+    Increments the ``name`` counter of the sampled request, if any.
+    """
+    timings = _server_timings.get()
+
+    if timings is not None:
+        timings.count(name, value)
+
+
+def get_query_budget(request):
+    """
+    Returns the max number of queries of the request view, its
+    ``query_budget`` or ``settings.QUERY_BUDGET``.
+    """
+    match = getattr(request, "resolver_match", None)
+    view = getattr(match, "func", None)
+    view_class = getattr(view, "cls", None) or getattr(view, "view_class", None)
+    budget = getattr(view_class, "query_budget", None)
+
+    return settings.QUERY_BUDGET if budget is None else budget
+
+
+class ServerTimingMiddleware:
+    """
+    Records the database queries, serializer, render and response cache
+    timings of a sample of the requests (``settings.SERVER_TIMING_SAMPLE_RATE``),
+    sends them in the ``Server-Timing`` header and logs them as a json line.
+
+    A warning is logged when a request runs more queries than its view
+    ``query_budget``, see ``get_query_budget``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        sample_rate = settings.SERVER_TIMING_SAMPLE_RATE
+
+        if sample_rate <= 0 or (sample_rate < 1 and random.random() >= sample_rate):
+            return self.get_response(request)
+
+        timings = ServerTimings()
+        token = _server_timings.set(timings)
+        databases = connections.all()
+        start = time.perf_counter()
+
+        # as ``connection.execute_wrapper``, without a context manager each.
+        for connection in databases:
+            connection.execute_wrappers.append(timings.execute)
+
+        try:
+            response = self.get_response(request)
+
+        finally:
+            for connection in databases:
+                connection.execute_wrappers.pop()
+
+            _server_timings.reset(token)
+
+        timings.add("total", time.perf_counter() - start)
+        response["Server-Timing"] = timings.header()
+        self.log(request, response, timings)
+
+        return response
+
+    def log(self, request, response, timings):
+        budget = get_query_budget(request)
+        over_budget = bool(budget) and timings.counters.get("db", 0) > budget
+
+        if not over_budget and not logger.isEnabledFor(logging.INFO):
+            return
+
+        match = getattr(request, "resolver_match", None)
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "view": getattr(match, "view_name", None),
+            "status": response.status_code,
+            **timings.as_dict(),
+        }
+
+        logger.info(json.dumps(data), extra={"server_timing": data})
+
+        if over_budget:
+            data["query_budget"] = budget
+            logger.warning(json.dumps(data), extra={"server_timing": data})
+
+
+class MetricsMiddleware:
+    """
+    Measures the latency of the requests by route, the url name.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        match = getattr(request, "resolver_match", None)
+
+        REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            route=getattr(match, "view_name", None) or "unmatched",
+            method=request.method if request.method in REQUEST_METHODS else "OTHER",
+            status=response.status_code,
+        )
+
+        return response
@@ -1,12 +1,54 @@
 import functools
 import operator as op
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
 from commons.djutils.models import filters
 from commons.utils import parser
 from commons.utils.collections import DataDict
 
 
+def inspect_lookup(model, lookup_field):
+    """
+    Resolve a lookup path against the model meta.
+
+    Args:
+        model (django.db.Model, required): Model the lookup is applied to.
+        lookup_field (str, required): Lookup path, e.g. ``brand__name__icontains``.
+
+    Returns:
+        tuple<str, str, bool>: The field path, the lookup name (``exact``
+            when implicit) and whether the path traverses a to-many relation.
+    """
+    opts = model._meta
+    parts = lookup_field.split(LOOKUP_SEP)
+    spans_many = False
+
+    for index, part in enumerate(parts):
+        try:
+            field = opts.pk if part == "pk" else opts.get_field(part)
+
+        except FieldDoesNotExist:
+            break
+
+        if field.one_to_many or field.many_to_many:
+            spans_many = True
+
+        if not field.is_relation:
+            index += 1
+            break
+
+        opts = field.related_model._meta
+
+    else:
+        index = len(parts)
+
+    path = LOOKUP_SEP.join(parts[:index])
+    lookup = LOOKUP_SEP.join(parts[index:]) or "exact"
+    return path, lookup, spans_many
+
+
 def get_multi_value_lookup(
     request,
     url_kwarg,
@@ -15,10 +57,14 @@ def get_multi_value_lookup(
     delimiter=",",
     operator=op.or_,
     cast=parser.undefined,
+    model=None,
 ):
     """
     Generate the lookups for a field with a given request.
 
+    Multiple values of an ``exact`` lookup are OR'ed with a single
+    ``__in`` lookup when the model is given.
+
     Returns None if no field is provided.
     """
     lookup_field = lookup_field or url_kwarg
@@ -44,6 +90,12 @@ def get_multi_value_lookup(
     if not _filters:
         return None
 
+    if model is not None and operator is op.or_ and len(_filters) > 1:
+        path, lookup, _ = inspect_lookup(model, lookup_field)
+
+        if lookup == "exact":
+            return Q(**{f"{path}{LOOKUP_SEP}in": _filters})
+
     return functools.reduce(
         operator, map(lambda x: Q(**{lookup_field: x}), _filters), Q()
     )
@@ -81,6 +133,7 @@ class Filter(filters.BaseFilter):
                 delimiter=self.delimiter,
                 operator=self.operator,
                 cast=self.cast,
+                model=queryset.model,
             )
             or self.default
         )
@@ -90,7 +143,15 @@ class Filter(filters.BaseFilter):
 
         queryset = queryset.filter(lookup)
 
-        if self.distinct or self.many:
+        if self.distinct or (self.many and self.spans_many(queryset.model)):
+            # values matched by different related rows repeat the row.
             queryset = queryset.distinct()
 
         return queryset
+
+    def spans_many(self, model):
+        """
+        Whether the lookup traverses a to-many relation, so a row
+        may be matched more than once.
+        """
+        return inspect_lookup(model, self.lookup)[2]
@@ -4,6 +4,7 @@ from unittest.util import safe_repr
 
 import jsonschema
 from django.conf import settings
+from django.core.cache import caches
 from django.test.testcases import TestCase as BaseTestCase
 from mixer.backend.django import mixer
 from rest_framework.test import APITestCase as BaseAPITestCase
@@ -21,6 +22,15 @@ class TestCase(BaseTestCase):
     # https://github.com/klen/mixer
     mixer = mixer
 
+    def setUp(self):
+        """
+        Start each test with empty caches.
+        """
+        super().setUp()
+
+        for cache in caches.all():
+            cache.clear()
+
     @classmethod
     def tearDownClass(cls):
         """
@@ -40,6 +50,15 @@ class APITestCase(BaseAPITestCase):
     # https://github.com/klen/mixer
     mixer = mixer
 
+    def setUp(self):
+        """
+        Start each test with empty caches.
+        """
+        super().setUp()
+
+        for cache in caches.all():
+            cache.clear()
+
     @classmethod
     def tearDownClass(cls):
         """
@@ -86,6 +105,25 @@ class APITestCase(BaseAPITestCase):
             data,
         )
 
+    # pylint: disable=invalid-name
+    def assertCursorPaginatedSchema(self, schema, data):
+        """
+        Check that data is valid for schema.
+        """
+        self.assertSchema(
+            {
+                "type": "object",
+                "properties": {
+                    "next": {"type": ["string", "null"], "format": "uri"},
+                    "previous": {"type": ["string", "null"], "format": "uri"},
+                    "results": {"type": "array", "items": dict(schema)},
+                },
+                "required": ["next", "previous", "results"],
+                "additionalProperties": False,
+            },
+            data,
+        )
+
     # pylint: disable=invalid-name
     def assertListSchema(self, schema, data):
         """
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import tempfile
 from pathlib import Path
 
 import decouple
@@ -66,22 +67,30 @@ INSTALLED_APPS = [
     "apps.worker",
 ]
 
+# The ``Lean*`` middlewares are skipped on ``LEAN_MIDDLEWARE_ROUTES``.
 MIDDLEWARE = [
+    "commons.middleware.MetricsMiddleware",
+    # Timings of the whole chain, see ``SERVER_TIMING_SAMPLE_RATE``.
+    "commons.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "commons.middleware.LeanSessionMiddleware",
     # CORS Support.
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "commons.middleware.LeanCsrfViewMiddleware",
+    "commons.middleware.LeanAuthenticationMiddleware",
+    "commons.middleware.LeanMessageMiddleware",
+    "commons.middleware.LeanXFrameOptionsMiddleware",
     # Custom Project Middleware
     "commons.middleware.TimezoneMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "commons.middleware.LeanWhiteNoiseMiddleware",
 ]
 
+# Stateless routes (JWT authenticated) served without the session,
+# csrf, messages, clickjacking and static files middlewares.
+LEAN_MIDDLEWARE_ROUTES = ["/api/"]
+
 STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
 
 ROOT_URLCONF = "urls.production"
@@ -118,6 +127,27 @@ DATABASES = {
     )
 }
 
+# Measures the time to get new connections, see ``commons.djutils.postgresql``.
+if DATABASES["default"]["ENGINE"] in [
+    "django.db.backends.postgresql",
+    "django.db.backends.postgresql_psycopg2",
+]:
+    DATABASES["default"]["ENGINE"] = "commons.djutils.postgresql"
+
+# Cache
+# https://docs.djangoproject.com/en/4.0/ref/settings/#caches
+# Shared by all the processes, so a bumped response cache version
+# invalidates the cached responses of every worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.redis.RedisCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="redis://:@localhost:6379/3"),
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -180,9 +210,9 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
     "DEFAULT_AUTHENTICATION_CLASSES": ("commons.api.auth.ClientAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("commons.api.permissions.IsAuthenticated",),
-    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    "DEFAULT_RENDERER_CLASSES": ("commons.api.renderers.JSONRenderer",),
     "DEFAULT_PARSER_CLASSES": (
-        "rest_framework.parsers.JSONParser",
+        "commons.api.parsers.JSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ),
@@ -203,6 +233,9 @@ JWT_KEY = config(
 )
 JWT_EXP = config("JWT_EXP", default=3600, cast=int)
 
+# Max verified tokens cached per process, ``0`` disables the cache.
+JWT_CACHE_SIZE = config("JWT_CACHE_SIZE", default=1024, cast=int)
+
 # Public API Access
 # Define the settings to use ``commons.api.permission.IsPublic`` permission.
 
@@ -280,6 +313,15 @@ DYNAMIC_CONFIG_BACKEND = (
 )
 DYNAMIC_CONFIG_MODEL = "domain.DynamicConfigParameter"
 
+# Seconds a value is cached, each parameter may override it with a ``ttl``.
+DYNAMIC_CONFIG_CACHE_TTL = config("DYNAMIC_CONFIG_CACHE_TTL", default=60, cast=int)
+
+# Seconds between checks of the stored config version, the changes made
+# by other processes are seen within this interval.
+DYNAMIC_CONFIG_CHECK_INTERVAL = config(
+    "DYNAMIC_CONFIG_CHECK_INTERVAL", default=2, cast=float
+)
+
 DYNAMIC_CONFIG = [
     {
         "name": _("Example settings"),
@@ -297,6 +339,115 @@ DYNAMIC_CONFIG = [
     }
 ]
 
+# Response Cache
+# Versioned cache of API responses, see ``commons.api.cache``.
+
+RESPONSE_CACHE_ALIAS = "default"
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", default=300, cast=int)
+
+# Claim Pool
+# Pre-allocated pool serving claims of hot discounts.
+
+CLAIM_POOL_BACKEND = "apps.crosscutting.claim_pool.backends.redis.RedisClaimPoolBackend"
+CLAIM_POOL_REDIS_URL = config(
+    "CLAIM_POOL_REDIS_URL", default="redis://:@localhost:6379/1"
+)
+CLAIM_POOL_PERSIST_BATCH_SIZE = config(
+    "CLAIM_POOL_PERSIST_BATCH_SIZE", default=500, cast=int
+)
+
+# Notification Queue
+# Claim notifications are queued and sent as one digest per brand and window,
+# built from at most NOTIFICATION_DIGEST_MAX_EVENTS, popped in batches.
+
+NOTIFICATION_QUEUE_BACKEND = (
+    "apps.crosscutting.notification_queue.backends.redis.RedisNotificationQueueBackend"
+)
+NOTIFICATION_QUEUE_REDIS_URL = config(
+    "NOTIFICATION_QUEUE_REDIS_URL", default="redis://:@localhost:6379/2"
+)
+NOTIFICATION_DIGEST_WINDOW = config(
+    "NOTIFICATION_DIGEST_WINDOW", default=60, cast=float
+)
+NOTIFICATION_DIGEST_BATCH_SIZE = config(
+    "NOTIFICATION_DIGEST_BATCH_SIZE", default=1000, cast=int
+)
+NOTIFICATION_DIGEST_MAX_EVENTS = config(
+    "NOTIFICATION_DIGEST_MAX_EVENTS", default=100000, cast=int
+)
+NOTIFICATION_DIGEST_MAX_USERS = config(
+    "NOTIFICATION_DIGEST_MAX_USERS", default=10, cast=int
+)
+
+# Outbox
+# Side effects written with the changes and published by the relay.
+
+OUTBOX_RELAY_INTERVAL = config("OUTBOX_RELAY_INTERVAL", default=1.0, cast=float)
+OUTBOX_RELAY_BATCH_SIZE = config("OUTBOX_RELAY_BATCH_SIZE", default=500, cast=int)
+
+# Bulk Changes
+# Max number of discounts a brand creates or updates in a single request.
+
+DISCOUNT_BULK_CREATE_MAX_SIZE = config(
+    "DISCOUNT_BULK_CREATE_MAX_SIZE", default=10000, cast=int
+)
+DISCOUNT_BULK_UPDATE_MAX_SIZE = config(
+    "DISCOUNT_BULK_UPDATE_MAX_SIZE", default=10000, cast=int
+)
+
+# Exports
+# Claim histories are streamed, histories with more claims than the
+# threshold are written to the storage by a worker.
+
+HISTORY_EXPORT_CHUNK_SIZE = config("HISTORY_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+HISTORY_EXPORT_ASYNC_THRESHOLD = config(
+    "HISTORY_EXPORT_ASYNC_THRESHOLD", default=100000, cast=int
+)
+
+# Server Timing
+# Share (0 to 1) of the requests whose database, serializer, render and
+# response cache timings are sent in the ``Server-Timing`` header and
+# logged to ``commons.server_timing``.
+
+SERVER_TIMING_SAMPLE_RATE = config(
+    "SERVER_TIMING_SAMPLE_RATE", default=0.01, cast=float
+)
+
+# Max queries of a sampled request before a warning is logged, views may
+# override it with a ``query_budget`` attribute. ``0`` disables it.
+QUERY_BUDGET = config("QUERY_BUDGET", default=0, cast=int)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "commons.server_timing": {
+            "handlers": ["console"],
+            "level": config("SERVER_TIMING_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
+
+# Metrics
+# Each process writes its metrics to a file of the directory every
+# interval (seconds), ``/api/metrics`` exposes the sum of the files.
+# The processes are told apart by pid, do not share it between hosts.
+# Leave the directory empty to expose the serving process metrics only.
+
+METRICS_DIRECTORY = config(
+    "METRICS_DIRECTORY",
+    default=str(Path(tempfile.gettempdir()) / "discount-service-metrics"),
+)
+METRICS_FLUSH_INTERVAL = config("METRICS_FLUSH_INTERVAL", default=1.0, cast=float)
+
+# Bearer token required to read the metrics. Without one, the metrics
+# are only served with DEBUG on.
+METRICS_ACCESS_KEY = config("METRICS_ACCESS_KEY", default=None)
+
 # CKEditor Settings
 # https://django-ckeditor.readthedocs.io/en/latest/#optional-customizing-ckeditor-editor
 
@@ -394,6 +545,22 @@ CELERY_TASK_SOFT_TIME_LIMIT = 30
 CELERY_BROKER_URL = config("CELERY_BROKER_URL", default="redis://:@localhost:6379/0")
 
 CELERY_BEAT_SCHEDULE = {
+    "persist_claim_pool": {
+        "task": "persist_claim_pool",
+        "schedule": 2.0,
+    },
+    "reconcile_claim_pool": {
+        "task": "reconcile_claim_pool",
+        "schedule": celery.schedules.crontab(minute="*"),
+    },
+    "send_notification_digests": {
+        "task": "send_notification_digests",
+        "schedule": NOTIFICATION_DIGEST_WINDOW,
+    },
+    "relay_outbox": {
+        "task": "relay_outbox",
+        "schedule": OUTBOX_RELAY_INTERVAL,
+    },
     # "example_task": {
     #     "task": "example_task",
     #     "schedule": celery.schedules.crontab(minute="*"),
@@ -25,6 +25,11 @@ MIDDLEWARE += [
 ]
 
 
+# Server Timing
+
+SERVER_TIMING_SAMPLE_RATE = 1.0
+
+
 # Celery Settings
 # http://docs.celeryproject.org/en/5.0/configuration.html
 
@@ -34,6 +39,28 @@ CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_BROKER_URL = "memory"
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/ref/settings/#caches
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+
+# Claim Pool
+
+CLAIM_POOL_BACKEND = (
+    "apps.crosscutting.claim_pool.backends.locmem.LocMemClaimPoolBackend"
+)
+
+
+# Notification Queue
+
+NOTIFICATION_QUEUE_BACKEND = "apps.crosscutting.notification_queue.backends.locmem.LocMemNotificationQueueBackend"
+
+
 # Email Settings
 # https://docs.djangoproject.com/en/3.2/ref/settings/#std:setting-EMAIL_HOST
 